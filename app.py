@@ -7,10 +7,22 @@ import streamlit as st
 from pathlib import Path
 
 # Import theme and styles
-from src.styles.theme import inject_css
+from src.styles.theme import inject_css, publish_theme, require_local_fonts
 
 # Import state management
-from src.utils.state import init_session_state, save_state
+from src.utils.state import init_session_state, migrate_task_ids, reset_session_state
+
+# Import opt-in render profiler
+from src.utils.profiler import start_rerun, finish_rerun, render_profiler_panel
+
+# Import background document watcher
+from src.parsers.watcher import start_watcher
+
+# Import prebuilt parse results (scripts/build_snapshot.py)
+from src.parsers.snapshot import load_snapshot
+
+# Import checklist ids for the saved-progress migration
+from src.parsers.checklist_parser import get_legacy_task_ids, parse_checklist_file
 
 # Import pages
 from src.pages.dashboard import render_dashboard
@@ -30,6 +42,8 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
+start_rerun()
+
 # =============================================================================
 # PATHS
 # =============================================================================
@@ -37,113 +51,23 @@ st.set_page_config(
 DOCS_DIR = Path(__file__).parent / "docs" / "plans"
 DATA_DIR = Path(__file__).parent / "data"
 
+# Seed the parse cache from the prebuilt snapshot (once per process)
+load_snapshot()
+
+# Re-parse plan documents in the background as soon as they are edited
+start_watcher(DOCS_DIR)
+
 # =============================================================================
 # INJECT CSS
 # =============================================================================
 
-inject_css(st)
+# EVDLN_FONTS=local: stop here if static/fonts hasn't been built
+require_local_fonts()
 
-# =============================================================================
-# MOBILE BOTTOM NAVIGATION CSS
-# =============================================================================
+# Write static/theme-<hash>.css (once per process)
+publish_theme()
 
-st.markdown("""
-<style>
-    /* ===== ADDITIONAL CHECKBOX STYLING ===== */
-    .stCheckbox > label {
-        padding: 14px 12px;
-        font-size: 15px;
-        line-height: 1.5;
-        display: flex;
-        align-items: center;
-        border-bottom: 1px solid #F0E6E8;
-        transition: all 0.2s ease;
-        cursor: pointer;
-        border-radius: 8px;
-        margin: 2px 0;
-    }
-
-    .stCheckbox > label:hover {
-        background-color: #FFFBF7;
-        border-color: #F5E6D3;
-    }
-
-    .stCheckbox > label > div[data-testid="stCheckbox"] {
-        margin-right: 12px;
-    }
-
-    /* Checkbox input styling */
-    .stCheckbox input[type="checkbox"] {
-        width: 24px;
-        height: 24px;
-        border-radius: 6px;
-        border: 2px solid #E9D5FF;
-        cursor: pointer;
-    }
-
-    .stCheckbox input[type="checkbox"]:checked {
-        background: linear-gradient(135deg, #FF6B9D 0%, #C084FC 100%);
-        border-color: transparent;
-    }
-
-    /* Mobile touch targets */
-    @media (max-width: 768px) {
-        .stCheckbox > label {
-            padding: 16px 12px;
-            min-height: 52px;
-        }
-    }
-
-    /* ===== MOBILE TAB ADJUSTMENTS ===== */
-    @media (max-width: 768px) {
-        .stTabs [data-baseweb="tab-list"] {
-            display: flex !important;
-            visibility: visible !important;
-            flex-wrap: nowrap !important;
-            overflow-x: auto !important;
-            -webkit-overflow-scrolling: touch;
-            scrollbar-width: none;
-        }
-
-        .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar {
-            display: none;
-        }
-
-        .stTabs [data-baseweb="tab"] {
-            display: flex !important;
-            visibility: visible !important;
-            flex-shrink: 0 !important;
-            padding: 10px 16px !important;
-            font-size: 13px !important;
-            min-height: 44px !important;
-        }
-    }
-
-    /* ===== EXPANDER STYLING ===== */
-    .streamlit-expanderHeader {
-        font-family: 'Playfair Display', serif;
-        font-size: 1rem;
-        font-weight: 500;
-        color: #3D3D3D;
-        background: #FFFBF7;
-        border-radius: 12px;
-    }
-
-    .streamlit-expanderContent {
-        border: 1px solid #F0E6E8;
-        border-top: none;
-        border-radius: 0 0 12px 12px;
-    }
-
-    /* ===== DIVIDER STYLING ===== */
-    hr {
-        border: none;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, #F0E6E8, transparent);
-        margin: 24px 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+inject_css(st)
 
 # =============================================================================
 # HEADER
@@ -180,40 +104,62 @@ st.markdown("""
 # INITIALIZE STATE
 # =============================================================================
 
+checklist = parse_checklist_file(DOCS_DIR / "2026-01-17-checklist-semanas-1-4.md")
+
+# Saved progress from older versions is keyed by position (task_0...);
+# rename it to the content-derived ids once per process
+migrate_task_ids(get_legacy_task_ids(checklist["tasks"]))
+
 state = init_session_state(st)
 
 # =============================================================================
 # MAIN NAVIGATION
 # =============================================================================
 
-tab1, tab2, tab3, tab4, tab5 = st.tabs([
+NAV_TABS = [
     " Dashboard",
     " Plan Semanal",
     " Estrategia",
     " Competidores",
     " Insights",
-])
+]
+
+try:
+    # Track the selected tab so only its page runs on each rerun
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(NAV_TABS, key="active_tab", on_change="rerun")
+except TypeError:
+    # Older Streamlit without tab state: every tab renders
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(NAV_TABS)
+
+
+def is_tab_open(tab) -> bool:
+    """True if the tab is selected, or if tab state is not tracked."""
+    return getattr(tab, "open", None) is not False
+
 
 # =============================================================================
 # TAB CONTENT
 # =============================================================================
 
-with tab1:
-    render_dashboard(DOCS_DIR, state)
+if is_tab_open(tab1):
+    with tab1:
+        render_dashboard(DOCS_DIR, state)
 
-with tab2:
-    updated_state = render_checklist(DOCS_DIR, state)
-    if updated_state != state:
-        st.session_state.checkbox_state = updated_state
+if is_tab_open(tab2):
+    with tab2:
+        render_checklist(DOCS_DIR, state)
 
-with tab3:
-    render_strategy(DOCS_DIR)
+if is_tab_open(tab3):
+    with tab3:
+        render_strategy(DOCS_DIR)
 
-with tab4:
-    render_competitors(DOCS_DIR)
+if is_tab_open(tab4):
+    with tab4:
+        render_competitors(DOCS_DIR)
 
-with tab5:
-    render_insights(DATA_DIR)
+if is_tab_open(tab5):
+    with tab5:
+        render_insights(DATA_DIR)
 
 # =============================================================================
 # FOOTER
@@ -234,7 +180,11 @@ with col1:
 with col2:
     with st.expander(" Opciones"):
         if st.button(" Reiniciar progreso", type="secondary", use_container_width=True):
-            st.session_state.checkbox_state = {}
-            save_state({})
+            reset_session_state(st, checklist["index"]["by_id"])
             st.rerun()
 
+# =============================================================================
+# RENDER PROFILE (EVDLN_PROFILE=1)
+# =============================================================================
+
+render_profiler_panel(finish_rerun())
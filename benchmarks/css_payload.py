@@ -0,0 +1,45 @@
+"""
+Theme CSS bytes sent over the websocket per rerun.
+
+Compares the previous approach (every CSS block inlined unminified on each
+rerun) with the compiled stylesheet, inline or linked as a static asset.
+
+Run from the repo root:
+    python benchmarks/css_payload.py
+"""
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest
+
+from src.styles.theme import THEME_CSS, THEME_CSS_URL, get_all_css
+
+
+def measure_app_css_bytes() -> int:
+    """Run the app headless once and sum the <style>/<link> elements it emits."""
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=60).run()
+    return sum(
+        len(m.value.encode("utf-8"))
+        for m in at.markdown
+        if m.value.lstrip().startswith(("<style", "<link"))
+    )
+
+
+def main() -> None:
+    before = len(get_all_css().encode("utf-8"))
+    inline = len(f"<style>{THEME_CSS}</style>".encode("utf-8"))
+    linked = len(f'<link rel="stylesheet" href="{THEME_CSS_URL}">'.encode("utf-8"))
+
+    print(f"{'mode':<32}{'bytes/rerun':>12}")
+    print(f"{'before (inline, unminified)':<32}{before:>12,}")
+    print(f"{'compiled, inline <style>':<32}{inline:>12,}")
+    print(f"{'compiled, static <link>':<32}{linked:>12,}")
+    print(f"{'measured (AppTest run)':<32}{measure_app_css_bytes():>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Multi-export parse time against process-pool size.
+
+Generates N synthetic posts exports (see fixtures.py) and times
+parse_exports() on them cold, once per worker count. Every run parses a
+fresh copy of the exports with an empty parse cache and its own Parquet
+directory, so each one reads the Excel files. With enough exports the time
+should fall with workers up to the number of cores.
+
+Run from the repo root:
+    python benchmarks/export_workers.py [--exports 24] [--posts 500] [--workers 1 2 4] [--output PATH]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fixtures import generate_posts
+from src.parsers import insights_parser
+from src.parsers.cache import clear_parse_cache
+from src.parsers.insights_parser import parse_exports
+
+DEFAULT_OUTPUT = ROOT / ".cache" / "benchmarks" / "export_workers.json"
+
+
+def write_exports(data_dir: Path, exports: int, posts: int) -> None:
+    """Write exports workbooks of posts rows each (one account per file)."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(exports):
+        generate_posts(posts, seed=i).to_excel(data_dir / f"cuenta {i + 1:03d}.xlsx", index=False)
+
+
+def time_parse(source_dir: Path, work_dir: Path, workers: int) -> float:
+    """
+    Parse a fresh copy of the exports cold with a pool of workers.
+
+    Returns:
+        Wall time in ms.
+    """
+    data_dir = work_dir / f"data-{workers}"
+    shutil.copytree(source_dir, data_dir)
+    # Pool workers fork from this process and inherit the scratch directory
+    insights_parser.INGEST_CACHE_DIR = work_dir / f"parquet-{workers}"
+    clear_parse_cache()
+
+    start = time.perf_counter()
+    parsed = parse_exports(data_dir, max_workers=workers)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if len(parsed) != len(list(source_dir.glob("*.xlsx"))):
+        raise RuntimeError(f"parsed {len(parsed)} exports in {data_dir}")
+    return round(elapsed, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--exports", type=int, default=24, help="export workbooks to parse")
+    parser.add_argument("--posts", type=int, default=500, help="rows per workbook")
+    parser.add_argument("--workers", type=int, nargs="*",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}), help="pool sizes")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON results file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="evdln-exports-") as tmp:
+        work_dir = Path(tmp)
+        source_dir = work_dir / "source"
+        write_exports(source_dir, args.exports, args.posts)
+
+        runs = []
+        for workers in args.workers:
+            runs.append({"workers": workers, "ms": time_parse(source_dir, work_dir, workers)})
+
+    baseline = runs[0]["ms"]
+    for run in runs:
+        run["speedup"] = round(baseline / run["ms"], 2) if run["ms"] else None
+
+    print(f"{args.exports} exports x {args.posts} posts, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'parse ms':>12}{'speedup':>10}")
+    for run in runs:
+        print(f"{run['workers']:>8}{run['ms']:>12.1f}{run['speedup']:>10.2f}")
+
+    result = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "cpus": os.cpu_count(),
+        "exports": args.exports,
+        "posts": args.posts,
+        "runs": runs,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"\nSaved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
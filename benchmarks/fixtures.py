@@ -0,0 +1,363 @@
+"""
+Synthetic fixtures for scale testing the parsers and pages.
+
+Writes structurally valid checklist, plan and competitor markdown plus the
+two posts workbooks, at configurable sizes, under the same file names the
+pages read, so a generated docs/data pair can stand in for the real one.
+
+Run from the repo root:
+    python benchmarks/fixtures.py OUT_DIR [--weeks 52] [--tasks-per-day 6]
+        [--competitors 50] [--plan-sections 40] [--months 36] [--posts 5000]
+"""
+
+import argparse
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.parsers.insights_parser import BEST_POSTS_FILE, WORST_POSTS_FILE
+
+CHECKLIST_FILE = "2026-01-17-checklist-semanas-1-4.md"
+PLAN_FILE = "2026-01-17-el-vals-de-la-novia-plan.md"
+COMPETITORS_FILE = "2026-01-17-analisis-competidores.md"
+
+DAYS = ["Lunes", "Martes", "Miércoles", "Jueves", "Viernes", "Sábado", "Domingo"]
+VERBS = ["Grabar", "Editar", "Publicar", "Planificar", "Responder", "Analizar", "Revisar"]
+TOPICS = ["Reel de novias", "stories", "comentarios", "métricas", "hashtags", "proveedores"]
+HASHTAGS = ["boda", "novia", "weddingday", "vestidodenovia", "bodas2026", "invitadaperfecta"]
+
+# Competitors parse_competitors() looks up by name; extra ones are "COMPETIDOR N"
+KNOWN_COMPETITORS = [
+    ("INVITADA PERFECTA", "invitada_perfecta"),
+    ("BRIDALADA", "bridalada"),
+    ("MISS CAVALLIER", "misscavallier"),
+    ("UNA BODA ORIGINAL", "unabodaoriginal"),
+    ("LA CHAMPANERA", "lachampanera"),
+    ("BODAS.NET", "bodasnet"),
+    ("TELVA NOVIAS", "telvanovias"),
+]
+
+# Columns of an Instagram posts export
+POST_COLUMNS = [
+    "Fecha publicación", "Reproducciones", "Cuentas alcanzadas", "Me gusta",
+    "Comentarios", "Veces guardado", "Republicaciones", "Actividad en el perfil",
+    "Visitas al perfil", "Nuevos seguidores", "Toques en enlace externo",
+    "% No seguidores", "% Seguidores", "Explorar", "Comentario",
+]
+
+
+def task_text(rng: random.Random, n: int) -> str:
+    return f"{rng.choice(VERBS)} {rng.choice(TOPICS)} #{n}"
+
+
+# =============================================================================
+# MARKDOWN
+# =============================================================================
+
+def generate_checklist(weeks: int, tasks_per_day: int, seed: int = 0) -> str:
+    """
+    Build a checklist with day tables, loose tasks, weekly summaries and ideas.
+
+    Args:
+        weeks: Number of "## SEMANA N" sections.
+        tasks_per_day: Table tasks under each day (plus one loose checkbox).
+        seed: Random seed, so a size always produces the same document.
+
+    Returns:
+        Markdown text.
+    """
+    rng = random.Random(seed)
+    lines = [f"# Checklist Semanal: fixture ({weeks} semanas)", "", "---", ""]
+    n = 0
+
+    for week in range(1, weeks + 1):
+        lines += [f"## SEMANA {week}: Semana sintética {week}", ""]
+        for day in DAYS:
+            lines += [
+                f"### {day} - Bloque {week}",
+                "| Tarea | Tiempo | Estado |",
+                "|-------|--------|--------|",
+            ]
+            for _ in range(tasks_per_day):
+                n += 1
+                lines.append(f"| [ ] {task_text(rng, n)} | {rng.choice([10, 15, 20, 30])}min | ⬜ |")
+            n += 1
+            lines += ["", f"- [ ] {task_text(rng, n)}", "", "**Tiempo día: ~1 hora**", ""]
+
+        lines += [
+            "---",
+            "",
+            f"### Resumen Semana {week}",
+            "",
+            "| Métrica | Objetivo |",
+            "|---------|----------|",
+            f"| Reels publicados | {rng.randint(2, 5)} |",
+            f"| Stories publicadas | {rng.randint(10, 14)}-{rng.randint(15, 22)} |",
+            f"| Engagement rate esperado | >{rng.randint(3, 9) / 10}% |",
+            "",
+            "---",
+            "",
+        ]
+
+    lines += ["## IDEAS DE CONTENIDO (Banco de Reels)", ""]
+    for category in ["Emocionales", "Educativos", "Tendencias"]:
+        lines += [f"### {category}"]
+        lines += [f'- [ ] "{task_text(rng, i)}"' for i in range(5)]
+        lines += [""]
+
+    return "\n".join(lines)
+
+
+def generate_plan(sections: int, months: int, seed: int = 0) -> str:
+    """
+    Build a plan with KPIs, filler sections, a projections table and risks.
+
+    Args:
+        sections: Number of extra "## N." sections, each with subsections,
+                  lists and a table, to grow the document.
+        months: Rows in the monthly projections table.
+        seed: Random seed.
+
+    Returns:
+        Markdown text.
+    """
+    rng = random.Random(seed)
+    lines = [
+        "# Plan Estratégico: fixture",
+        "",
+        "## 1. Situación Actual",
+        "",
+        "### 1.1 KPIs de la cuenta (fixture)",
+        "",
+        "| Métrica | Valor | Benchmark | Estado |",
+        "|---------|-------|-----------|--------|",
+        "| **Seguidores** | 114,900 | - | ✅ Buena base |",
+        "| **Engagement Rate** | 0.24% | 1.5-2.5% | 🔴 Crítico |",
+        "| **Avg. Likes** | 269 | ~1,150 esperados | 🔴 76% por debajo |",
+        "",
+    ]
+
+    for number in range(2, sections + 2):
+        section = number + 10
+        lines += [f"## {section}. Sección sintética {number}", ""]
+        for sub in range(1, 4):
+            lines += [f"### {section}.{sub} Apartado {sub}", "", "**Acciones**:"]
+            lines += [f"- {task_text(rng, i)}" for i in range(4)]
+            lines += ["", "| Concepto | Valor |", "|----------|-------|"]
+            lines += [f"| {rng.choice(TOPICS)} | €{rng.randint(1, 9) * 100} |" for _ in range(3)]
+            lines += [""]
+
+    lines += [
+        "## 5. Proyección Financiera",
+        "",
+        "### 5.1 Ingresos mensuales proyectados (fixture)",
+        "",
+        "| Mes | Rehabilitación | Afiliados | Productos | B2B | **Total** |",
+        "|-----|----------------|-----------|-----------|-----|-----------|",
+    ]
+    for month in range(1, months + 1):
+        amounts = [rng.randint(0, 30) * 100 for _ in range(3)]
+        cells = [f"€{a:,}" if a else "-" for a in amounts]
+        lines.append(f"| {month} | ✅ | {' | '.join(cells)} | **€{sum(amounts):,}** |")
+
+    lines += [
+        "",
+        "## 9. Riesgos y Mitigación",
+        "",
+        "| Riesgo | Probabilidad | Impacto | Mitigación |",
+        "|--------|--------------|---------|------------|",
+    ]
+    lines += [
+        f"| Riesgo {i} | {rng.choice(['Baja', 'Media', 'Alta'])} | Medio | Mitigación {i} |"
+        for i in range(1, 8)
+    ]
+    lines += ["", "## 10. Fuentes", ""]
+
+    return "\n".join(lines)
+
+
+def generate_competitors(competitors: int, seed: int = 0) -> str:
+    """
+    Build a competitor analysis with one profile section per competitor.
+
+    Args:
+        competitors: Number of profiles. Only the first seven use the names
+                     the parser looks up; the rest add parse work but never
+                     reach the parsed result or the page.
+        seed: Random seed.
+
+    Returns:
+        Markdown text.
+    """
+    rng = random.Random(seed)
+    lines = [
+        "# Análisis de Competidores: fixture",
+        "",
+        "## 1. Mapa Competitivo",
+        "",
+        "## 2. Análisis Individual de Competidores",
+        "",
+    ]
+
+    for i in range(competitors):
+        if i < len(KNOWN_COMPETITORS):
+            name, handle = KNOWN_COMPETITORS[i]
+        else:
+            name, handle = f"COMPETIDOR {i + 1}", f"competidor{i + 1}"
+        lines += [
+            f"### 2.{i + 1} {name} (@{handle})",
+            "",
+            "| Métrica | Valor |",
+            "|---------|-------|",
+            f"| Seguidores | ~{rng.randint(50, 600)},000 |",
+            "",
+            "**Modelo de negocio**:",
+            f"- {rng.choice(['Blog propio', 'Tienda online', 'Patrocinios'])}",
+            "- Contenido patrocinado",
+            "",
+            "**Fortalezas**:",
+            f"- {rng.choice(['Marca propia', 'Gran comunidad', 'Contenido cuidado'])}",
+            "",
+            "---",
+            "",
+        ]
+
+    lines += [
+        "## 3. Análisis Comparativo",
+        "",
+        "### 3.3 Gaps y oportunidades identificadas",
+        "",
+        "1. **Reels/vídeo corto** — La mayoría sigue siendo estática",
+        "2. **Productos digitales** — Territorio libre",
+        "",
+        "## 6. Recomendaciones Estratégicas",
+        "",
+        "### 6.1 Corto plazo (meses 1-3)",
+        "",
+        "- [ ] Pivotar a Reels",
+        "",
+    ]
+
+    return "\n".join(lines)
+
+
+# =============================================================================
+# WORKBOOKS
+# =============================================================================
+
+def generate_posts(posts: int, seed: int = 0):
+    """
+    Build a posts export with the columns of the Instagram insights workbook.
+
+    Args:
+        posts: Number of rows.
+        seed: Random seed.
+
+    Returns:
+        pandas DataFrame.
+    """
+    import pandas as pd
+
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    rows = []
+
+    for i in range(posts):
+        tags = " ".join(f"#{tag}" for tag in rng.sample(HASHTAGS, rng.randint(1, 4)))
+        rows.append([
+            pd.Timestamp(start + timedelta(days=i % 365)),
+            rng.randint(100, 50000),
+            rng.choice([None, rng.randint(50, 20000)]),
+            rng.randint(0, 900),
+            rng.randint(0, 60),
+            rng.randint(0, 120),
+            rng.randint(0, 30),
+            rng.choice([None, float(rng.randint(0, 50))]),
+            float(rng.randint(0, 200)),
+            float(rng.randint(0, 20)),
+            float(rng.randint(0, 10)),
+            round(rng.random() * 5, 3),
+            round(rng.random(), 3),
+            None,
+            f"Post sintético {i} sobre {rng.choice(TOPICS)} {tags}",
+        ])
+
+    return pd.DataFrame(rows, columns=POST_COLUMNS)
+
+
+def write_fixtures(
+    out_dir: Path,
+    weeks: int = 4,
+    tasks_per_day: int = 5,
+    competitors: int = 7,
+    plan_sections: int = 10,
+    months: int = 12,
+    posts: int = 10,
+    seed: int = 0,
+) -> tuple[Path, Path]:
+    """
+    Write a full docs/data fixture set.
+
+    Args:
+        out_dir: Directory to create "docs" and "data" in.
+        weeks, tasks_per_day: Checklist size.
+        competitors: Competitor profiles.
+        plan_sections, months: Plan size.
+        posts: Rows in each posts workbook (0 skips the workbooks).
+        seed: Random seed.
+
+    Returns:
+        (docs_dir, data_dir).
+    """
+    docs_dir = out_dir / "docs"
+    data_dir = out_dir / "data"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    data_dir.mkdir(parents=True, exist_ok=True)
+
+    (docs_dir / CHECKLIST_FILE).write_text(
+        generate_checklist(weeks, tasks_per_day, seed), encoding="utf-8"
+    )
+    (docs_dir / PLAN_FILE).write_text(generate_plan(plan_sections, months, seed), encoding="utf-8")
+    (docs_dir / COMPETITORS_FILE).write_text(
+        generate_competitors(competitors, seed), encoding="utf-8"
+    )
+
+    if posts:
+        generate_posts(posts, seed).to_excel(data_dir / BEST_POSTS_FILE, index=False)
+        generate_posts(posts, seed + 1).to_excel(data_dir / WORST_POSTS_FILE, index=False)
+
+    return docs_dir, data_dir
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("out_dir", type=Path)
+    parser.add_argument("--weeks", type=int, default=52)
+    parser.add_argument("--tasks-per-day", type=int, default=6)
+    parser.add_argument("--competitors", type=int, default=50)
+    parser.add_argument("--plan-sections", type=int, default=40)
+    parser.add_argument("--months", type=int, default=36)
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    docs_dir, data_dir = write_fixtures(
+        args.out_dir,
+        weeks=args.weeks,
+        tasks_per_day=args.tasks_per_day,
+        competitors=args.competitors,
+        plan_sections=args.plan_sections,
+        months=args.months,
+        posts=args.posts,
+        seed=args.seed,
+    )
+    for path in sorted([*docs_dir.iterdir(), *data_dir.iterdir()]):
+        print(f"{path}  {path.stat().st_size:,} bytes")
+
+
+if __name__ == "__main__":
+    main()
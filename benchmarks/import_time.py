@@ -0,0 +1,194 @@
+"""
+Import-time report for the app's cold start.
+
+Imports the modules app.py imports in a fresh interpreter under
+`python -X importtime`, then reports the cumulative time of each top-level
+import, the heaviest packages pulled in along the way and whether the
+deferred heavy dependencies (pandas, numpy) stayed unloaded. The deferred
+cost is measured the same way, so the two numbers show the startup win.
+
+Run from the repo root:
+    python benchmarks/import_time.py [--repeats 5] [--top 15] [--output PATH]
+"""
+
+import argparse
+import ast
+import json
+import platform
+import re
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+APP_FILE = ROOT / "app.py"
+DEFAULT_OUTPUT = ROOT / ".cache" / "benchmarks" / "imports.json"
+
+# Dependencies that must only load when a page first needs them
+DEFERRED_MODULES = ("pandas", "numpy", "openpyxl", "pyarrow")
+
+# What the first Insights render adds on top of the cold start
+FIRST_USE_IMPORTS = ["pandas"]
+
+# "import time:       self [us] |  cumulative | imported package"
+IMPORTTIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def app_imports() -> list[str]:
+    """Top-level modules imported by app.py, in order."""
+    modules = []
+    for node in ast.parse(APP_FILE.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Import):
+            modules.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.append(node.module)
+    return list(dict.fromkeys(modules))
+
+
+def run_importtime(modules: list[str]) -> tuple[list[dict], list[str]]:
+    """
+    Import modules in a fresh interpreter with -X importtime.
+
+    Returns:
+        (entries, loaded): one entry per imported module with self_us,
+        cumulative_us and depth (0 = top-level import, including the
+        interpreter's own startup imports), and the DEFERRED_MODULES
+        present in sys.modules afterwards.
+    """
+    code = "; ".join(
+        [f"import {module}" for module in modules]
+        + [f"import sys; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    entries = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append({
+                "module": name,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(indent) - 1) // 2,
+            })
+
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return entries, loaded
+
+
+def top_level_trees(entries: list[dict]) -> list[list[dict]]:
+    """
+    Group importtime entries by top-level import.
+
+    importtime logs a module after everything it imported, so each group
+    ends with its depth-0 entry.
+    """
+    trees = []
+    current = []
+    for entry in entries:
+        current.append(entry)
+        if entry["depth"] == 0:
+            trees.append(current)
+            current = []
+    return trees
+
+
+def measure(modules: list[str], repeats: int, top: int) -> dict:
+    """
+    Import-time summary over several fresh interpreters.
+
+    Totals are the median over repeats; the per-module breakdown comes from
+    the run closest to that median.
+    """
+    startup_roots = {entry["module"] for entry in run_importtime([])[0] if entry["depth"] == 0}
+
+    runs = []
+    for _ in range(repeats):
+        entries, loaded = run_importtime(modules)
+        # Skip site, encodings etc.: every interpreter pays for those
+        entries = [
+            entry
+            for tree in top_level_trees(entries)
+            if tree[-1]["module"] not in startup_roots
+            for entry in tree
+        ]
+        total_us = sum(entry["cumulative_us"] for entry in entries if entry["depth"] == 0)
+        runs.append((total_us, entries, loaded))
+
+    median_us = statistics.median(run[0] for run in runs)
+    total_us, entries, loaded = min(runs, key=lambda run: abs(run[0] - median_us))
+
+    # Self time grouped by top-level package: where the time actually goes
+    packages = {}
+    for entry in entries:
+        package = entry["module"].split(".")[0]
+        packages[package] = packages.get(package, 0) + entry["self_us"]
+
+    return {
+        "modules": modules,
+        "total_ms": round(median_us / 1000, 1),
+        "min_ms": round(min(run[0] for run in runs) / 1000, 1),
+        "imports": {
+            entry["module"]: round(entry["cumulative_us"] / 1000, 1)
+            for entry in entries
+            if entry["depth"] == 0
+        },
+        "packages": {
+            name: round(us / 1000, 1)
+            for name, us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+        },
+        "modules_loaded": len(entries),
+        "deferred_loaded": loaded,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeats", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--top", type=int, default=15, help="packages listed in the report")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON results file")
+    args = parser.parse_args()
+
+    modules = app_imports()
+    startup = measure(modules, args.repeats, args.top)
+    first_use = measure(modules + FIRST_USE_IMPORTS, args.repeats, args.top)
+
+    print(f"app.py imports: {startup['total_ms']:.1f} ms (min {startup['min_ms']:.1f}), "
+          f"{startup['modules_loaded']} modules")
+    for module, ms in startup["imports"].items():
+        print(f"  {module:<36}{ms:>10.1f} ms")
+
+    print(f"\nheaviest packages (self time)")
+    for package, ms in startup["packages"].items():
+        print(f"  {package:<36}{ms:>10.1f} ms")
+
+    deferred = ", ".join(startup["deferred_loaded"]) or "none"
+    print(f"\ndeferred dependencies loaded at startup: {deferred}")
+    print(f"first Insights use adds: {first_use['total_ms'] - startup['total_ms']:.1f} ms "
+          f"({', '.join(first_use['deferred_loaded']) or 'nothing'})")
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "repeats": args.repeats,
+        "startup": startup,
+        "first_use": first_use,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nSaved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""
+Headless rerun benchmark for the app and each page.
+
+Drives app.py (one target per navigation tab) and every render_* page
+function under Streamlit's AppTest against the real docs/plans and data
+files. For each target it records the cold first run, p50/p95 rerun time,
+peak Python memory of a rerun and the number of elements emitted, and
+writes everything to a JSON file to compare against a baseline.
+
+Run from the repo root:
+    python benchmarks/rerun_bench.py [--runs 20] [--output PATH] [--only NAME ...]
+"""
+
+import argparse
+import json
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+APP_FILE = ROOT / "app.py"
+DEFAULT_OUTPUT = ROOT / ".cache" / "benchmarks" / "reruns.json"
+
+# Navigation tab labels, as in app.py
+APP_TABS = {
+    "app:dashboard": " Dashboard",
+    "app:checklist": " Plan Semanal",
+    "app:strategy": " Estrategia",
+    "app:competitors": " Competidores",
+    "app:insights": " Insights",
+}
+
+# (module, function, directory argument, takes a state dict)
+PAGE_FUNCTIONS = {
+    "page:dashboard": ("src.pages.dashboard", "render_dashboard", "docs/plans", True),
+    "page:checklist": ("src.pages.checklist", "render_checklist", "docs/plans", True),
+    "page:strategy": ("src.pages.strategy", "render_strategy", "docs/plans", False),
+    "page:competitors": ("src.pages.competitors", "render_competitors", "docs/plans", False),
+    "page:insights": ("src.pages.insights", "render_insights", "data", False),
+}
+
+
+def page_script(root: str, module: str, function: str, directory: str, with_state: bool) -> None:
+    """AppTest script that renders a single page function (runs in its own file)."""
+    import importlib
+    import sys
+    from pathlib import Path
+
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    render = getattr(importlib.import_module(module), function)
+    if with_state:
+        render(Path(root) / directory, {})
+    else:
+        render(Path(root) / directory)
+
+
+def build_app_test(name: str) -> AppTest:
+    if name in APP_TABS:
+        at = AppTest.from_file(str(APP_FILE), default_timeout=120)
+        at.session_state["active_tab"] = APP_TABS[name]
+        return at
+
+    module, function, directory, with_state = PAGE_FUNCTIONS[name]
+    return AppTest.from_function(
+        page_script,
+        default_timeout=120,
+        args=(str(ROOT), module, function, directory, with_state),
+    )
+
+
+def count_elements(node) -> int:
+    """Count the leaf elements under an AppTest node (blocks are not counted)."""
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return sum(count_elements(child) for child in children.values())
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def run_target(name: str, runs: int) -> dict:
+    """
+    Benchmark one app tab or page function.
+
+    The first run is reported separately as the cold run (imports, parsing,
+    CSS compilation); the timed reruns reuse the same AppTest session, like
+    a user clicking around. Peak memory comes from one extra traced rerun so
+    tracemalloc overhead doesn't skew the timings.
+    """
+    at = build_app_test(name)
+
+    start = time.perf_counter()
+    at.run()
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    if at.exception:
+        return {"error": at.exception[0].value, "cold_ms": round(cold_ms, 2)}
+
+    timings = []
+    for _ in range(runs):
+        if name in APP_TABS:
+            at.session_state["active_tab"] = APP_TABS[name]
+        start = time.perf_counter()
+        at.run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "runs": runs,
+        "cold_ms": round(cold_ms, 2),
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(percentile(timings, 0.95), 2),
+        "max_ms": round(max(timings), 2),
+        "peak_python_kb": round(peak / 1024, 1),
+        "elements": count_elements(at._tree),
+        "markdown_elements": len(at.markdown),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=20, help="timed reruns per target")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON results file")
+    parser.add_argument(
+        "--only", nargs="*", choices=[*APP_TABS, *PAGE_FUNCTIONS], help="targets to run"
+    )
+    args = parser.parse_args()
+
+    targets = args.only or [*APP_TABS, *PAGE_FUNCTIONS]
+    results = {}
+
+    print(f"{'target':<20}{'cold ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'peak KB':>10}{'elements':>10}")
+    for name in targets:
+        result = run_target(name, args.runs)
+        results[name] = result
+        if "error" in result:
+            print(f"{name:<20}  ERROR: {result['error']}")
+            continue
+        print(
+            f"{name:<20}{result['cold_ms']:>10.1f}{result['p50_ms']:>10.1f}"
+            f"{result['p95_ms']:>10.1f}{result['peak_python_kb']:>10.0f}{result['elements']:>10}"
+        )
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        # ru_maxrss is in KB on Linux
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "targets": results,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nSaved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Parse and render time against input size, on synthetic fixtures.
+
+Two sweeps, each on freshly generated files (see fixtures.py):
+  markdown: checklist weeks, competitors and plan sections all grow with
+            the scale factor; times the three markdown parsers (uncached)
+            and renders the dashboard, checklist and strategy pages. The
+            competitor parser only returns the seven profiles it knows by
+            name, so for competitors only parse time scales and their page
+            is left out of the render sweep.
+  posts:    rows per posts workbook; times parse_posts_file cold (Excel)
+            and warm (Parquet cache) and renders the insights page.
+
+Results are saved as JSON. With matplotlib installed a PNG chart is saved
+next to it; otherwise the tables printed here are the report.
+
+Run from the repo root:
+    python benchmarks/scaling_bench.py [--scales 1 2 4 8] [--posts 10 100 1000 5000]
+"""
+
+import argparse
+import importlib.util
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from streamlit.testing.v1 import AppTest
+
+from fixtures import CHECKLIST_FILE, COMPETITORS_FILE, PLAN_FILE, write_fixtures
+from rerun_bench import count_elements, page_script
+from src.parsers.checklist_parser import parse_checklist_file
+from src.parsers.competitor_parser import parse_competitor_file
+from src.parsers.insights_parser import BEST_POSTS_FILE, parse_posts_file
+from src.parsers.plan_parser import parse_plan_file
+
+DEFAULT_OUTPUT = ROOT / ".cache" / "benchmarks" / "scaling.json"
+
+# Sizes at scale 1 (about the bundled documents)
+BASE_SIZES = {"weeks": 4, "tasks_per_day": 5, "competitors": 7, "plan_sections": 10}
+
+MARKDOWN_PARSERS = {
+    "checklist": (parse_checklist_file, CHECKLIST_FILE),
+    "plan": (parse_plan_file, PLAN_FILE),
+    "competitors": (parse_competitor_file, COMPETITORS_FILE),
+}
+
+MARKDOWN_PAGES = {
+    "dashboard": ("src.pages.dashboard", "render_dashboard", True),
+    "checklist": ("src.pages.checklist", "render_checklist", True),
+    "strategy": ("src.pages.strategy", "render_strategy", False),
+}
+
+
+def median_ms(func, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 2)
+
+
+def time_render(module: str, function: str, directory: Path, with_state: bool, repeats: int) -> dict:
+    """Render a page on a fixture directory; report the cold run and the warm p50."""
+    at = AppTest.from_function(
+        page_script,
+        default_timeout=600,
+        args=(str(ROOT), module, function, str(directory), with_state),
+    )
+    start = time.perf_counter()
+    at.run()
+    cold_ms = (time.perf_counter() - start) * 1000
+    if at.exception:
+        return {"error": at.exception[0].value}
+
+    return {
+        "cold_ms": round(cold_ms, 2),
+        "p50_ms": median_ms(at.run, repeats),
+        "elements": count_elements(at._tree),
+    }
+
+
+def markdown_sweep(scales: list[int], repeats: int, work_dir: Path) -> list[dict]:
+    rows = []
+    for scale in scales:
+        sizes = {name: value * scale for name, value in BASE_SIZES.items()}
+        sizes["tasks_per_day"] = BASE_SIZES["tasks_per_day"]
+        docs_dir, _ = write_fixtures(work_dir / f"md-{scale}", posts=0, seed=scale, **sizes)
+
+        row = {"scale": scale, **sizes, "bytes": {}, "parse_ms": {}, "render": {}}
+        for name, (parser, file_name) in MARKDOWN_PARSERS.items():
+            path = docs_dir / file_name
+            row["bytes"][name] = path.stat().st_size
+            row["parse_ms"][name] = median_ms(lambda: parser.uncached(path), repeats)
+
+        for name, (module, function, with_state) in MARKDOWN_PAGES.items():
+            row["render"][name] = time_render(module, function, docs_dir, with_state, repeats)
+
+        rows.append(row)
+        print(
+            f"{scale:>6}{sizes['weeks']:>7}{sizes['competitors']:>7}"
+            + "".join(f"{row['parse_ms'][n]:>12.2f}" for n in MARKDOWN_PARSERS)
+            + "".join(f"{row['render'][n].get('p50_ms', float('nan')):>12.1f}" for n in MARKDOWN_PAGES)
+        )
+    return rows
+
+
+def posts_sweep(post_counts: list[int], repeats: int, work_dir: Path) -> list[dict]:
+    rows = []
+    for posts in post_counts:
+        _, data_dir = write_fixtures(work_dir / f"posts-{posts}", posts=posts, seed=posts)
+        path = data_dir / BEST_POSTS_FILE
+
+        start = time.perf_counter()
+        parse_posts_file.uncached(path)
+        cold_ms = round((time.perf_counter() - start) * 1000, 2)
+
+        row = {
+            "posts": posts,
+            "bytes": path.stat().st_size,
+            "parse_cold_ms": cold_ms,
+            "parse_warm_ms": median_ms(lambda: parse_posts_file.uncached(path), repeats),
+            "render": time_render(
+                "src.pages.insights", "render_insights", data_dir, False, repeats
+            ),
+        }
+        rows.append(row)
+        print(
+            f"{posts:>8}{row['parse_cold_ms']:>14.1f}{row['parse_warm_ms']:>14.1f}"
+            f"{row['render'].get('p50_ms', float('nan')):>14.1f}"
+        )
+    return rows
+
+
+def save_chart(report: dict, path: Path) -> bool:
+    """Plot both sweeps to a PNG if matplotlib is available."""
+    if importlib.util.find_spec("matplotlib") is None:
+        return False
+
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, (md_ax, posts_ax) = plt.subplots(1, 2, figsize=(12, 4.5))
+
+    scales = [row["scale"] for row in report["markdown"]]
+    for name in MARKDOWN_PARSERS:
+        md_ax.plot(scales, [row["parse_ms"][name] for row in report["markdown"]],
+                   marker="o", label=f"parse {name}")
+    for name in MARKDOWN_PAGES:
+        md_ax.plot(scales, [row["render"][name].get("p50_ms") for row in report["markdown"]],
+                   marker="s", linestyle="--", label=f"render {name}")
+    md_ax.set(xlabel="scale factor", ylabel="ms", title="Markdown documents", xscale="log", yscale="log")
+    md_ax.legend(fontsize=7)
+
+    posts = [row["posts"] for row in report["posts"]]
+    posts_ax.plot(posts, [row["parse_cold_ms"] for row in report["posts"]], marker="o", label="parse cold")
+    posts_ax.plot(posts, [row["parse_warm_ms"] for row in report["posts"]], marker="o", label="parse warm")
+    posts_ax.plot(posts, [row["render"].get("p50_ms") for row in report["posts"]],
+                  marker="s", linestyle="--", label="render insights")
+    posts_ax.set(xlabel="posts per workbook", ylabel="ms", title="Posts exports", xscale="log", yscale="log")
+    posts_ax.legend(fontsize=7)
+
+    fig.tight_layout()
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scales", type=int, nargs="*", default=[1, 2, 4, 8])
+    parser.add_argument("--posts", type=int, nargs="*", default=[10, 100, 1000, 5000])
+    parser.add_argument("--repeats", type=int, default=5, help="timed repeats per measurement")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON results file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="evdln-scaling-") as tmp:
+        work_dir = Path(tmp)
+
+        print("markdown sweep (parse ms, render p50 ms)")
+        print(
+            f"{'scale':>6}{'weeks':>7}{'comps':>7}"
+            + "".join(f"{'p:' + n[:9]:>12}" for n in MARKDOWN_PARSERS)
+            + "".join(f"{'r:' + n[:9]:>12}" for n in MARKDOWN_PAGES)
+        )
+        markdown = markdown_sweep(args.scales, args.repeats, work_dir)
+
+        print("\nposts sweep")
+        print(f"{'posts':>8}{'parse cold':>14}{'parse warm':>14}{'render p50':>14}")
+        posts = posts_sweep(args.posts, args.repeats, work_dir)
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "markdown": markdown,
+        "posts": posts,
+    }
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"\nSaved {args.output}")
+
+    chart = args.output.with_suffix(".png")
+    if save_chart(report, chart):
+        print(f"Saved {chart}")
+    else:
+        print("matplotlib not installed: no chart (pip install matplotlib)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Per-session memory footprint with many viewers on one process.
+
+Opens N AppTest sessions of app.py in the same process (like N browser
+tabs on one deployment), ticks a few checklist tasks in each, and reports
+what every session holds on its own versus the structures shared by the
+process (parsed documents, saved state, progress counters). Also records
+how much traced Python memory each extra session adds. Ticked tasks are
+saved to a temporary directory, never to the real progress files.
+
+Run from the repo root:
+    python benchmarks/session_memory.py [--sessions 20] [--toggles 3] [--output PATH]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest
+
+from src.utils import state
+from src.utils.memory import get_memory_report
+
+APP_FILE = ROOT / "app.py"
+DEFAULT_OUTPUT = ROOT / ".cache" / "benchmarks" / "sessions.json"
+
+
+def use_state_dir(directory: Path) -> None:
+    """Point the state backends (JSON + journal, SQLite) at a scratch directory."""
+    state.STATE_FILE = directory / ".checklist_state.json"
+    state.JOURNAL_FILE = state.STATE_FILE.with_suffix(".journal")
+    state.STATE_DB_FILE = state.STATE_FILE.with_suffix(".db")
+
+
+def open_session(toggles: int) -> AppTest:
+    """Open the checklist tab in a new session and tick the first tasks."""
+    at = AppTest.from_file(str(APP_FILE), default_timeout=120)
+    at.session_state["active_tab"] = " Plan Semanal"
+    at.run()
+    for checkbox in at.checkbox[:toggles]:
+        checkbox.check().run()
+    return at
+
+
+def measure_sessions(sessions_count: int, toggles: int) -> tuple[list[AppTest], int]:
+    """
+    Open the sessions and measure traced memory across all but the first.
+
+    Returns:
+        (sessions, bytes of traced Python memory added by the later sessions)
+    """
+    # The first session pays for imports, parsing and CSS; measure after it
+    sessions = [open_session(toggles)]
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    for _ in range(sessions_count - 1):
+        sessions.append(open_session(toggles))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return sessions, after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sessions", type=int, default=20, help="sessions to open")
+    parser.add_argument("--toggles", type=int, default=3, help="tasks ticked per session")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="JSON results file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="evdln-sessions-") as tmp:
+        use_state_dir(Path(tmp))
+        sessions, traced_bytes = measure_sessions(args.sessions, args.toggles)
+        reports = [get_memory_report(at.session_state.to_dict()) for at in sessions]
+
+    session_bytes = [report["session_bytes"] for report in reports]
+    added = args.sessions - 1
+
+    result = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "sessions": args.sessions,
+        "toggles": args.toggles,
+        "session_bytes_p50": statistics.median(session_bytes),
+        "session_bytes_max": max(session_bytes),
+        "shared_bytes": reports[-1]["shared_bytes"],
+        "shared": reports[-1]["shared"],
+        "traced_kb_per_session": round(traced_bytes / 1024 / added, 1) if added else None,
+        "largest_session_keys": dict(list(reports[-1]["session"].items())[:5]),
+    }
+
+    print(f"sessions: {args.sessions}, tasks ticked per session: {args.toggles}")
+    print(f"per session (own state): p50 {result['session_bytes_p50'] / 1024:.1f} KB, "
+          f"max {result['session_bytes_max'] / 1024:.1f} KB")
+    print(f"shared by all sessions:  {result['shared_bytes'] / 1024:.1f} KB")
+    for name, size in result["shared"].items():
+        print(f"  {name:<20}{size / 1024:>10.1f} KB")
+    if added:
+        print(f"traced Python memory per extra session (incl. Streamlit): "
+              f"{result['traced_kb_per_session']:.1f} KB")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    print(f"\nSaved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Build the subsetted font files used by the offline font mode (EVDLN_FONTS=local).
+
+Downloads the Playfair Display and Montserrat variable fonts (SIL Open Font
+License) from the google/fonts repository, or reads them from --source-dir,
+keeps only the Latin glyphs the dashboard needs and writes WOFF2 files to
+static/fonts/.
+
+Requires fontTools with WOFF2 support (build time only):
+    pip install fonttools brotli
+
+Run from the repo root:
+    python scripts/build_fonts.py
+    python scripts/build_fonts.py --source-dir /path/to/ttfs   # offline
+"""
+
+import argparse
+import io
+import sys
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.styles.fonts import FONTS_DIR, LOCAL_FONTS
+
+GOOGLE_FONTS_RAW = "https://github.com/google/fonts/raw/main/ofl"
+
+# Source variable font per bundled file
+FONT_SOURCES = {
+    "PlayfairDisplay-latin.woff2": "playfairdisplay/PlayfairDisplay[wght].ttf",
+    "Montserrat-latin.woff2": "montserrat/Montserrat[wght].ttf",
+}
+
+# Google Fonts' "latin" range: ASCII, Latin-1 (á é í ó ú ñ ¿ ¡), punctuation, €
+LATIN_UNICODES = (
+    "U+0000-00FF,U+0131,U+0152-0153,U+02BB-02BC,U+02C6,U+02DA,U+02DC,"
+    "U+2000-206F,U+20AC,U+2122,U+2191,U+2193,U+2212,U+2215,U+FEFF,U+FFFD"
+)
+
+
+def load_source(relative_path: str, source_dir: Path | None) -> bytes:
+    """Read a source TTF from source_dir, or download it."""
+    if source_dir:
+        return (source_dir / Path(relative_path).name).read_bytes()
+    url = f"{GOOGLE_FONTS_RAW}/{urllib.request.quote(relative_path)}"
+    with urllib.request.urlopen(url, timeout=60) as response:
+        return response.read()
+
+
+def subset_font(data: bytes, output_path: Path) -> None:
+    """Subset a font to LATIN_UNICODES and save it as WOFF2."""
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+
+    font = TTFont(io.BytesIO(data))
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=subset.parse_unicodes(LATIN_UNICODES))
+    subsetter.subset(font)
+    font.flavor = "woff2"
+    font.save(output_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--source-dir", type=Path, help="Directory with the source .ttf files")
+    args = parser.parse_args()
+
+    FONTS_DIR.mkdir(parents=True, exist_ok=True)
+    for font in LOCAL_FONTS:
+        output_path = FONTS_DIR / font["file"]
+        subset_font(load_source(FONT_SOURCES[font["file"]], args.source_dir), output_path)
+        print(f"{output_path.relative_to(ROOT)}: {output_path.stat().st_size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
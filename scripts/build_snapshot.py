@@ -0,0 +1,39 @@
+"""
+Build the parsed-documents snapshot loaded at startup.
+
+Runs the checklist, plan, competitor and insights parsers once on
+docs/plans and data and writes their results, with the schema version and
+the hash of every source file, to .cache/snapshot.pkl (or EVDLN_SNAPSHOT).
+Re-run it after editing the documents; until then the app parses the
+changed ones live.
+
+Run from the repo root:
+    python scripts/build_snapshot.py [--docs-dir DIR] [--data-dir DIR] [--output PATH]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.parsers.snapshot import SNAPSHOT_FILE, build_snapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--docs-dir", type=Path, default=ROOT / "docs" / "plans")
+    parser.add_argument("--data-dir", type=Path, default=ROOT / "data")
+    parser.add_argument("--output", type=Path, default=SNAPSHOT_FILE, help="snapshot file")
+    args = parser.parse_args()
+
+    payload = build_snapshot(args.docs_dir, args.data_dir, args.output)
+    for entry in payload["entries"]:
+        print(f"{entry['path']}  ({entry['parser'].rsplit('.', 1)[-1]})")
+    print(f"{args.output}: {len(payload['entries'])} documents, "
+          f"{args.output.stat().st_size / 1024:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
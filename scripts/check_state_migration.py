@@ -0,0 +1,85 @@
+"""
+Check that switching the state backend from JSON to SQLite keeps every toggle.
+
+Saves progress with the JSON backend in a scratch directory, folds it into a
+new snapshot (as compaction and reset do, which starts a new journal epoch),
+toggles more tasks through the journal and then opens the SQLite database as
+a fresh process would. The database must hold exactly the JSON state.
+Never touches the real progress files.
+
+Run from the repo root:
+    python scripts/check_state_migration.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.utils import state
+
+
+def use_state_dir(directory: Path) -> None:
+    """Point the state backends (JSON + journal, SQLite) at a scratch directory."""
+    state.STATE_FILE = directory / ".checklist_state.json"
+    state.JOURNAL_FILE = state.STATE_FILE.with_suffix(".journal")
+    state.STATE_DB_FILE = state.STATE_FILE.with_suffix(".db")
+
+
+def forget_loaded_state() -> None:
+    """Drop what this process knows about the JSON files, like a restart."""
+    state._journal.update({"records": None, "torn": False, "epoch": 0})
+
+
+def check_migration(compactions: int) -> tuple[dict, dict]:
+    """
+    Save tasks with the JSON backend, then migrate them to SQLite.
+
+    Args:
+        compactions: Snapshot rewrites before the journaled toggles.
+
+    Returns:
+        (expected, migrated): completed flags by task id.
+    """
+    state.STATE_BACKEND = "json"
+    state.set_task_state("task_a", True)
+    state.set_task_state("task_c", True)
+    for _ in range(compactions):
+        state.compact_journal()
+    state.set_task_state("task_b", True)
+    state.set_task_state("task_c", False)
+    expected = {"task_a": True, "task_b": True, "task_c": False}
+
+    forget_loaded_state()
+    state.STATE_BACKEND = "sqlite"
+    migrated = {
+        task_id: completed
+        for task_id, completed in state.sqlite_load_state().items()
+        if not task_id.startswith("_")
+    }
+    return expected, migrated
+
+
+def main() -> None:
+    failures = 0
+    for compactions in (0, 1, 2):
+        with tempfile.TemporaryDirectory(prefix="evdln-migration-") as tmp:
+            use_state_dir(Path(tmp))
+            forget_loaded_state()
+            expected, migrated = check_migration(compactions)
+            # Release the scratch database before its directory is removed
+            state._sqlite["conn"].close()
+            state._sqlite.update({"conn": None, "path": None})
+
+        ok = migrated == expected
+        failures += not ok
+        print(f"{'ok  ' if ok else 'FAIL'} after {compactions} compaction(s): "
+              f"migrated {migrated}" + ("" if ok else f", expected {expected}"))
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,10 @@ Displays competitor information in a visually appealing card.
 import streamlit as st
 from typing import Optional
 
+from src.utils.profiler import profiled
 
+
+@profiled
 def render_competitor_card(
     name: str,
     handle: str,
@@ -68,6 +71,7 @@ def render_competitor_card(
     )
 
 
+@profiled
 def render_competitor_grid(competitors: list[dict], cols: int = 3) -> None:
     """
     Render a grid of competitor cards.
@@ -91,6 +95,7 @@ def render_competitor_grid(competitors: list[dict], cols: int = 3) -> None:
             )
 
 
+@profiled
 def render_positioning_map() -> None:
     """
     Render a visual positioning map of competitors using Streamlit columns.
@@ -127,6 +132,7 @@ def render_positioning_map() -> None:
             )
 
 
+@profiled
 def render_opportunity_card(
     title: str,
     description: str,
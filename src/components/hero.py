@@ -6,7 +6,11 @@ Large gradient banner with key metrics.
 import streamlit as st
 from typing import Optional
 
+from src.utils.html import html_block
+from src.utils.profiler import profiled
 
+
+@profiled
 def render_hero(
     title: str = "Engagement Rate",
     current_value: str = "0.24%",
@@ -40,6 +44,7 @@ def render_hero(
     )
 
 
+@profiled
 def render_mini_hero(
     value: str,
     label: str,
@@ -65,6 +70,7 @@ def render_mini_hero(
     )
 
 
+@profiled
 def render_focus_section(tasks: list[dict], max_items: int = 5) -> None:
     """
     Render the "Hoy Tu Enfoque" section with top tasks.
@@ -73,30 +79,29 @@ def render_focus_section(tasks: list[dict], max_items: int = 5) -> None:
         tasks: List of task dicts with keys: text, time, day.
         max_items: Maximum number of tasks to show.
     """
-    st.markdown(
-        '<div style="background:white;border-radius:16px;padding:24px;border:1px solid #F0E6E8;margin-top:24px;">'
-        '<h3 style="font-family:Playfair Display,serif;font-size:1.25rem;color:#3D3D3D;margin-bottom:16px;display:flex;align-items:center;gap:8px;">'
-        '<span style="font-size:1.5rem;"></span>'
-        'Hoy Tu Enfoque'
-        '</h3>',
-        unsafe_allow_html=True
-    )
+    with html_block() as html:
+        html.append(
+            '<div style="background:white;border-radius:16px;padding:24px;border:1px solid #F0E6E8;margin-top:24px;">'
+            '<h3 style="font-family:Playfair Display,serif;font-size:1.25rem;color:#3D3D3D;margin-bottom:16px;display:flex;align-items:center;gap:8px;">'
+            '<span style="font-size:1.5rem;"></span>'
+            'Hoy Tu Enfoque'
+            '</h3>'
+        )
 
-    for i, task in enumerate(tasks[:max_items]):
-        text = task.get("text", "")
-        time = task.get("time", "")
+        for i, task in enumerate(tasks[:max_items]):
+            text = task.get("text", "")
+            time = task.get("time", "")
 
-        time_badge = f'<span style="font-size:0.75rem;font-weight:500;color:#8B7E74;background:#FFFBF7;padding:4px 10px;border-radius:9999px;">{time}</span>' if time else ""
+            time_badge = f'<span style="font-size:0.75rem;font-weight:500;color:#8B7E74;background:#FFFBF7;padding:4px 10px;border-radius:9999px;">{time}</span>' if time else ""
 
-        border_style = "1px solid #F0E6E8" if i < min(len(tasks), max_items) - 1 else "none"
+            border_style = "1px solid #F0E6E8" if i < min(len(tasks), max_items) - 1 else "none"
 
-        st.markdown(
-            f'<div style="display:flex;align-items:center;gap:12px;padding:12px 0;border-bottom:{border_style};">'
-            f'<span style="width:28px;height:28px;border-radius:50%;background:linear-gradient(135deg,#FF6B9D 0%,#C084FC 100%);color:white;display:flex;align-items:center;justify-content:center;font-size:0.875rem;font-weight:600;flex-shrink:0;">{i + 1}</span>'
-            f'<span style="flex:1;color:#3D3D3D;font-size:0.9375rem;">{text}</span>'
-            f'{time_badge}'
-            f'</div>',
-            unsafe_allow_html=True
-        )
+            html.append(
+                f'<div style="display:flex;align-items:center;gap:12px;padding:12px 0;border-bottom:{border_style};">'
+                f'<span style="width:28px;height:28px;border-radius:50%;background:linear-gradient(135deg,#FF6B9D 0%,#C084FC 100%);color:white;display:flex;align-items:center;justify-content:center;font-size:0.875rem;font-weight:600;flex-shrink:0;">{i + 1}</span>'
+                f'<span style="flex:1;color:#3D3D3D;font-size:0.9375rem;">{text}</span>'
+                f'{time_badge}'
+                f'</div>'
+            )
 
-    st.markdown("</div>", unsafe_allow_html=True)
+        html.append("</div>")
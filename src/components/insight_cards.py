@@ -6,7 +6,11 @@ Premium wedding-themed design with comparison visuals.
 import streamlit as st
 from typing import Optional
 
+from src.utils.html import html_block
+from src.utils.profiler import profiled
 
+
+@profiled
 def render_comparison_metric(
     name: str,
     best: str | int,
@@ -49,6 +53,7 @@ def render_comparison_metric(
     )
 
 
+@profiled
 def render_comparison_metric_text(
     name: str,
     best: str,
@@ -91,6 +96,7 @@ def render_comparison_metric_text(
     )
 
 
+@profiled
 def render_lever_card(
     title: str,
     impact: str,
@@ -138,6 +144,7 @@ def render_lever_card(
     )
 
 
+@profiled
 def render_do_dont_section(do_items: list[str], dont_items: list[str]) -> None:
     """
     Render a two-column DO vs DON'T section.
@@ -149,44 +156,43 @@ def render_do_dont_section(do_items: list[str], dont_items: list[str]) -> None:
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown(
-            '<div style="background:#F0FDF4;border-radius:16px;padding:24px;border:2px solid #86EFAC;">'
-            '<div style="display:flex;align-items:center;gap:8px;margin-bottom:16px;">'
-            '<span style="font-size:1.5rem;"></span>'
-            '<span style="font-family:Playfair Display,serif;font-size:1.25rem;font-weight:600;color:#166534;">HACER</span>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        for item in do_items:
-            st.markdown(
-                f'<div style="display:flex;align-items:flex-start;gap:8px;margin-bottom:10px;font-size:0.875rem;color:#166534;">'
-                f'<span style="color:#16A34A;font-weight:bold;"></span>'
-                f'<span>{item}</span>'
-                f'</div>',
-                unsafe_allow_html=True
+        with html_block() as html:
+            html.append(
+                '<div style="background:#F0FDF4;border-radius:16px;padding:24px;border:2px solid #86EFAC;">'
+                '<div style="display:flex;align-items:center;gap:8px;margin-bottom:16px;">'
+                '<span style="font-size:1.5rem;"></span>'
+                '<span style="font-family:Playfair Display,serif;font-size:1.25rem;font-weight:600;color:#166534;">HACER</span>'
+                '</div>'
             )
-        st.markdown('</div>', unsafe_allow_html=True)
+            for item in do_items:
+                html.append(
+                    f'<div style="display:flex;align-items:flex-start;gap:8px;margin-bottom:10px;font-size:0.875rem;color:#166534;">'
+                    f'<span style="color:#16A34A;font-weight:bold;"></span>'
+                    f'<span>{item}</span>'
+                    f'</div>'
+                )
+            html.append('</div>')
 
     with col2:
-        st.markdown(
-            '<div style="background:#FEF2F2;border-radius:16px;padding:24px;border:2px solid #FCA5A5;">'
-            '<div style="display:flex;align-items:center;gap:8px;margin-bottom:16px;">'
-            '<span style="font-size:1.5rem;"></span>'
-            '<span style="font-family:Playfair Display,serif;font-size:1.25rem;font-weight:600;color:#991B1B;">EVITAR</span>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        for item in dont_items:
-            st.markdown(
-                f'<div style="display:flex;align-items:flex-start;gap:8px;margin-bottom:10px;font-size:0.875rem;color:#991B1B;">'
-                f'<span style="color:#DC2626;font-weight:bold;"></span>'
-                f'<span>{item}</span>'
-                f'</div>',
-                unsafe_allow_html=True
+        with html_block() as html:
+            html.append(
+                '<div style="background:#FEF2F2;border-radius:16px;padding:24px;border:2px solid #FCA5A5;">'
+                '<div style="display:flex;align-items:center;gap:8px;margin-bottom:16px;">'
+                '<span style="font-size:1.5rem;"></span>'
+                '<span style="font-family:Playfair Display,serif;font-size:1.25rem;font-weight:600;color:#991B1B;">EVITAR</span>'
+                '</div>'
             )
-        st.markdown('</div>', unsafe_allow_html=True)
+            for item in dont_items:
+                html.append(
+                    f'<div style="display:flex;align-items:flex-start;gap:8px;margin-bottom:10px;font-size:0.875rem;color:#991B1B;">'
+                    f'<span style="color:#DC2626;font-weight:bold;"></span>'
+                    f'<span>{item}</span>'
+                    f'</div>'
+                )
+            html.append('</div>')
 
 
+@profiled
 def render_hashtag_clouds(
     good_hashtags: list[tuple[str, int]],
     bad_hashtags: list[tuple[str, int]],
@@ -201,40 +207,39 @@ def render_hashtag_clouds(
     col1, col2 = st.columns(2)
 
     with col1:
-        st.markdown(
-            '<div style="background:white;border-radius:16px;padding:20px;box-shadow:0 2px 12px rgba(0,0,0,0.04);border:1px solid #F0E6E8;">'
-            '<div style="font-family:Playfair Display,serif;font-size:1rem;font-weight:600;color:#166534;margin-bottom:16px;display:flex;align-items:center;gap:8px;">'
-            '<span></span> Hashtags Efectivos'
-            '</div>'
-            '<div style="display:flex;flex-wrap:wrap;gap:8px;">',
-            unsafe_allow_html=True
-        )
-        for tag, count in good_hashtags[:8]:
-            size = min(0.75 + (count / 10) * 0.25, 1.0)
-            st.markdown(
-                f'<span style="background:#DCFCE7;color:#166534;padding:6px 12px;border-radius:9999px;font-size:{size}rem;font-weight:500;">#{tag}</span>',
-                unsafe_allow_html=True
+        with html_block() as html:
+            html.append(
+                '<div style="background:white;border-radius:16px;padding:20px;box-shadow:0 2px 12px rgba(0,0,0,0.04);border:1px solid #F0E6E8;">'
+                '<div style="font-family:Playfair Display,serif;font-size:1rem;font-weight:600;color:#166534;margin-bottom:16px;display:flex;align-items:center;gap:8px;">'
+                '<span></span> Hashtags Efectivos'
+                '</div>'
+                '<div style="display:flex;flex-wrap:wrap;gap:8px;">'
             )
-        st.markdown('</div></div>', unsafe_allow_html=True)
+            for tag, count in good_hashtags[:8]:
+                size = min(0.75 + (count / 10) * 0.25, 1.0)
+                html.append(
+                    f'<span style="background:#DCFCE7;color:#166534;padding:6px 12px;border-radius:9999px;font-size:{size}rem;font-weight:500;">#{tag}</span>'
+                )
+            html.append('</div></div>')
 
     with col2:
-        st.markdown(
-            '<div style="background:white;border-radius:16px;padding:20px;box-shadow:0 2px 12px rgba(0,0,0,0.04);border:1px solid #F0E6E8;">'
-            '<div style="font-family:Playfair Display,serif;font-size:1rem;font-weight:600;color:#991B1B;margin-bottom:16px;display:flex;align-items:center;gap:8px;">'
-            '<span></span> Hashtags a Evitar'
-            '</div>'
-            '<div style="display:flex;flex-wrap:wrap;gap:8px;">',
-            unsafe_allow_html=True
-        )
-        for tag, count in bad_hashtags[:8]:
-            size = min(0.75 + (count / 10) * 0.25, 1.0)
-            st.markdown(
-                f'<span style="background:#FEE2E2;color:#991B1B;padding:6px 12px;border-radius:9999px;font-size:{size}rem;font-weight:500;">#{tag}</span>',
-                unsafe_allow_html=True
+        with html_block() as html:
+            html.append(
+                '<div style="background:white;border-radius:16px;padding:20px;box-shadow:0 2px 12px rgba(0,0,0,0.04);border:1px solid #F0E6E8;">'
+                '<div style="font-family:Playfair Display,serif;font-size:1rem;font-weight:600;color:#991B1B;margin-bottom:16px;display:flex;align-items:center;gap:8px;">'
+                '<span></span> Hashtags a Evitar'
+                '</div>'
+                '<div style="display:flex;flex-wrap:wrap;gap:8px;">'
             )
-        st.markdown('</div></div>', unsafe_allow_html=True)
+            for tag, count in bad_hashtags[:8]:
+                size = min(0.75 + (count / 10) * 0.25, 1.0)
+                html.append(
+                    f'<span style="background:#FEE2E2;color:#991B1B;padding:6px 12px;border-radius:9999px;font-size:{size}rem;font-weight:500;">#{tag}</span>'
+                )
+            html.append('</div></div>')
 
 
+@profiled
 def render_posts_table(posts: list[dict], title: str, is_best: bool = True) -> None:
     """
     Render a table of posts with key metrics.
@@ -247,45 +252,44 @@ def render_posts_table(posts: list[dict], title: str, is_best: bool = True) -> N
     accent_color = "#166534" if is_best else "#991B1B"
     bg_color = "#F0FDF4" if is_best else "#FEF2F2"
 
-    st.markdown(
-        f'<div style="font-family:Playfair Display,serif;font-size:1rem;font-weight:600;color:{accent_color};margin-bottom:12px;">{title}</div>',
-        unsafe_allow_html=True
-    )
-
-    st.markdown(
-        f'<div style="background:white;border-radius:12px;overflow:hidden;border:1px solid #F0E6E8;">'
-        f'<table style="width:100%;border-collapse:collapse;font-size:0.8rem;">'
-        f'<thead>'
-        f'<tr style="background:{bg_color};">'
-        f'<th style="padding:10px 8px;text-align:left;color:#8B7E74;font-weight:500;">Fecha</th>'
-        f'<th style="padding:10px 8px;text-align:right;color:#8B7E74;font-weight:500;">Views</th>'
-        f'<th style="padding:10px 8px;text-align:right;color:#8B7E74;font-weight:500;">Likes</th>'
-        f'<th style="padding:10px 8px;text-align:right;color:#8B7E74;font-weight:500;">Guard.</th>'
-        f'<th style="padding:10px 8px;text-align:left;color:#8B7E74;font-weight:500;">Caption</th>'
-        f'</tr>'
-        f'</thead>'
-        f'<tbody>',
-        unsafe_allow_html=True
-    )
+    with html_block() as html:
+        html.append(
+            f'<div style="font-family:Playfair Display,serif;font-size:1rem;font-weight:600;color:{accent_color};margin-bottom:12px;">{title}</div>'
+        )
 
-    for i, post in enumerate(posts[:10]):
-        row_bg = "#FFFBF7" if i % 2 == 0 else "white"
-        caption_short = post.get("caption", "")[:60] + "..." if len(post.get("caption", "")) > 60 else post.get("caption", "")
-
-        st.markdown(
-            f'<tr style="background:{row_bg};border-bottom:1px solid #F0E6E8;">'
-            f'<td style="padding:8px;font-size:0.75rem;">{post.get("fecha", "-")[:10]}</td>'
-            f'<td style="padding:8px;text-align:right;font-weight:500;">{post.get("views", 0):,}</td>'
-            f'<td style="padding:8px;text-align:right;">{post.get("likes", 0):,}</td>'
-            f'<td style="padding:8px;text-align:right;">{post.get("saves", 0):,}</td>'
-            f'<td style="padding:8px;font-size:0.7rem;color:#8B7E74;max-width:200px;overflow:hidden;text-overflow:ellipsis;white-space:nowrap;">{caption_short}</td>'
-            f'</tr>',
-            unsafe_allow_html=True
+        html.append(
+            f'<div style="background:white;border-radius:12px;overflow:hidden;border:1px solid #F0E6E8;">'
+            f'<table style="width:100%;border-collapse:collapse;font-size:0.8rem;">'
+            f'<thead>'
+            f'<tr style="background:{bg_color};">'
+            f'<th style="padding:10px 8px;text-align:left;color:#8B7E74;font-weight:500;">Fecha</th>'
+            f'<th style="padding:10px 8px;text-align:right;color:#8B7E74;font-weight:500;">Views</th>'
+            f'<th style="padding:10px 8px;text-align:right;color:#8B7E74;font-weight:500;">Likes</th>'
+            f'<th style="padding:10px 8px;text-align:right;color:#8B7E74;font-weight:500;">Guard.</th>'
+            f'<th style="padding:10px 8px;text-align:left;color:#8B7E74;font-weight:500;">Caption</th>'
+            f'</tr>'
+            f'</thead>'
+            f'<tbody>'
         )
 
-    st.markdown('</tbody></table></div>', unsafe_allow_html=True)
+        for i, post in enumerate(posts[:10]):
+            row_bg = "#FFFBF7" if i % 2 == 0 else "white"
+            caption_short = post.get("caption", "")[:60] + "..." if len(post.get("caption", "")) > 60 else post.get("caption", "")
+
+            html.append(
+                f'<tr style="background:{row_bg};border-bottom:1px solid #F0E6E8;">'
+                f'<td style="padding:8px;font-size:0.75rem;">{post.get("fecha", "-")[:10]}</td>'
+                f'<td style="padding:8px;text-align:right;font-weight:500;">{post.get("views", 0):,}</td>'
+                f'<td style="padding:8px;text-align:right;">{post.get("likes", 0):,}</td>'
+                f'<td style="padding:8px;text-align:right;">{post.get("saves", 0):,}</td>'
+                f'<td style="padding:8px;font-size:0.7rem;color:#8B7E74;max-width:200px;overflow:hidden;text-overflow:ellipsis;white-space:nowrap;">{caption_short}</td>'
+                f'</tr>'
+            )
+
+        html.append('</tbody></table></div>')
 
 
+@profiled
 def render_recommendation_card(
     title: str,
     description: str,
@@ -6,7 +6,10 @@ Premium wedding-themed design with gold accents.
 import streamlit as st
 from typing import Optional
 
+from src.utils.profiler import profiled
 
+
+@profiled
 def render_metric_card(
     value: str,
     label: str,
@@ -47,6 +50,7 @@ def render_metric_card(
     )
 
 
+@profiled
 def render_metric_grid(metrics: list[dict]) -> None:
     """
     Render a grid of metric cards.
@@ -79,6 +83,7 @@ def render_metric_grid(metrics: list[dict]) -> None:
             )
 
 
+@profiled
 def render_kpi_comparison(
     label: str,
     current: float,
@@ -120,6 +125,7 @@ def render_kpi_comparison(
     )
 
 
+@profiled
 def render_stat_pill(value: str, label: str, color: str = "lavender") -> str:
     """
     Return HTML for a small stat pill.
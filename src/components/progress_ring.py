@@ -6,7 +6,10 @@ SVG-based with gradient fill and animations.
 import streamlit as st
 from typing import Optional
 
+from src.utils.profiler import profiled
 
+
+@profiled
 def render_progress_ring(
     percentage: float,
     size: int = 120,
@@ -74,6 +77,7 @@ def render_progress_ring(
     )
 
 
+@profiled
 def render_mini_progress_ring(
     percentage: float,
     size: int = 48,
@@ -125,6 +129,7 @@ def render_mini_progress_ring(
     """
 
 
+@profiled
 def render_progress_bar(
     completed: int,
     total: int,
@@ -6,7 +6,10 @@ The main interactive element of the checklist.
 import streamlit as st
 from typing import Callable, Optional
 
+from src.utils.profiler import profiled
 
+
+@profiled
 def render_task_card(
     task_id: str,
     text: str,
@@ -30,19 +33,23 @@ def render_task_card(
     # Create the checkbox with Streamlit
     time_badge = f" ({time_estimate})" if time_estimate else ""
 
-    new_value = st.checkbox(
+    # The callback runs before the rerun, so the new value is already saved
+    # when the surrounding page or fragment renders again
+    return st.checkbox(
         f"{text}{time_badge}",
         value=completed,
         key=task_id,
+        on_change=notify_task_change if on_change else None,
+        args=(task_id, on_change),
     )
 
-    # If state changed, call callback
-    if new_value != completed and on_change:
-        on_change(task_id, new_value)
 
-    return new_value
+def notify_task_change(task_id: str, on_change: Callable[[str, bool], None]) -> None:
+    """Checkbox callback: pass the task's new value to on_change."""
+    on_change(task_id, st.session_state[task_id])
 
 
+@profiled
 def render_task_card_html(
     text: str,
     completed: bool,
@@ -76,6 +83,7 @@ def render_task_card_html(
     """
 
 
+@profiled
 def render_day_header(day_name: str, icon: str = "") -> None:
     """
     Render a day section header.
@@ -108,46 +116,7 @@ def render_day_header(day_name: str, icon: str = "") -> None:
     )
 
 
-def render_task_list(
-    tasks: list[dict],
-    state: dict,
-    on_change: Optional[Callable[[str, bool], None]] = None,
-) -> dict:
-    """
-    Render a list of tasks with checkboxes.
-
-    Args:
-        tasks: List of task dicts with keys: id, text, time, done.
-        state: Current state dictionary.
-        on_change: Optional callback when any task changes.
-
-    Returns:
-        dict: Updated state dictionary.
-    """
-    updated_state = state.copy()
-
-    for task in tasks:
-        task_id = task.get("id", "")
-        text = task.get("text", "")
-        time = task.get("time", "")
-        default_done = task.get("done", False)
-
-        current_value = state.get(task_id, default_done)
-
-        new_value = render_task_card(
-            task_id=task_id,
-            text=text,
-            completed=current_value,
-            time_estimate=time,
-            on_change=on_change,
-        )
-
-        if new_value != current_value:
-            updated_state[task_id] = new_value
-
-    return updated_state
-
-
+@profiled
 def render_ideas_bank(ideas: list[dict]) -> None:
     """
     Render the ideas bank section (expandable).
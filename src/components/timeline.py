@@ -6,7 +6,10 @@ Horizontal scrollable timeline with status indicators.
 import streamlit as st
 from typing import Optional
 
+from src.utils.profiler import profiled
 
+
+@profiled
 def render_timeline(
     items: list[dict],
     current_index: int = 0,
@@ -66,6 +69,7 @@ def render_timeline(
             )
 
 
+@profiled
 def render_phase_cards(
     phases: list[dict],
     current_phase: int = 0,
@@ -124,6 +128,7 @@ def render_phase_cards(
             ''', unsafe_allow_html=True)
 
 
+@profiled
 def render_month_indicator(
     current_month: int = 1,
     total_months: int = 12,
@@ -2,18 +2,20 @@
 Checklist page (Tab 2) - Weekly plan with interactive tasks.
 """
 
+import functools
+
 import streamlit as st
 from pathlib import Path
 
 from src.components.progress_ring import render_progress_ring, render_progress_bar
-from src.components.task_card import render_day_header, render_ideas_bank
-from src.parsers.checklist_parser import (
-    parse_checklist_file,
-    calculate_week_progress,
-)
-from src.utils.state import save_state
+from src.components.task_card import render_day_header, render_ideas_bank, render_task_card
+from src.parsers.checklist_parser import parse_checklist_file
+from src.utils.state import set_session_task_state
+from src.utils.profiler import profiled
+from src.utils.progress import apply_toggle, get_session_progress, get_week_progress
 
 
+@profiled
 def render_checklist(docs_dir: Path, state: dict) -> dict:
     """
     Render the checklist page with interactive tasks.
@@ -44,6 +46,8 @@ def render_checklist(docs_dir: Path, state: dict) -> dict:
         st.error("No se encontraron semanas en el checklist.")
         return state
 
+    progress = get_session_progress(checklist_data["index"], state)
+
     # =========================================================================
     # WEEK SELECTOR WITH TABS
     # =========================================================================
@@ -51,79 +55,7 @@ def render_checklist(docs_dir: Path, state: dict) -> dict:
 
     for tab, week_name in zip(week_tabs, week_names):
         with tab:
-            week_data = weeks.get(week_name, {})
-
-            # Calculate week progress
-            week_tasks = [t for day_tasks in week_data.values() for t in day_tasks]
-            week_progress = calculate_week_progress(tasks, state, week_name)
-
-            # =========================================================================
-            # WEEK HEADER WITH PROGRESS
-            # =========================================================================
-            col1, col2 = st.columns([3, 1])
-
-            with col1:
-                st.markdown(
-                    f'<div style="margin-bottom:16px;">'
-                    f'<span style="font-family:Montserrat,sans-serif;font-size:0.9rem;color:#8B7E74;">'
-                    f'Progreso: <strong>{week_progress["completed"]}/{week_progress["total"]}</strong> tareas'
-                    f'</span>'
-                    f'</div>',
-                    unsafe_allow_html=True
-                )
-
-                render_progress_bar(
-                    completed=week_progress["completed"],
-                    total=week_progress["total"],
-                )
-
-            with col2:
-                render_progress_ring(
-                    percentage=week_progress["percentage"],
-                    size=80,
-                )
-
-            # =========================================================================
-            # DAY SECTIONS
-            # =========================================================================
-            day_names = list(week_data.keys())
-
-            for day_name in day_names:
-                day_tasks = week_data.get(day_name, [])
-
-                if not day_tasks:
-                    continue
-
-                # Day header
-                if day_name and day_name != "General":
-                    render_day_header(day_name)
-
-                # Tasks for this day
-                for task in day_tasks:
-                    task_id = task.get("id", "")
-                    text = task.get("text", "")
-                    time = task.get("time", "")
-                    default_done = task.get("done", False)
-
-                    current_value = state.get(task_id, default_done)
-
-                    # Format label with time badge
-                    label = text
-                    if time:
-                        label = f"{text} ({time})"
-
-                    # Render checkbox
-                    new_value = st.checkbox(
-                        label,
-                        value=current_value,
-                        key=task_id,
-                    )
-
-                    # Update state if changed
-                    if new_value != current_value:
-                        state[task_id] = new_value
-                        save_state(state)
-                        st.rerun()
+            render_week_tasks(week_name, weeks.get(week_name, {}), state, progress)
 
     # =========================================================================
     # IDEAS BANK (Outside tabs)
@@ -178,6 +110,90 @@ def render_checklist(docs_dir: Path, state: dict) -> dict:
     return state
 
 
+@st.fragment
+@profiled
+def render_week_tasks(week_name: str, week_data: dict, state: dict, progress: dict) -> None:
+    """
+    Render one week's progress header and day task lists.
+
+    Runs as a fragment: ticking a checkbox reruns only this week block,
+    so its progress bar and ring update without a full-app rerun.
+
+    Args:
+        week_name: Name of the week.
+        week_data: Tasks of the week grouped by day.
+        state: Session checkbox state (updated in place).
+        progress: Session progress counters (updated in place on toggles).
+    """
+    week_progress = get_week_progress(progress, week_name)
+
+    # =========================================================================
+    # WEEK HEADER WITH PROGRESS
+    # =========================================================================
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        st.markdown(
+            f'<div style="margin-bottom:16px;">'
+            f'<span style="font-family:Montserrat,sans-serif;font-size:0.9rem;color:#8B7E74;">'
+            f'Progreso: <strong>{week_progress["completed"]}/{week_progress["total"]}</strong> tareas'
+            f'</span>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
+
+        render_progress_bar(
+            completed=week_progress["completed"],
+            total=week_progress["total"],
+        )
+
+    with col2:
+        render_progress_ring(
+            percentage=week_progress["percentage"],
+            size=80,
+        )
+
+    # =========================================================================
+    # DAY SECTIONS
+    # =========================================================================
+    on_change = functools.partial(toggle_task, state, progress)
+
+    for day_name, day_tasks in week_data.items():
+        if not day_tasks:
+            continue
+
+        # Day header
+        if day_name and day_name != "General":
+            render_day_header(day_name)
+
+        # Tasks for this day
+        for task in day_tasks:
+            task_id = task.get("id", "")
+
+            render_task_card(
+                task_id=task_id,
+                text=task.get("text", ""),
+                completed=state.get(task_id, task.get("done", False)),
+                time_estimate=task.get("time", ""),
+                on_change=on_change,
+            )
+
+
+def toggle_task(state: dict, progress: dict, task_id: str, completed: bool) -> None:
+    """
+    Checkbox callback: record a toggle before the fragment reruns.
+
+    Args:
+        state: Session checkbox state to update in place.
+        progress: Session progress counters, moved by one for this toggle.
+        task_id: The task that was toggled.
+        completed: The new checkbox value.
+    """
+    apply_toggle(progress, task_id, completed)
+    set_session_task_state(state, task_id, completed)
+
+
+@profiled
 def render_week_summary(week_name: str, progress: dict) -> None:
     """
     Render a summary card for a week's progress.
@@ -15,8 +15,11 @@ from src.parsers.competitor_parser import (
     get_default_competitors,
     get_default_opportunities,
 )
+from src.utils.html import html_block
+from src.utils.profiler import profiled
 
 
+@profiled
 def render_competitors(docs_dir: Path) -> None:
     """
     Render the competitors analysis page.
@@ -86,21 +89,6 @@ def render_competitors(docs_dir: Path) -> None:
     # =========================================================================
     st.markdown("### Comparativa de Modelos")
 
-    st.markdown(
-        '<div style="background:white;border-radius:16px;padding:24px;box-shadow:0 2px 12px rgba(0,0,0,0.04);border:1px solid #F0E6E8;overflow-x:auto;">'
-        '<table style="width:100%;border-collapse:collapse;font-size:0.875rem;">'
-        '<thead>'
-        '<tr style="border-bottom:2px solid #F0E6E8;">'
-        '<th style="text-align:left;padding:12px 8px;color:#8B7E74;">Cuenta</th>'
-        '<th style="text-align:right;padding:12px 8px;color:#8B7E74;">Seguidores</th>'
-        '<th style="text-align:left;padding:12px 8px;color:#8B7E74;">Modelo</th>'
-        '<th style="text-align:left;padding:12px 8px;color:#8B7E74;">Diferenciador</th>'
-        '</tr>'
-        '</thead>'
-        '<tbody>',
-        unsafe_allow_html=True
-    )
-
     table_data = [
         ("Invitada Perfecta", "~500K", "Contenido + Blog + Afiliados", "Foco en invitadas", False),
         ("Bodas.net", "303K", "Directorio B2B", "Corporativo + Sorteos", False),
@@ -112,22 +100,36 @@ def render_competitors(docs_dir: Path) -> None:
         ("TELVA Novias", "76K", "Medio tradicional", "Editorial/Tendencias", False),
     ]
 
-    for i, (name, followers, model, diff, highlight) in enumerate(table_data):
-        bg = "#FDF4FF" if highlight else ("#FFFBF7" if i % 2 == 0 else "white")
-        name_style = "font-weight: 600; color: #FF6B9D;" if highlight else ""
-        border = "2px solid #C084FC" if highlight else "1px solid #F0E6E8"
-
-        st.markdown(
-            f'<tr style="background:{bg};border-bottom:{border};">'
-            f'<td style="padding:10px 8px;{name_style}">{name}</td>'
-            f'<td style="padding:10px 8px;text-align:right;">{followers}</td>'
-            f'<td style="padding:10px 8px;color:#8B7E74;">{model}</td>'
-            f'<td style="padding:10px 8px;color:#8B7E74;font-style:italic;">{diff}</td>'
-            f'</tr>',
-            unsafe_allow_html=True
+    with html_block() as html:
+        html.append(
+            '<div style="background:white;border-radius:16px;padding:24px;box-shadow:0 2px 12px rgba(0,0,0,0.04);border:1px solid #F0E6E8;overflow-x:auto;">'
+            '<table style="width:100%;border-collapse:collapse;font-size:0.875rem;">'
+            '<thead>'
+            '<tr style="border-bottom:2px solid #F0E6E8;">'
+            '<th style="text-align:left;padding:12px 8px;color:#8B7E74;">Cuenta</th>'
+            '<th style="text-align:right;padding:12px 8px;color:#8B7E74;">Seguidores</th>'
+            '<th style="text-align:left;padding:12px 8px;color:#8B7E74;">Modelo</th>'
+            '<th style="text-align:left;padding:12px 8px;color:#8B7E74;">Diferenciador</th>'
+            '</tr>'
+            '</thead>'
+            '<tbody>'
         )
 
-    st.markdown('</tbody></table></div>', unsafe_allow_html=True)
+        for i, (name, followers, model, diff, highlight) in enumerate(table_data):
+            bg = "#FDF4FF" if highlight else ("#FFFBF7" if i % 2 == 0 else "white")
+            name_style = "font-weight: 600; color: #FF6B9D;" if highlight else ""
+            border = "2px solid #C084FC" if highlight else "1px solid #F0E6E8"
+
+            html.append(
+                f'<tr style="background:{bg};border-bottom:{border};">'
+                f'<td style="padding:10px 8px;{name_style}">{name}</td>'
+                f'<td style="padding:10px 8px;text-align:right;">{followers}</td>'
+                f'<td style="padding:10px 8px;color:#8B7E74;">{model}</td>'
+                f'<td style="padding:10px 8px;color:#8B7E74;font-style:italic;">{diff}</td>'
+                f'</tr>'
+            )
+
+        html.append('</tbody></table></div>')
 
     # =========================================================================
     # OPPORTUNITIES
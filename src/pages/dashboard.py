@@ -9,10 +9,13 @@ from src.components.hero import render_hero, render_focus_section
 from src.components.metric_cards import render_metric_grid, render_kpi_comparison
 from src.components.progress_ring import render_progress_ring
 from src.components.timeline import render_timeline, render_phase_cards, render_month_indicator
-from src.parsers.checklist_parser import parse_checklist_file, get_today_tasks, calculate_week_progress
+from src.parsers.checklist_parser import parse_checklist_file, get_today_tasks
 from src.parsers.plan_parser import parse_plan_file, get_current_phase
+from src.utils.profiler import profiled
+from src.utils.progress import get_session_progress, get_week_progress
 
 
+@profiled
 def render_dashboard(docs_dir: Path, state: dict) -> None:
     """
     Render the main dashboard page.
@@ -29,6 +32,8 @@ def render_dashboard(docs_dir: Path, state: dict) -> None:
     plan_data = parse_plan_file(plan_path)
 
     tasks = checklist_data.get("tasks", [])
+    index = checklist_data.get("index")
+    progress = get_session_progress(index, state)
     kpis = plan_data.get("kpis", {})
 
     # =========================================================================
@@ -46,9 +51,9 @@ def render_dashboard(docs_dir: Path, state: dict) -> None:
     # =========================================================================
     st.markdown("### Metricas Clave")
 
-    # Calculate task metrics
-    total_tasks = len(tasks)
-    completed_tasks = sum(1 for t in tasks if state.get(t["id"], t.get("done", False)))
+    # Task metrics from the incremental counters
+    total_tasks = progress["total"]
+    completed_tasks = progress["completed"]
     completion_pct = round((completed_tasks / total_tasks * 100) if total_tasks > 0 else 0)
 
     # Current phase
@@ -90,7 +95,7 @@ def render_dashboard(docs_dir: Path, state: dict) -> None:
     # =========================================================================
     st.markdown("")  # Spacing
 
-    today_tasks = get_today_tasks(tasks)
+    today_tasks = get_today_tasks(tasks, index=index)
     if today_tasks:
         # Filter out completed tasks for focus section
         pending_today = [t for t in today_tasks if not state.get(t["id"], t.get("done", False))]
@@ -98,8 +103,7 @@ def render_dashboard(docs_dir: Path, state: dict) -> None:
             render_focus_section(pending_today[:5])
     else:
         # Show first day's tasks as default
-        week1_tasks = [t for t in tasks if "semana 1" in t.get("week", "").lower()]
-        monday_tasks = [t for t in week1_tasks if "lunes" in t.get("day", "").lower()]
+        monday_tasks = get_today_tasks(tasks, "lunes", index=index, week_name="semana 1")
         if monday_tasks:
             pending = [t for t in monday_tasks if not state.get(t["id"], t.get("done", False))]
             if pending:
@@ -157,7 +161,7 @@ def render_dashboard(docs_dir: Path, state: dict) -> None:
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        week1_progress = calculate_week_progress(tasks, state, "semana 1")
+        week1_progress = get_week_progress(progress, "semana 1")
         render_progress_ring(
             percentage=week1_progress["percentage"],
             size=100,
@@ -165,7 +169,7 @@ def render_dashboard(docs_dir: Path, state: dict) -> None:
         )
 
     with col2:
-        week2_progress = calculate_week_progress(tasks, state, "semana 2")
+        week2_progress = get_week_progress(progress, "semana 2")
         render_progress_ring(
             percentage=week2_progress["percentage"],
             size=100,
@@ -6,7 +6,13 @@ Identifies success levers and actionable patterns.
 import streamlit as st
 from pathlib import Path
 
-from src.parsers.insights_parser import parse_insights_files
+from src.parsers.insights_parser import (
+    BEST_POSTS_FILE,
+    WORST_POSTS_FILE,
+    compare_exports,
+    parse_exports,
+    summarize_exports,
+)
 from src.components.insight_cards import (
     render_comparison_metric,
     render_comparison_metric_text,
@@ -16,8 +22,43 @@ from src.components.insight_cards import (
     render_posts_table,
     render_recommendation_card,
 )
+from src.utils.profiler import profiled
+
+
+def render_export_picker(exports: dict[str, dict]) -> tuple[str, str]:
+    """
+    Pick the pair of exports to compare.
+
+    With only the two default exports in data/ nothing is rendered. With
+    more (several accounts or competitors), two selectors choose the pair and
+    an expander lists the averages of every export.
+
+    Args:
+        exports: Result of parse_exports().
+
+    Returns:
+        (best_name, worst_name) file names.
+    """
+    names = list(exports)
+    if len(names) <= 2:
+        return BEST_POSTS_FILE, WORST_POSTS_FILE
+
+    best_default = names.index(BEST_POSTS_FILE) if BEST_POSTS_FILE in exports else 0
+    worst_default = names.index(WORST_POSTS_FILE) if WORST_POSTS_FILE in exports else 1
+
+    col1, col2 = st.columns(2)
+    with col1:
+        best_name = st.selectbox("Exportacion de referencia (mejores)", names, index=best_default)
+    with col2:
+        worst_name = st.selectbox("Exportacion a comparar (peores)", names, index=worst_default)
+
+    with st.expander(f"Resumen de las {len(names)} exportaciones", expanded=False):
+        st.dataframe(summarize_exports(exports), hide_index=True)
+
+    return best_name, worst_name
 
 
+@profiled
 def render_insights(data_dir: Path) -> None:
     """
     Render the insights page.
@@ -25,8 +66,10 @@ def render_insights(data_dir: Path) -> None:
     Args:
         data_dir: Path to the data directory containing Excel files.
     """
-    # Parse insights data
-    data = parse_insights_files(data_dir)
+    # Parse every export in data/ (in parallel when several are new)
+    exports = parse_exports(data_dir)
+    best_name, worst_name = render_export_picker(exports)
+    data = compare_exports(exports, best_name, worst_name)
 
     best_posts = data.get("best_posts", {})
     worst_posts = data.get("worst_posts", {})
@@ -0,0 +1,221 @@
+"""
+Process-wide parse cache shared by every page.
+Parsed documents are keyed on (path, mtime, size, content hash) so a rerun
+only re-parses a file when it actually changed on disk.
+"""
+
+import functools
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# (parser name, resolved path) -> entry dict with mtime_ns, size, digest, value
+_CACHE: dict[tuple[str, str], dict] = {}
+# parser name -> uncached parse function, so a file can be re-parsed by path
+_PARSERS: dict[str, Callable[[Path], Any]] = {}
+_STATS = {"hits": 0, "misses": 0, "evictions": 0}
+_LOCK = threading.Lock()
+
+
+def file_digest(data: bytes) -> str:
+    """Return the content hash used to identify a file version."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def parser_name(parser: Callable[[Path], Any]) -> str:
+    """Return the name a parse function is cached (and snapshotted) under."""
+    return f"{parser.__module__}.{parser.__qualname__}"
+
+
+def lookup_cached(parser: Callable[[Path], Any], file_path: Path) -> tuple[bool, Any]:
+    """
+    Look a file up in the cache without parsing it.
+
+    The (mtime, size) pair is checked first so an unchanged file costs a
+    single stat. If they differ, the content hash decides whether the file
+    really changed (e.g. a touch or a checkout that rewrote the same bytes).
+
+    Args:
+        parser: Uncached parse function taking the file path.
+        file_path: Path to the source document.
+
+    Returns:
+        (True, value) on a hit. On a miss, (False, ticket) where the ticket
+        must be handed to store_cached() along with the freshly parsed value.
+    """
+    try:
+        stat = file_path.stat()
+    except OSError:
+        # Missing files fall back to the parser's own defaults
+        return False, None
+
+    key = (parser_name(parser), str(file_path.resolve()))
+
+    with _LOCK:
+        _PARSERS.setdefault(key[0], parser)
+        entry = _CACHE.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            _STATS["hits"] += 1
+            return True, entry["value"]
+
+    digest = file_digest(file_path.read_bytes())
+
+    with _LOCK:
+        entry = _CACHE.get(key)
+        if entry and entry["digest"] == digest:
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry["size"] = stat.st_size
+            _STATS["hits"] += 1
+            return True, entry["value"]
+
+    return False, (key, stat, digest)
+
+
+def store_cached(ticket: Optional[tuple], value: Any) -> None:
+    """
+    Store a parsed value for the file version described by a lookup ticket.
+
+    Args:
+        ticket: Second item returned by a missed lookup_cached() call.
+        value: The parsed value.
+    """
+    if ticket is None:
+        return
+
+    key, stat, digest = ticket
+    with _LOCK:
+        if key in _CACHE:
+            _STATS["evictions"] += 1
+        _CACHE[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "digest": digest,
+            "value": value,
+        }
+        _STATS["misses"] += 1
+
+
+def get_cached(parser: Callable[[Path], Any], file_path: Path) -> Any:
+    """
+    Return the parsed value for a file, parsing it only if it changed.
+
+    Args:
+        parser: Uncached parse function taking the file path.
+        file_path: Path to the source document.
+
+    Returns:
+        The parsed value. It is shared across sessions and must not be mutated.
+    """
+    hit, value = lookup_cached(parser, file_path)
+    if hit:
+        return value
+
+    parsed = parser(file_path)
+    store_cached(value, parsed)
+    return parsed
+
+
+def seed_cached(parser: Callable[[Path], Any], file_path: Path, digest: str, value: Any) -> bool:
+    """
+    Store a value parsed elsewhere (e.g. a prebuilt snapshot) for a file.
+
+    The value is only used if the file on disk still hashes to digest.
+
+    Args:
+        parser: Uncached parse function the value came from.
+        file_path: Path to the source document.
+        digest: file_digest() of the source the value was parsed from.
+        value: The parsed value.
+
+    Returns:
+        True if the entry was stored, False if the file is missing or changed.
+    """
+    try:
+        stat = file_path.stat()
+        if file_digest(file_path.read_bytes()) != digest:
+            return False
+    except OSError:
+        return False
+
+    key = (parser_name(parser), str(file_path.resolve()))
+    with _LOCK:
+        _PARSERS.setdefault(key[0], parser)
+        _CACHE[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "digest": digest,
+            "value": value,
+        }
+    return True
+
+
+def export_cached() -> list[dict]:
+    """
+    Get every cached document, e.g. to write a snapshot.
+
+    Returns:
+        List of dicts with parser (parser_name()), path, digest and value.
+    """
+    with _LOCK:
+        return [
+            {"parser": name, "path": path, "digest": entry["digest"], "value": entry["value"]}
+            for (name, path), entry in _CACHE.items()
+        ]
+
+
+def refresh_cached(file_path: Path) -> int:
+    """
+    Re-parse every cached document read from a file that changed on disk.
+
+    Each parser runs outside the lock and its result replaces the old entry
+    in one assignment, so a concurrent rerun sees either the old or the new
+    value, never a partial one. Unchanged files cost a hash and no parse.
+
+    Args:
+        file_path: Path of the file that changed.
+
+    Returns:
+        Number of cached parsers the file was refreshed for.
+    """
+    resolved = str(file_path.resolve())
+    with _LOCK:
+        parsers = [_PARSERS[name] for name, path in _CACHE if path == resolved]
+
+    for parser in parsers:
+        get_cached(parser, file_path)
+
+    return len(parsers)
+
+
+def cached_parser(func: Callable[[Path], Any]) -> Callable[[Path], Any]:
+    """
+    Decorate a ``parse_*_file`` function so its results go through the cache.
+
+    The undecorated function stays reachable as ``func.uncached``.
+    """
+    @functools.wraps(func)
+    def wrapper(file_path: Path) -> Any:
+        return get_cached(func, file_path)
+
+    wrapper.uncached = func
+    return wrapper
+
+
+def get_cache_stats() -> dict:
+    """
+    Get hit/miss counters for the parse cache.
+
+    Returns:
+        dict with hits, misses, evictions and entries.
+    """
+    with _LOCK:
+        return {**_STATS, "entries": len(_CACHE)}
+
+
+def clear_parse_cache() -> None:
+    """Drop every cached document and reset the counters."""
+    with _LOCK:
+        _CACHE.clear()
+        for name in _STATS:
+            _STATS[name] = 0
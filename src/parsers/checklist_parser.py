@@ -3,11 +3,37 @@ Parser for the checklist markdown file.
 Extracts structured task data from markdown tables and lists.
 """
 
+import hashlib
 import re
+import unicodedata
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
+from src.parsers.cache import cached_parser
+from src.parsers.markdown_outline import iter_sections, parse_outline
+from src.parsers.markdown_table import read_section_tables
+from src.utils.profiler import profiled
 
+
+# Precompiled heading and line patterns used by the tokenizer
+WEEK_PATTERN = re.compile(r"^(SEMANA \d+[^#]*)", re.IGNORECASE)
+SUMMARY_PATTERN = re.compile(r"Resumen Semana (\d+)\s*$")
+IDEAS_PATTERN = re.compile(r"^IDEAS DE CONTENIDO", re.IGNORECASE)
+TABLE_TASK_PATTERN = re.compile(r"\|\s*\[([ xX])\]\s*(.+?)\s*\|\s*(\d+\w+)?\s*\|")
+LOOSE_TASK_PATTERN = re.compile(r"^-?\s*\[([ xX])\]\s*(.+)$")
+TRAILING_CELLS_PATTERN = re.compile(r"\s*\|.*$")
+
+# Level-3 headers that are sections, not days
+NON_DAY_HEADERS = ["resumen", "metricas", "preguntas", "notas"]
+
+# Index keys: "semana 3" and unaccented weekday names
+WEEK_KEY_PATTERN = re.compile(r"semana\s+(\d+)", re.IGNORECASE)
+WEEKDAY_PATTERN = re.compile(r"[a-z]+")
+WEEKDAYS = ["lunes", "martes", "miercoles", "jueves", "viernes", "sabado", "domingo"]
+
+
+@profiled
+@cached_parser
 def parse_checklist_file(file_path: Path) -> dict:
     """
     Parse the entire checklist file and return structured data.
@@ -19,95 +45,322 @@ def parse_checklist_file(file_path: Path) -> dict:
         dict with keys: tasks, weeks, summary, ideas
     """
     if not file_path.exists():
-        return {"tasks": [], "weeks": {}, "summary": {}, "ideas": []}
+        return {
+            "tasks": [],
+            "weeks": {},
+            "summary": {},
+            "ideas": [],
+            "index": build_task_index([]),
+        }
 
     content = file_path.read_text(encoding="utf-8")
 
-    return {
-        "tasks": parse_tasks(content),
-        "weeks": group_tasks_by_week(parse_tasks(content)),
-        "summary": parse_summary_metrics(content),
-        "ideas": parse_ideas_bank(content),
-    }
+    return build_checklist(content)
 
 
-def parse_tasks(content: str) -> list[dict]:
+def tokenize_checklist(outline: dict) -> Iterator[tuple]:
     """
-    Parse all tasks from the checklist content.
+    Walk the checklist outline once and yield one token per meaningful line.
+
+    Headings come from the outline; body lines are dispatched on their first
+    characters to a single precompiled pattern, so the cost is one regex
+    match per line.
+
+    Args:
+        outline: Result of parse_outline() for the checklist.
+
+    Yields:
+        Tuples of the form:
+            ("week", name)
+            ("day", name)
+            ("task", done, text, time)
+            ("summary", week_number)
+            ("summary_row", metric, value)
+            ("idea_category", name)
+            ("idea", text)
+    """
+    in_ideas = False
+    in_category = False
+
+    for section in iter_sections(outline):
+        header = section["title"]
+
+        if section["level"] == 3:
+            summary_match = SUMMARY_PATTERN.match(header)
+            if summary_match:
+                yield ("summary", summary_match.group(1))
+                # | Metrica | Objetivo | rows, header and alignment rows excluded
+                for table in read_section_tables(section):
+                    for row in table["rows"]:
+                        if len(row) >= 2:
+                            yield ("summary_row", row[0], row[1])
+            # Skip headers that aren't days
+            if not any(skip in header.lower() for skip in NON_DAY_HEADERS):
+                yield ("day", header)
+            if in_ideas:
+                in_category = True
+                yield ("idea_category", header)
+        elif section["level"] == 2:
+            in_ideas = bool(IDEAS_PATTERN.match(header))
+            in_category = False
+
+            # Detect week headers: ## SEMANA 1: ...
+            week_match = WEEK_PATTERN.match(header)
+            if week_match:
+                yield ("week", week_match.group(1).strip())
+
+        for line in section["lines"]:
+            if line.startswith("---"):
+                in_ideas = False
+                in_category = False
+                continue
+
+            if line.startswith("|"):
+                # Parse table rows: | [ ] Task text | time | status |
+                table_task = TABLE_TASK_PATTERN.match(line)
+                if table_task:
+                    task_text = table_task.group(2).strip()
+
+                    # Clean up task text (remove trailing | and other artifacts)
+                    if "|" in task_text:
+                        task_text = TRAILING_CELLS_PATTERN.sub("", task_text).strip()
+
+                    if task_text and not task_text.startswith("-"):
+                        yield (
+                            "task",
+                            table_task.group(1).lower() == "x",
+                            task_text,
+                            table_task.group(3) or "",
+                        )
+                continue
+
+            # Parse standalone checkboxes: - [ ] Task text
+            loose_task = LOOSE_TASK_PATTERN.match(line)
+            if loose_task:
+                is_done = loose_task.group(1).lower() == "x"
+                task_text = loose_task.group(2).strip()
+
+                # Skip if it's a table row or metadata
+                if "|" not in task_text and task_text:
+                    yield ("task", is_done, task_text, "")
+
+                if in_category and not is_done and line.startswith("-"):
+                    yield ("idea", task_text)
+
+
+def build_checklist(content: str) -> dict:
+    """
+    Build tasks, weeks, summary and ideas from a single token stream.
 
     Args:
         content: Raw markdown content.
 
     Returns:
-        List of task dictionaries with keys: id, week, day, text, time, done
+        dict with keys: tasks, weeks, summary, ideas, index
     """
     tasks = []
+    weeks = {}
+    summaries = {}
+    ideas = []
+
     current_week = ""
     current_day = ""
-    task_id = 0
+    metrics = {}
+    items = []
+    seen_ids = set()
+
+    for token in tokenize_checklist(parse_outline(content)):
+        kind = token[0]
+
+        if kind == "task":
+            _, is_done, task_text, time_estimate = token
+            task_id = make_task_id(current_week, current_day, task_text)
+            # Same text twice under one day: number the repeats in order
+            repeat = 1
+            while task_id in seen_ids:
+                repeat += 1
+                task_id = make_task_id(current_week, current_day, task_text, repeat)
+            seen_ids.add(task_id)
+
+            task = {
+                "id": task_id,
+                "week": current_week,
+                "day": current_day,
+                "text": task_text,
+                "time": time_estimate,
+                "done": is_done,
+            }
+            tasks.append(task)
+
+            week = weeks.setdefault(current_week or "Sin semana", {})
+            week.setdefault(current_day or "General", []).append(task)
+        elif kind == "day":
+            current_day = token[1]
+        elif kind == "week":
+            current_week = token[1]
+        elif kind == "summary":
+            metrics = {}
+            summaries[f"Semana {token[1]}"] = metrics
+        elif kind == "summary_row":
+            _, metric, value = token
+            if metric and value:
+                metrics[metric] = value
+        elif kind == "idea_category":
+            items = []
+            ideas.append({"category": token[1], "items": items})
+        elif kind == "idea" and token[1]:
+            items.append(token[1])
 
-    lines = content.split("\n")
+    return {
+        "tasks": tasks,
+        "weeks": weeks,
+        "summary": summaries,
+        "ideas": [idea for idea in ideas if idea["items"]],
+        "index": build_task_index(tasks),
+    }
 
-    for line in lines:
-        # Detect week headers: ## SEMANA 1: ...
-        week_match = re.match(r"^## (SEMANA \d+[^#]*)", line, re.IGNORECASE)
-        if week_match:
-            current_week = week_match.group(1).strip()
-            continue
 
-        # Detect day headers: ### Lunes - ...
-        day_match = re.match(r"^### (.+)", line)
-        if day_match:
-            day_text = day_match.group(1).strip()
-            # Skip headers that aren't days
-            if not any(skip in day_text.lower() for skip in ["resumen", "metricas", "preguntas", "notas"]):
-                current_day = day_text
-            continue
-
-        # Parse table rows: | [ ] Task text | time | status |
-        table_task = re.match(
-            r"\|\s*\[([ xX])\]\s*(.+?)\s*\|\s*(\d+\w+)?\s*\|",
-            line
-        )
-        if table_task:
-            is_done = table_task.group(1).lower() == "x"
-            task_text = table_task.group(2).strip()
-            time_estimate = table_task.group(3) or ""
-
-            # Clean up task text (remove trailing | and other artifacts)
-            task_text = re.sub(r"\s*\|.*$", "", task_text).strip()
-
-            if task_text and not task_text.startswith("-"):
-                tasks.append({
-                    "id": f"task_{task_id}",
-                    "week": current_week,
-                    "day": current_day,
-                    "text": task_text,
-                    "time": time_estimate,
-                    "done": is_done,
-                })
-                task_id += 1
-            continue
-
-        # Parse standalone checkboxes: - [ ] Task text
-        loose_task = re.match(r"^-?\s*\[([ xX])\]\s*(.+)$", line)
-        if loose_task:
-            is_done = loose_task.group(1).lower() == "x"
-            task_text = loose_task.group(2).strip()
-
-            # Skip if it's a table row or metadata
-            if "|" not in task_text and task_text:
-                tasks.append({
-                    "id": f"task_{task_id}",
-                    "week": current_week,
-                    "day": current_day,
-                    "text": task_text,
-                    "time": "",
-                    "done": is_done,
-                })
-                task_id += 1
-
-    return tasks
+# =============================================================================
+# TASK IDS
+# =============================================================================
+
+def make_task_id(week: str, day: str, text: str, repeat: int = 1) -> str:
+    """
+    Derive a stable task id from its week, day and text.
+
+    Ids don't depend on the task's position, so adding or removing a line
+    elsewhere in the checklist keeps every other task's saved progress.
+
+    Args:
+        week: Week name the task is under.
+        day: Day header the task is under.
+        text: Task text.
+        repeat: 2, 3... for repeated identical tasks under the same day.
+
+    Returns:
+        "task_" followed by 10 hex characters.
+    """
+    key = "\x1f".join([
+        normalize_week(week),
+        normalize_weekday(day) or " ".join(day.casefold().split()),
+        " ".join(text.casefold().split()),
+        str(repeat),
+    ])
+    return f"task_{hashlib.blake2b(key.encode('utf-8'), digest_size=5).hexdigest()}"
+
+
+def get_legacy_task_ids(tasks: list[dict]) -> dict[str, str]:
+    """
+    Map the positional ids used by older versions (task_0, task_1...) to
+    the current ids, for migrating saved progress.
+
+    Args:
+        tasks: List of task dictionaries in document order.
+
+    Returns:
+        dict of legacy id -> task id.
+    """
+    return {f"task_{position}": task["id"] for position, task in enumerate(tasks)}
+
+
+# =============================================================================
+# TASK INDEX
+# =============================================================================
+
+def normalize_week(week_name: str) -> str:
+    """
+    Get the index key of a week name.
+
+    Args:
+        week_name: "SEMANA 1: Reset y Primeros Reels", "Semana 1" or "semana 1".
+
+    Returns:
+        "semana <n>" when the name has a week number, else the lowercased name.
+    """
+    week_match = WEEK_KEY_PATTERN.search(week_name)
+    if week_match:
+        return f"semana {int(week_match.group(1))}"
+    return week_name.strip().lower()
+
+
+def normalize_weekday(day_name: str) -> Optional[str]:
+    """
+    Get the weekday of a day header, without accents.
+
+    Args:
+        day_name: "Miércoles - Crear y Publicar Reel #1", "Sabado", "lunes"...
+
+    Returns:
+        One of WEEKDAYS, or None if the header doesn't start with a weekday.
+    """
+    plain = unicodedata.normalize("NFKD", day_name.strip().lower())
+    plain = plain.encode("ascii", "ignore").decode("ascii")
+    day_match = WEEKDAY_PATTERN.match(plain)
+    if day_match and day_match.group(0) in WEEKDAYS:
+        return day_match.group(0)
+    return None
+
+
+def build_task_index(tasks: list[dict]) -> dict:
+    """
+    Index tasks by id, week and weekday in one pass.
+
+    Args:
+        tasks: List of task dictionaries.
+
+    Returns:
+        dict with keys:
+            by_id: task id -> task
+            by_week: normalize_week() key -> task ids, in document order
+            by_weekday: normalize_weekday() key -> task ids, in document order
+            week_totals: normalize_week() key -> number of tasks
+    """
+    by_id = {}
+    by_week = {}
+    by_weekday = {}
+
+    for task in tasks:
+        task_id = task["id"]
+        by_id[task_id] = task
+        by_week.setdefault(normalize_week(task.get("week", "")), []).append(task_id)
+
+        weekday = normalize_weekday(task.get("day", ""))
+        if weekday:
+            by_weekday.setdefault(weekday, []).append(task_id)
+
+    return {
+        "by_id": by_id,
+        "by_week": by_week,
+        "by_weekday": by_weekday,
+        "week_totals": {week: len(ids) for week, ids in by_week.items()},
+    }
+
+
+def get_week_task_ids(index: dict, week_name: str) -> list[str]:
+    """
+    Get the ids of a week's tasks.
+
+    Args:
+        index: Result of build_task_index().
+        week_name: Full week name or "semana <n>".
+
+    Returns:
+        Task ids in document order.
+    """
+    return index["by_week"].get(normalize_week(week_name), [])
+
+
+def parse_tasks(content: str) -> list[dict]:
+    """
+    Parse all tasks from the checklist content.
+
+    Args:
+        content: Raw markdown content.
+
+    Returns:
+        List of task dictionaries with keys: id, week, day, text, time, done
+    """
+    return build_checklist(content)["tasks"]
 
 
 def group_tasks_by_week(tasks: list[dict]) -> dict[str, dict[str, list[dict]]]:
@@ -146,30 +399,7 @@ def parse_summary_metrics(content: str) -> dict:
     Returns:
         Dict with weekly objectives and targets.
     """
-    summaries = {}
-
-    # Find week summary sections
-    summary_pattern = r"### Resumen Semana (\d+)\s*\n(.*?)(?=\n##|\n---|\Z)"
-    matches = re.findall(summary_pattern, content, re.DOTALL)
-
-    for week_num, section in matches:
-        metrics = {}
-
-        # Parse table rows in summary
-        metric_rows = re.findall(
-            r"\|\s*(.+?)\s*\|\s*(.+?)\s*\|",
-            section
-        )
-
-        for metric, value in metric_rows:
-            metric = metric.strip()
-            value = value.strip()
-            if metric and value and metric.lower() not in ["metrica", "---"]:
-                metrics[metric] = value
-
-        summaries[f"Semana {week_num}"] = metrics
-
-    return summaries
+    return build_checklist(content)["summary"]
 
 
 def parse_ideas_bank(content: str) -> list[dict]:
@@ -182,75 +412,51 @@ def parse_ideas_bank(content: str) -> list[dict]:
     Returns:
         List of idea groups with categories and items.
     """
-    ideas = []
-
-    # Find ideas section
-    ideas_match = re.search(
-        r"## IDEAS DE CONTENIDO.*?\n(.*?)(?=\n##|\n---|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-
-    if not ideas_match:
-        return ideas
-
-    ideas_section = ideas_match.group(1)
-
-    # Parse categories (### headers)
-    category_pattern = r"###\s*(.+?)\s*\n(.*?)(?=\n###|\Z)"
-    categories = re.findall(category_pattern, ideas_section, re.DOTALL)
-
-    for category, items_text in categories:
-        items = []
+    return build_checklist(content)["ideas"]
 
-        # Parse checkbox items
-        item_matches = re.findall(r"-\s*\[\s*\]\s*(.+?)(?=\n|$)", items_text)
-        items.extend([item.strip() for item in item_matches if item.strip()])
 
-        if items:
-            ideas.append({
-                "category": category.strip(),
-                "items": items,
-            })
-
-    return ideas
-
-
-def get_today_tasks(tasks: list[dict], day_name: Optional[str] = None) -> list[dict]:
+def get_today_tasks(
+    tasks: list[dict],
+    day_name: Optional[str] = None,
+    index: Optional[dict] = None,
+    week_name: Optional[str] = None,
+) -> list[dict]:
     """
     Get tasks for today or a specific day.
 
     Args:
         tasks: List of all tasks.
         day_name: Optional specific day (e.g., "Lunes"). If None, uses current day.
+        index: Task index from the parsed checklist. Built from tasks if None.
+        week_name: Optional week to restrict the result to (e.g., "semana 1").
 
     Returns:
         List of tasks for the specified day.
     """
     import datetime
 
+    if index is None:
+        index = build_task_index(tasks)
+
     if day_name is None:
-        # Get Spanish day name
-        day_names_es = {
-            0: "lunes",
-            1: "martes",
-            2: "miercoles",
-            3: "jueves",
-            4: "viernes",
-            5: "sabado",
-            6: "domingo",
-        }
-        day_name = day_names_es.get(datetime.datetime.now().weekday(), "lunes")
+        day_name = WEEKDAYS[datetime.datetime.now().weekday()]
+
+    task_ids = index["by_weekday"].get(normalize_weekday(day_name) or "", [])
 
-    day_name_lower = day_name.lower()
+    if week_name is not None:
+        week_ids = set(get_week_task_ids(index, week_name))
+        task_ids = [task_id for task_id in task_ids if task_id in week_ids]
 
-    return [
-        task for task in tasks
-        if task.get("day", "").lower().startswith(day_name_lower)
-    ]
+    by_id = index["by_id"]
+    return [by_id[task_id] for task_id in task_ids]
 
 
-def calculate_week_progress(tasks: list[dict], state: dict, week_name: str) -> dict:
+def calculate_week_progress(
+    tasks: list[dict],
+    state: dict,
+    week_name: str,
+    index: Optional[dict] = None,
+) -> dict:
     """
     Calculate progress statistics for a specific week.
 
@@ -258,13 +464,20 @@ def calculate_week_progress(tasks: list[dict], state: dict, week_name: str) -> d
         tasks: List of all tasks.
         state: Current completion state dict.
         week_name: Name of the week to calculate for.
+        index: Task index from the parsed checklist. Built from tasks if None.
 
     Returns:
         Dict with total, completed, pending, percentage.
     """
-    week_tasks = [t for t in tasks if week_name.lower() in t.get("week", "").lower()]
-    total = len(week_tasks)
-    completed = sum(1 for t in week_tasks if state.get(t["id"], t.get("done", False)))
+    if index is None:
+        index = build_task_index(tasks)
+
+    by_id = index["by_id"]
+    week_ids = get_week_task_ids(index, week_name)
+    total = len(week_ids)
+    completed = sum(
+        1 for task_id in week_ids if state.get(task_id, by_id[task_id].get("done", False))
+    )
 
     return {
         "total": total,
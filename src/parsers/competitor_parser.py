@@ -7,7 +7,20 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from src.parsers.cache import cached_parser
+from src.parsers.markdown_outline import find_list, find_section, parse_outline
+from src.utils.profiler import profiled
 
+# Value cell of the "Seguidores" row: "~500,000", "292,000", "76K"
+FOLLOWERS_PATTERN = re.compile(r"[~]?(\d+(?:,\d+)?(?:K|\.?\d+)?)", re.IGNORECASE)
+# Leading label of a business model item: "**Rental Mode**: ..."
+MODEL_LABEL_PATTERN = re.compile(r"^\*\*[^*]+\*\*:\s*")
+# Opportunity list item: **Title** — description
+OPPORTUNITY_PATTERN = re.compile(r"\**(.+?)\**\s*[-—]\s*(.+)")
+
+
+@profiled
+@cached_parser
 def parse_competitor_file(file_path: Path) -> dict:
     """
     Parse the entire competitor analysis file.
@@ -26,20 +39,21 @@ def parse_competitor_file(file_path: Path) -> dict:
         }
 
     content = file_path.read_text(encoding="utf-8")
+    outline = parse_outline(content)
 
     return {
-        "competitors": parse_competitors(content),
-        "opportunities": parse_opportunities(content),
-        "recommendations": parse_recommendations(content),
+        "competitors": parse_competitors(outline),
+        "opportunities": parse_opportunities(outline),
+        "recommendations": parse_recommendations(outline),
     }
 
 
-def parse_competitors(content: str) -> list[dict]:
+def parse_competitors(outline: dict) -> list[dict]:
     """
     Parse individual competitor profiles.
 
     Args:
-        content: Raw markdown content.
+        outline: Result of parse_outline() for the competitor analysis.
 
     Returns:
         List of competitor dictionaries.
@@ -58,20 +72,18 @@ def parse_competitors(content: str) -> list[dict]:
     ]
 
     for name, handle, initials in competitor_sections:
-        # Find the section for this competitor
-        section_pattern = rf"###.*?{name}.*?\n(.*?)(?=\n###|\n##|\Z)"
-        match = re.search(section_pattern, content, re.DOTALL | re.IGNORECASE)
-
-        if match:
-            section = match.group(1)
-
-            # Extract followers
-            followers_match = re.search(
-                r"Seguidores\s*\|\s*[~]?(\d+(?:,\d+)?(?:K|\.?\d+)?)",
-                section,
-                re.IGNORECASE
-            )
-            followers = followers_match.group(1) if followers_match else "?"
+        # Find the section for this competitor under "2. Analisis Individual"
+        section = find_section(outline, "2", name)
+
+        if section:
+            # Extract followers from the | Seguidores | value | row
+            followers = "?"
+            for row in (row for table in section["tables"] for row in table):
+                if len(row) >= 2 and row[0].replace("**", "").lower() == "seguidores":
+                    followers_match = FOLLOWERS_PATTERN.match(row[1])
+                    if followers_match:
+                        followers = followers_match.group(1)
+                    break
 
             # Format followers
             if followers and followers != "?":
@@ -79,27 +91,17 @@ def parse_competitors(content: str) -> list[dict]:
                 if followers.isdigit() and int(followers) >= 1000:
                     followers = f"{int(int(followers) / 1000)}K"
 
-            # Extract business model (look for Modelo de negocio section)
-            model_match = re.search(
-                r"Modelo de negocio.*?[-\*]\s*(.+?)(?=\n[-\*]|\n\*\*|\n##|\Z)",
-                section,
-                re.DOTALL | re.IGNORECASE
-            )
-            model = model_match.group(1).strip() if model_match else "Contenido + Patrocinios"
+            # Extract business model (first item under **Modelo de negocio**)
+            model_items = find_list(section, "Modelo de negocio")
+            model = model_items[0] if model_items else "Contenido + Patrocinios"
 
-            # Clean up model text
-            model = re.sub(r"\*\*.*?\*\*:?\s*", "", model)
-            model = model.split("\n")[0].strip()[:50]
+            # Clean up model text: drop a leading "**Label**:" and bold markers
+            model = MODEL_LABEL_PATTERN.sub("", model).replace("**", "")
+            model = model.strip()[:50]
 
             # Extract differentiator from strengths
-            diff_match = re.search(
-                r"Fortalezas.*?[-\*]\s*(.+?)(?=\n[-\*]|\n\*\*|\n##|\Z)",
-                section,
-                re.DOTALL | re.IGNORECASE
-            )
-            differentiator = diff_match.group(1).strip() if diff_match else None
-            if differentiator:
-                differentiator = differentiator.split("\n")[0].strip()[:60]
+            strengths = find_list(section, "Fortalezas")
+            differentiator = strengths[0].strip()[:60] if strengths else None
 
             competitors.append({
                 "name": name.title(),
@@ -191,12 +193,12 @@ def get_default_competitors() -> list[dict]:
     ]
 
 
-def parse_opportunities(content: str) -> list[dict]:
+def parse_opportunities(outline: dict) -> list[dict]:
     """
     Parse market opportunities and gaps.
 
     Args:
-        content: Raw markdown content.
+        outline: Result of parse_outline() for the competitor analysis.
 
     Returns:
         List of opportunity dictionaries.
@@ -204,26 +206,17 @@ def parse_opportunities(content: str) -> list[dict]:
     opportunities = []
 
     # Find opportunities section
-    opp_section = re.search(
-        r"Gaps y oportunidades.*?\n(.*?)(?=\n##|\Z)",
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
+    opp_section = find_section(outline, "Gaps y oportunidades")
 
     if opp_section:
-        section = opp_section.group(1)
-
-        # Parse numbered items
-        items = re.findall(
-            r"\d+\.\s*\**(.+?)\**\s*[-—]\s*(.+?)(?=\n\d+\.|\n\*\*|\Z)",
-            section
-        )
-
-        for title, description in items:
-            opportunities.append({
-                "title": title.strip(),
-                "description": description.strip(),
-            })
+        # Parse list items: **Title** — description
+        for item in opp_section["items"]:
+            item_match = OPPORTUNITY_PATTERN.fullmatch(item)
+            if item_match:
+                opportunities.append({
+                    "title": item_match.group(1).strip(),
+                    "description": item_match.group(2).strip(),
+                })
 
     # Default opportunities if parsing failed
     if not opportunities:
@@ -263,12 +256,12 @@ def get_default_opportunities() -> list[dict]:
     ]
 
 
-def parse_recommendations(content: str) -> list[dict]:
+def parse_recommendations(outline: dict) -> list[dict]:
     """
     Parse strategic recommendations.
 
     Args:
-        content: Raw markdown content.
+        outline: Result of parse_outline() for the competitor analysis.
 
     Returns:
         List of recommendation dictionaries grouped by timeframe.
@@ -276,15 +269,9 @@ def parse_recommendations(content: str) -> list[dict]:
     recommendations = []
 
     # Find recommendations section
-    rec_section = re.search(
-        r"## 6\. Recomendaciones.*?\n(.*?)(?=\n##|\Z)",
-        content,
-        re.DOTALL
-    )
+    rec_section = find_section(outline, "6. Recomendaciones")
 
     if rec_section:
-        section = rec_section.group(1)
-
         # Parse by timeframe
         timeframes = [
             ("Corto plazo", "meses 1-3"),
@@ -293,17 +280,13 @@ def parse_recommendations(content: str) -> list[dict]:
         ]
 
         for title, duration in timeframes:
-            pattern = rf"###.*?{title}.*?\n(.*?)(?=\n###|\Z)"
-            match = re.search(pattern, section, re.DOTALL | re.IGNORECASE)
+            match = find_section(outline, "6. Recomendaciones", title)
 
             if match:
-                items_text = match.group(1)
-                items = re.findall(r"-\s*\[\s*\]\s*(.+?)(?=\n-|\Z)", items_text)
-
                 recommendations.append({
                     "timeframe": title,
                     "duration": duration,
-                    "items": [item.strip() for item in items if item.strip()],
+                    "items": [item.strip() for item in match["items"] if item.strip()],
                 })
 
     return recommendations
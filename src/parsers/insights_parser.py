@@ -3,27 +3,70 @@ Parser for Instagram posts insights Excel files.
 Extracts metrics from best and worst performing posts.
 """
 
-import pandas as pd
+import re
+import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+from src.parsers.cache import cached_parser, file_digest, lookup_cached, store_cached
+from src.utils.profiler import profiled
 
-def parse_insights_files(data_dir: Path) -> dict:
+# pandas (plus numpy and openpyxl through read_excel) takes ~0.4 s to import,
+# so it is imported inside the functions that need it: app startup and every
+# page but Insights never load it. Same for the process pool (multiprocessing).
+if TYPE_CHECKING:
+    import pandas as pd
+
+BEST_POSTS_FILE = "10 mejores publicaciones 2025.xlsx"
+WORST_POSTS_FILE = "10 peores publicaciones 2025.xlsx"
+
+# Below this many uncached exports, parsing inline beats starting a pool
+PARALLEL_MIN_FILES = 3
+
+# Columnar copies of the Excel exports, keyed by the workbook's content hash
+INGEST_CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "insights"
+
+HASHTAG_PATTERN = r"#(\w+)"
+
+# Last cold (Excel) and warm (Parquet) load time per workbook, in seconds
+INGEST_TIMINGS: dict[str, dict[str, float]] = {}
+
+
+@profiled
+def parse_insights_files(
+    data_dir: Path,
+    best_name: str = BEST_POSTS_FILE,
+    worst_name: str = WORST_POSTS_FILE,
+) -> dict:
     """
     Parse both best and worst posts Excel files.
 
     Args:
         data_dir: Path to the data directory containing the Excel files.
+        best_name: File name of the export used as the "best" side.
+        worst_name: File name of the export used as the "worst" side.
 
     Returns:
         dict with keys: best_posts, worst_posts, comparison, levers
     """
-    best_path = data_dir / "10 mejores publicaciones 2025.xlsx"
-    worst_path = data_dir / "10 peores publicaciones 2025.xlsx"
+    best_posts = parse_posts_file(data_dir / best_name)
+    worst_posts = parse_posts_file(data_dir / worst_name)
+
+    return build_insights(best_posts, worst_posts)
+
+
+def build_insights(best_posts: Optional[dict], worst_posts: Optional[dict]) -> dict:
+    """
+    Build the insights structure for a pair of parsed exports.
 
-    best_posts = parse_posts_file(best_path)
-    worst_posts = parse_posts_file(worst_path)
+    Args:
+        best_posts: Parsed "best" export (see parse_posts_file).
+        worst_posts: Parsed "worst" export.
 
+    Returns:
+        dict with keys: best_posts, worst_posts, comparison, levers.
+        Defaults if either export is missing.
+    """
     if not best_posts or not worst_posts:
         return get_default_insights()
 
@@ -38,6 +81,119 @@ def parse_insights_files(data_dir: Path) -> dict:
     }
 
 
+# =============================================================================
+# MULTI-EXPORT ENGINE
+# =============================================================================
+
+def discover_exports(data_dir: Path) -> list[Path]:
+    """
+    Find every posts export in the data directory.
+
+    Args:
+        data_dir: Path to the data directory.
+
+    Returns:
+        Sorted list of .xlsx paths, skipping Office lock files ("~$...").
+    """
+    if not data_dir.is_dir():
+        return []
+    return sorted(p for p in data_dir.glob("*.xlsx") if not p.name.startswith("~$"))
+
+
+@profiled
+def parse_exports(data_dir: Path, max_workers: Optional[int] = None) -> dict[str, dict]:
+    """
+    Parse every export in the data directory, in parallel.
+
+    Exports already in the parse cache are reused. The rest are parsed in a
+    process pool (one workbook per task) and stored in the parse cache, so
+    runtime grows with files per core rather than with the number of files.
+
+    Args:
+        data_dir: Path to the data directory.
+        max_workers: Pool size (defaults to the number of CPUs). 1 parses inline.
+
+    Returns:
+        dict: {file name: parsed export} in file name order. Exports that
+        fail to parse are left out.
+    """
+    parser = parse_posts_file.uncached
+    parsed = {}
+    pending = []
+
+    for path in discover_exports(data_dir):
+        hit, value = lookup_cached(parser, path)
+        if hit:
+            parsed[path.name] = value
+        else:
+            pending.append((path, value))
+
+    paths = [path for path, _ in pending]
+    if len(pending) < PARALLEL_MIN_FILES or max_workers == 1:
+        results = map(parser, paths)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(parse_export, paths))
+        except (OSError, RuntimeError) as e:
+            print(f"Process pool unavailable, parsing exports inline: {e}")
+            results = map(parser, paths)
+
+    for (path, ticket), value in zip(pending, results):
+        store_cached(ticket, value)
+        parsed[path.name] = value
+
+    return {name: parsed[name] for name in sorted(parsed) if parsed[name]}
+
+
+def parse_export(file_path: Path) -> Optional[dict]:
+    """Process pool entry point: parse one export without the parse cache."""
+    return parse_posts_file.uncached(file_path)
+
+
+def compare_exports(exports: dict[str, dict], best_name: str, worst_name: str) -> dict:
+    """
+    Build the insights structure for any pair of parsed exports.
+
+    Args:
+        exports: Result of parse_exports().
+        best_name: File name of the export used as the "best" side.
+        worst_name: File name of the export used as the "worst" side.
+
+    Returns:
+        Same structure as parse_insights_files().
+    """
+    return build_insights(exports.get(best_name), exports.get(worst_name))
+
+
+def summarize_exports(exports: dict[str, dict]) -> list[dict]:
+    """
+    Get per-export averages and hashtag stats as flat rows.
+
+    Args:
+        exports: Result of parse_exports().
+
+    Returns:
+        List of dicts with file, count, the averages and the top hashtag.
+    """
+    rows = []
+    for name, data in exports.items():
+        top_hashtags = data.get("top_hashtags", [])
+        rows.append({
+            "file": name,
+            "count": data.get("count", 0),
+            **data.get("averages", {}),
+            "avg_caption_length": data.get("avg_caption_length", 0),
+            "collab_percentage": data.get("collab_percentage", 0),
+            "top_hashtag": top_hashtags[0][0] if top_hashtags else None,
+            "hashtag_count": len(top_hashtags),
+        })
+    return rows
+
+
+@cached_parser
 def parse_posts_file(file_path: Path) -> Optional[dict]:
     """
     Parse a single posts Excel file.
@@ -51,8 +207,10 @@ def parse_posts_file(file_path: Path) -> Optional[dict]:
     if not file_path.exists():
         return None
 
+    import pandas as pd
+
     try:
-        df = pd.read_excel(file_path)
+        df = read_posts_table(file_path)
 
         # Rename columns for easier access
         column_map = {
@@ -89,41 +247,39 @@ def parse_posts_file(file_path: Path) -> Optional[dict]:
         if "pct_non_followers" in df.columns:
             averages["pct_non_followers"] = safe_mean(df["pct_non_followers"])
 
-        # Extract posts data
-        posts = []
-        for _, row in df.iterrows():
-            post = {
-                "fecha": str(row.get("fecha", "")),
-                "views": int(row.get("views", 0)) if pd.notna(row.get("views")) else 0,
-                "likes": int(row.get("likes", 0)) if pd.notna(row.get("likes")) else 0,
-                "comments": int(row.get("comments", 0)) if pd.notna(row.get("comments")) else 0,
-                "saves": int(row.get("saves", 0)) if pd.notna(row.get("saves")) else 0,
-                "caption": str(row.get("caption", ""))[:200] + "..." if len(str(row.get("caption", ""))) > 200 else str(row.get("caption", "")),
-                "new_followers": int(row.get("new_followers", 0)) if pd.notna(row.get("new_followers")) else 0,
-            }
-            posts.append(post)
-
-        # Extract caption characteristics
-        captions = df["caption"].dropna().tolist()
-        avg_caption_length = sum(len(str(c)) for c in captions) / len(captions) if captions else 0
+        # Extract posts data column-wise, then convert to records once
+        post_columns = {
+            "fecha": df["fecha"].map(str) if "fecha" in df.columns else "",
+        }
+        for col in ["views", "likes", "comments", "saves"]:
+            post_columns[col] = int_column(df, col)
 
-        # Extract hashtags
-        all_hashtags = []
-        for caption in captions:
-            hashtags = extract_hashtags(str(caption))
-            all_hashtags.extend(hashtags)
+        caption_text = df["caption"].map(str) if "caption" in df.columns else pd.Series("", index=df.index)
+        post_columns["caption"] = caption_text.where(
+            caption_text.str.len() <= 200,
+            caption_text.str[:200] + "...",
+        )
+        post_columns["new_followers"] = int_column(df, "new_followers")
 
-        # Count hashtag frequency
-        hashtag_counts = {}
-        for tag in all_hashtags:
-            hashtag_counts[tag] = hashtag_counts.get(tag, 0) + 1
+        posts = pd.DataFrame(post_columns, index=df.index).to_dict("records")
 
-        # Sort by frequency
-        top_hashtags = sorted(hashtag_counts.items(), key=lambda x: -x[1])[:10]
+        # Extract caption characteristics
+        captions = df["caption"].dropna().map(str)
+        avg_caption_length = float(captions.str.len().mean()) if len(captions) else 0
+
+        # Count hashtag frequency, keeping first-seen order among ties
+        hashtag_counts = (
+            captions.str.findall(HASHTAG_PATTERN)
+            .explode()
+            .dropna()
+            .value_counts(sort=False)
+            .sort_values(ascending=False, kind="stable")
+        )
+        top_hashtags = [(tag, int(count)) for tag, count in hashtag_counts.head(10).items()]
 
         # Check for collaborations (mentions)
-        collab_count = sum(1 for c in captions if "@" in str(c))
-        collab_pct = (collab_count / len(captions) * 100) if captions else 0
+        collab_count = int(captions.str.contains("@", regex=False).sum())
+        collab_pct = (collab_count / len(captions) * 100) if len(captions) else 0
 
         return {
             "averages": averages,
@@ -139,8 +295,112 @@ def parse_posts_file(file_path: Path) -> Optional[dict]:
         return None
 
 
+def read_posts_table(file_path: Path) -> "pd.DataFrame":
+    """
+    Load a posts workbook, going through the Parquet ingestion cache.
+
+    The first load of a given workbook version parses the Excel file and
+    stores a Parquet copy named after its path and content hash (see
+    ingest_cache_prefix). Later loads, also in new processes, read the
+    Parquet copy instead. If the frame cannot be
+    stored as Parquet (pyarrow missing, mixed-type columns), the Excel file
+    is simply read every time.
+
+    Args:
+        file_path: Path to the Excel file.
+
+    Returns:
+        The raw posts DataFrame.
+    """
+    import pandas as pd
+
+    digest = file_digest(file_path.read_bytes())
+    prefix = ingest_cache_prefix(file_path)
+    cache_file = INGEST_CACHE_DIR / f"{prefix}{digest}.parquet"
+    timings = INGEST_TIMINGS.setdefault(file_path.name, {})
+
+    if cache_file.exists():
+        try:
+            start = time.perf_counter()
+            df = pd.read_parquet(cache_file)
+            timings["warm"] = time.perf_counter() - start
+            return df
+        except (ImportError, ValueError, OSError):
+            pass
+
+    start = time.perf_counter()
+    df = normalize_mixed_columns(pd.read_excel(file_path))
+    timings["cold"] = time.perf_counter() - start
+
+    try:
+        INGEST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Drop copies of older versions of this workbook (and only this one)
+        stale_pattern = re.compile(re.escape(prefix) + r"[0-9a-f]{32}\.parquet")
+        for stale in INGEST_CACHE_DIR.glob("*.parquet"):
+            if stale_pattern.fullmatch(stale.name):
+                stale.unlink()
+        tmp_file = cache_file.with_suffix(".tmp")
+        df.to_parquet(tmp_file, index=False)
+        tmp_file.replace(cache_file)
+    except (ImportError, ValueError, TypeError, OSError) as e:
+        print(f"Not caching {file_path.name} as Parquet: {e}")
+
+    return df
+
+
+def ingest_cache_prefix(file_path: Path) -> str:
+    """
+    Get the name prefix of a workbook's Parquet copies.
+
+    Includes a hash of the resolved path, so same-named workbooks in
+    different directories don't share (and evict) each other's copies.
+    The full name appends the content digest and ".parquet".
+
+    Args:
+        file_path: Path to the Excel file.
+
+    Returns:
+        "<stem>-<path hash>-".
+    """
+    path_hash = file_digest(str(file_path.resolve()).encode())[:8]
+    return f"{file_path.stem}-{path_hash}-"
+
+
+def normalize_mixed_columns(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Turn object columns that mix value types into plain string columns.
+
+    Exports often mix typed cells with text cells in one column (e.g. dates
+    stored as both datetimes and "18/02/2025"). Parquet needs one type per
+    column. Non-null values are converted with str(), which is what the
+    parser applies to them anyway. Missing values stay missing.
+    """
+    import pandas as pd
+
+    for col in df.columns:
+        if df[col].dtype != object:
+            continue
+        values = df[col].dropna()
+        if values.map(type).nunique() > 1:
+            df[col] = df[col].map(lambda v: v if pd.isna(v) else str(v))
+    return df
+
+
+def get_ingest_timings() -> dict[str, dict[str, float]]:
+    """
+    Get the last cold and warm load times per workbook.
+
+    Returns:
+        dict: {file name: {"cold": seconds, "warm": seconds}} with whichever
+        loads have happened in this process.
+    """
+    return {name: dict(t) for name, t in INGEST_TIMINGS.items()}
+
+
 def clean_percentage(value) -> float:
     """Convert percentage string to float (as percentage 0-100)."""
+    import pandas as pd
+
     if pd.isna(value):
         return 0.0
     if isinstance(value, (int, float)):
@@ -168,10 +428,16 @@ def safe_mean(series) -> float:
         return 0.0
 
 
+def int_column(df: "pd.DataFrame", col: str) -> "pd.Series | int":
+    """Return a column as integers with missing values as 0 (0 if absent)."""
+    if col not in df.columns:
+        return 0
+    return df[col].fillna(0).astype("int64")
+
+
 def extract_hashtags(text: str) -> list[str]:
     """Extract hashtags from text."""
-    import re
-    return re.findall(r"#(\w+)", text)
+    return re.findall(HASHTAG_PATTERN, text)
 
 
 def calculate_comparison(best: dict, worst: dict) -> dict:
@@ -0,0 +1,245 @@
+"""
+Markdown outline engine shared by the plan, checklist and competitor parsers.
+Each document is scanned once into a tree of sections with their heading
+path, tables and list items, so parsers look sections up instead of running
+a DOTALL regex over the whole document per section.
+"""
+
+import re
+from typing import Iterator, Optional
+
+
+# Precompiled line patterns used by the outline scanner
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+SECTION_NUMBER_PATTERN = re.compile(r"^(\d+(?:\.\d+)*)\.?\s+(.*)$")
+NUMBER_ONLY_PATTERN = re.compile(r"^\d+(?:\.\d+)*\.?$")
+LIST_ITEM_PATTERN = re.compile(r"^\s*(?:[-*+]|\d+\.)\s+(?:\[[ xX]\]\s*)?(.+)$")
+LABEL_PATTERN = re.compile(r"^\*\*(.+?):?\*\*:?\s*$")
+FENCE_PREFIX = "```"
+
+
+def _new_section(level: int, title: str, parent: Optional[dict]) -> dict:
+    number_match = SECTION_NUMBER_PATTERN.match(title)
+    number = number_match.group(1) if number_match else None
+    name = number_match.group(2) if number_match else title
+
+    return {
+        "level": level,
+        "title": title,
+        "number": number,
+        "key": normalize_heading(name),
+        "path": (*parent["path"], title) if parent else (),
+        "lines": [],
+        "tables": [],
+        "items": [],
+        "lists": {},
+        "children": [],
+    }
+
+
+def normalize_heading(text: str) -> str:
+    """
+    Normalize a heading (or a query for one) for lookups.
+
+    Args:
+        text: Heading text without the leading #'s.
+
+    Returns:
+        Casefolded text without bold markers or surrounding whitespace.
+    """
+    return text.replace("**", "").strip().casefold()
+
+
+def split_table_row(line: str) -> list[str]:
+    """
+    Split a markdown table row into stripped cells.
+
+    Args:
+        line: A line starting with "|".
+
+    Returns:
+        List of cell strings, as written (bold markers are kept).
+    """
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+# =============================================================================
+# OUTLINE
+# =============================================================================
+
+def parse_outline(content: str) -> dict:
+    """
+    Parse a markdown document into a section tree in a single pass.
+
+    Every heading opens a section nested under the closest heading of a
+    lower level. Each section keeps its own body lines (up to its first
+    subheading) and, parsed from them:
+        tables: list of tables, each a list of rows of cells (the header and
+                alignment rows included)
+        items:  list item texts, without the marker or checkbox
+        lists:  items grouped under the "**Label**:" line that precedes them
+
+    Lines inside fenced code blocks are kept in "lines" but never parsed.
+
+    Args:
+        content: Raw markdown content.
+
+    Returns:
+        The root section (level 0, empty title), plus:
+            sections: every section in document order
+            index: section number ("5.1") or normalized title -> section
+    """
+    root = _new_section(0, "", None)
+    root["sections"] = []
+    root["index"] = {}
+
+    stack = [root]
+    current = root
+    table = None
+    label = None
+    in_fence = False
+
+    for line in content.split("\n"):
+        if line.startswith(FENCE_PREFIX):
+            in_fence = not in_fence
+            current["lines"].append(line)
+            continue
+
+        if in_fence:
+            current["lines"].append(line)
+            continue
+
+        heading_match = HEADING_PATTERN.match(line) if line.startswith("#") else None
+        if heading_match:
+            level = len(heading_match.group(1))
+            while stack[-1]["level"] >= level:
+                stack.pop()
+
+            current = _new_section(level, heading_match.group(2), stack[-1])
+            stack[-1]["children"].append(current)
+            stack.append(current)
+
+            root["sections"].append(current)
+            if current["number"]:
+                root["index"].setdefault(current["number"], current)
+            root["index"].setdefault(current["key"], current)
+
+            table = None
+            label = None
+            continue
+
+        current["lines"].append(line)
+
+        if line.startswith("|"):
+            if table is None:
+                table = []
+                current["tables"].append(table)
+            table.append(split_table_row(line))
+            continue
+        table = None
+
+        item_match = LIST_ITEM_PATTERN.match(line)
+        if item_match:
+            item = item_match.group(1).strip()
+            current["items"].append(item)
+            if label is not None:
+                current["lists"][label].append(item)
+            continue
+
+        label_match = LABEL_PATTERN.match(line.strip())
+        if label_match:
+            label = label_match.group(1).strip()
+            current["lists"].setdefault(label, [])
+        elif line.strip():
+            label = None
+
+    return root
+
+
+def iter_sections(section: dict) -> Iterator[dict]:
+    """
+    Yield a section's descendants in document order.
+
+    Args:
+        section: A section or the outline root.
+
+    Yields:
+        Each nested section, depth first.
+    """
+    for child in section["children"]:
+        yield child
+        yield from iter_sections(child)
+
+
+def _split_step(step: str) -> tuple[Optional[str], str]:
+    step = step.strip()
+    if NUMBER_ONLY_PATTERN.match(step):
+        return step.rstrip("."), ""
+    number_match = SECTION_NUMBER_PATTERN.match(step)
+    if number_match:
+        return number_match.group(1), normalize_heading(number_match.group(2))
+    return None, normalize_heading(step)
+
+
+def _matches(section: dict, number: Optional[str], key: str) -> bool:
+    if number is not None and section["number"] != number:
+        return False
+    return section["key"].startswith(key)
+
+
+def find_section(outline: dict, *path: str) -> Optional[dict]:
+    """
+    Look a section up by heading path.
+
+    Each step is a section number ("5.1"), a heading title ("Riesgos") or
+    both ("9. Riesgos"); a title matches any heading that starts with it,
+    ignoring case and bold markers. The first step is resolved through the
+    outline index when it holds a number or a full title, and each further
+    step matches a direct child of the previous one.
+
+    Args:
+        outline: Result of parse_outline().
+        *path: Heading steps, e.g. ("2", "BRIDALADA") or ("5.1 Ingresos",).
+
+    Returns:
+        The matching section, or None.
+    """
+    if not path:
+        return outline
+
+    number, key = _split_step(path[0])
+    section = outline["index"].get(number if number is not None else key)
+    if section is None or not _matches(section, number, key):
+        section = next(
+            (s for s in outline["sections"] if _matches(s, number, key)),
+            None,
+        )
+
+    for step in path[1:]:
+        if section is None:
+            break
+        number, key = _split_step(step)
+        section = next(
+            (child for child in section["children"] if _matches(child, number, key)),
+            None,
+        )
+
+    return section
+
+
+def find_list(section: dict, label: str) -> list[str]:
+    """
+    Get the list items written under a "**Label**:" line of a section.
+
+    Args:
+        section: A section from parse_outline().
+        label: Label text, or the start of it (case-insensitive).
+
+    Returns:
+        The items of the first matching label, or an empty list.
+    """
+    key = normalize_heading(label)
+    for name, items in section["lists"].items():
+        if normalize_heading(name).startswith(key):
+            return items
+    return []
@@ -0,0 +1,181 @@
+"""
+Markdown pipe-table reader shared by the plan and checklist parsers.
+Splits each row once, separates the header from the data using the
+alignment row, and types numeric columns (€, thousands separators, %,
+K suffixes and ranges) cell by cell.
+"""
+
+import re
+from typing import Optional, Union
+
+from src.parsers.markdown_outline import split_table_row
+
+Number = Union[int, float]
+
+
+# Precompiled cell patterns
+ALIGN_CELL_PATTERN = re.compile(r"^:?-+:?$")
+NUMBER_PATTERN = re.compile(
+    r"^[~<>≈≤≥]?\s*€?\s*(\d[\d.,]*)\s*([%kK€]?)"
+    r"(?:\s*[-–]\s*€?\s*(\d[\d.,]*)\s*([%kK€]?))?\s*\+?$"
+)
+THOUSANDS_COMMA_PATTERN = re.compile(r"^\d{1,3}(?:,\d{3})+$")
+# Spanish thousands: "1.500" is 1500 (a dot followed by exactly three digits)
+THOUSANDS_DOT_PATTERN = re.compile(r"^[1-9]\d{0,2}(?:\.\d{3})+$")
+
+# Cells that mean "no value" in a numeric column
+PLACEHOLDERS = {"", "-", "—", "–", "n/a"}
+
+
+def _to_number(digits: str, unit: str) -> Number:
+    if "," in digits and "." in digits:
+        # The last separator is the decimal one: 1,500.50 or 1.500,50
+        if digits.rfind(",") > digits.rfind("."):
+            digits = digits.replace(".", "").replace(",", ".")
+        else:
+            digits = digits.replace(",", "")
+    elif "," in digits:
+        if THOUSANDS_COMMA_PATTERN.match(digits):
+            digits = digits.replace(",", "")
+        else:
+            digits = digits.replace(",", ".")
+    elif THOUSANDS_DOT_PATTERN.match(digits) or digits.count(".") > 1:
+        digits = digits.replace(".", "")
+
+    value = float(digits)
+    if unit in ("k", "K"):
+        value *= 1000
+    return int(value) if value.is_integer() and "." not in digits else value
+
+
+def parse_number(text: str) -> Union[Number, tuple[Number, Number], None]:
+    """
+    Parse a numeric table cell.
+
+    Args:
+        text: Cell text, e.g. "€1,500", "€1.500", "114,900", "0.24%", "76K",
+              "4-5", "1.5-2.5%", ">0.3%" or "30+".
+
+    Returns:
+        An int or float, a (low, high) tuple for ranges, or None if the
+        cell is not a number.
+    """
+    match = NUMBER_PATTERN.match(text.replace("**", "").strip())
+    if not match:
+        return None
+
+    low_digits, low_unit, high_digits, high_unit = match.groups()
+    if high_digits is None:
+        return _to_number(low_digits, low_unit)
+
+    # "10-12K": the unit after the range applies to both ends
+    return (
+        _to_number(low_digits, low_unit or high_unit),
+        _to_number(high_digits, high_unit),
+    )
+
+
+def parse_number_column(cells: list[str]) -> Optional[list]:
+    """
+    Type a column as numbers, cell by cell.
+
+    A cell that is not a number (e.g. "TBD") becomes None on its own; the
+    rest of the column keeps its values.
+
+    Args:
+        cells: Cell texts of one column.
+
+    Returns:
+        List of parsed values (None for placeholders such as "-" and for
+        cells that are not numbers), or None if no cell holds a number.
+    """
+    values = [
+        None if cell.lower() in PLACEHOLDERS else parse_number(cell)
+        for cell in cells
+    ]
+    return values if any(value is not None for value in values) else None
+
+
+# =============================================================================
+# TABLES
+# =============================================================================
+
+def _alignment(cell: str) -> str:
+    if cell.startswith(":") and cell.endswith(":"):
+        return "center"
+    if cell.endswith(":"):
+        return "right"
+    return "left"
+
+
+def read_table(rows: list) -> dict:
+    """
+    Read a markdown table into header, data rows and typed columns.
+
+    The alignment row (|---|:--:|) marks the row above it as the header.
+    Tables without one are treated as all data. Bold markers are removed
+    from every cell.
+
+    Args:
+        rows: Table lines, or rows already split into cells (as stored in
+              an outline section's "tables").
+
+    Returns:
+        dict with keys:
+            header: column names ([] if the table has none)
+            align: "left", "center" or "right" per column ([] if no alignment row)
+            rows: data rows as lists of cell text
+            columns: one list per column with its parsed values; numeric
+                     columns hold numbers/ranges, or None for cells that
+                     aren't numbers (the text stays in rows); others the text
+            numeric: one bool per column
+    """
+    cells = [
+        [cell.replace("**", "").strip() for cell in
+         (split_table_row(row) if isinstance(row, str) else row)]
+        for row in rows
+    ]
+
+    header = []
+    align = []
+    data = cells
+    for i, row in enumerate(cells):
+        if row and all(ALIGN_CELL_PATTERN.match(cell) for cell in row):
+            header = cells[i - 1] if i > 0 else []
+            align = [_alignment(cell) for cell in row]
+            data = cells[:max(i - 1, 0)] + cells[i + 1:]
+            break
+
+    width = max((len(row) for row in [header, *data]), default=0)
+    data = [row + [""] * (width - len(row)) for row in data]
+
+    columns = []
+    numeric = []
+    for index in range(width):
+        texts = [row[index] for row in data]
+        values = parse_number_column(texts)
+        columns.append(values if values is not None else texts)
+        numeric.append(values is not None)
+
+    return {
+        "header": header,
+        "align": align,
+        "rows": data,
+        "columns": columns,
+        "numeric": numeric,
+    }
+
+
+def read_section_tables(section: Optional[dict]) -> list[dict]:
+    """
+    Read every table of an outline section.
+
+    Args:
+        section: A section from find_section(), or None.
+
+    Returns:
+        List of read_table() results, in document order.
+    """
+    if not section:
+        return []
+    return [read_table(rows) for rows in section["tables"]]
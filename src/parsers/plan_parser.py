@@ -7,7 +7,17 @@ import re
 from pathlib import Path
 from typing import Optional
 
+from src.parsers.cache import cached_parser
+from src.parsers.markdown_outline import find_section, parse_outline
+from src.parsers.markdown_table import read_section_tables
+from src.utils.profiler import profiled
 
+# First cell of a projection row: "4" or "1-3"
+MONTH_PATTERN = re.compile(r"\d+(?:-\d+)?")
+
+
+@profiled
+@cached_parser
 def parse_plan_file(file_path: Path) -> dict:
     """
     Parse the entire plan file and return structured data.
@@ -28,22 +38,23 @@ def parse_plan_file(file_path: Path) -> dict:
         }
 
     content = file_path.read_text(encoding="utf-8")
+    outline = parse_outline(content)
 
     return {
-        "kpis": parse_current_kpis(content),
+        "kpis": parse_current_kpis(outline),
         "phases": parse_phases(content),
         "business_models": parse_business_models(content),
-        "projections": parse_financial_projections(content),
-        "risks": parse_risks(content),
+        "projections": parse_financial_projections(outline),
+        "risks": parse_risks(outline),
     }
 
 
-def parse_current_kpis(content: str) -> dict:
+def parse_current_kpis(outline: dict) -> dict:
     """
     Parse current KPIs from the plan.
 
     Args:
-        content: Raw markdown content.
+        outline: Result of parse_outline() for the plan.
 
     Returns:
         Dict with KPI metrics and their values.
@@ -51,30 +62,21 @@ def parse_current_kpis(content: str) -> dict:
     kpis = {}
 
     # Find the KPIs section
-    kpi_section = re.search(
-        r"### 1\.1 KPIs.*?\n(.*?)(?=\n###|\n##|\Z)",
-        content,
-        re.DOTALL
-    )
+    kpi_section = find_section(outline, "1.1 KPIs")
 
     if not kpi_section:
         return kpis
 
-    section_text = kpi_section.group(1)
-
     # Parse table rows: | **Metric** | Value | Benchmark | Status |
-    rows = re.findall(
-        r"\|\s*\**(.+?)\**\s*\|\s*(.+?)\s*\|\s*(.+?)\s*\|\s*(.+?)\s*\|",
-        section_text
-    )
-
-    for metric, value, benchmark, status in rows:
-        metric = metric.strip().replace("**", "")
-        if metric.lower() not in ["metrica", "---", "-"]:
+    for table in read_section_tables(kpi_section):
+        for row in table["rows"]:
+            if len(row) < 4 or not row[0]:
+                continue
+            metric, value, benchmark, status = row[:4]
             kpis[metric] = {
-                "value": value.strip(),
-                "benchmark": benchmark.strip(),
-                "status": status.strip(),
+                "value": value,
+                "benchmark": benchmark,
+                "status": status,
             }
 
     return kpis
@@ -160,12 +162,12 @@ def parse_business_models(content: str) -> list[dict]:
     return models
 
 
-def parse_financial_projections(content: str) -> list[dict]:
+def parse_financial_projections(outline: dict) -> list[dict]:
     """
     Parse monthly financial projections.
 
     Args:
-        content: Raw markdown content.
+        outline: Result of parse_outline() for the plan.
 
     Returns:
         List of monthly projection dictionaries.
@@ -173,36 +175,27 @@ def parse_financial_projections(content: str) -> list[dict]:
     projections = []
 
     # Find the projections table
-    proj_section = re.search(
-        r"### 5\.1 Ingresos mensuales.*?\n(.*?)(?=\n###|\n##|\Z)",
-        content,
-        re.DOTALL
-    )
+    proj_section = find_section(outline, "5.1 Ingresos mensuales")
 
     if proj_section:
-        section_text = proj_section.group(1)
-
-        # Parse table rows
-        rows = re.findall(
-            r"\|\s*(\d+(?:-\d+)?)\s*\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|\s*\**([^\|]+)\**\s*\|",
-            section_text
-        )
-
-        for month, rehab, affiliates, products, b2b, total in rows:
-            def clean_value(v):
-                v = v.strip().replace("€", "").replace(",", "").replace("-", "0")
-                try:
-                    return int(v) if v.isdigit() else 0
-                except ValueError:
-                    return 0
-
-            projections.append({
-                "month": month.strip(),
-                "affiliates": clean_value(affiliates),
-                "products": clean_value(products),
-                "b2b": clean_value(b2b),
-                "total": clean_value(total.replace("**", "")),
-            })
+        # | Mes | Rehabilitacion | Afiliados | Productos | B2B | Total |
+        for table in read_section_tables(proj_section):
+            if len(table["columns"]) < 6:
+                continue
+
+            amounts = list(zip(*table["columns"][2:6]))
+            for row, values in zip(table["rows"], amounts):
+                # Only rows whose first cell is a month or month range
+                if not MONTH_PATTERN.fullmatch(row[0]):
+                    continue
+                affiliates, products, b2b, total = (to_amount(value) for value in values)
+                projections.append({
+                    "month": row[0],
+                    "affiliates": affiliates,
+                    "products": products,
+                    "b2b": b2b,
+                    "total": total,
+                })
 
     # Default projections if parsing failed
     if not projections:
@@ -222,12 +215,23 @@ def parse_financial_projections(content: str) -> list[dict]:
     return projections
 
 
-def parse_risks(content: str) -> list[dict]:
+def to_amount(value) -> int:
+    """
+    Read one typed projection cell as an amount.
+
+    read_table() types columns cell by cell, so a placeholder such as "TBD"
+    or "-" (None) only zeroes its own cell. Ranges and text columns also
+    count as 0.
+    """
+    return int(value) if isinstance(value, (int, float)) else 0
+
+
+def parse_risks(outline: dict) -> list[dict]:
     """
     Parse risks and mitigations from the plan.
 
     Args:
-        content: Raw markdown content.
+        outline: Result of parse_outline() for the plan.
 
     Returns:
         List of risk dictionaries.
@@ -235,29 +239,20 @@ def parse_risks(content: str) -> list[dict]:
     risks = []
 
     # Find the risks section
-    risk_section = re.search(
-        r"## 9\. Riesgos.*?\n(.*?)(?=\n##|\Z)",
-        content,
-        re.DOTALL
-    )
+    risk_section = find_section(outline, "9. Riesgos")
 
     if risk_section:
-        section_text = risk_section.group(1)
-
-        # Parse table rows
-        rows = re.findall(
-            r"\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|\s*([^\|]+)\s*\|",
-            section_text
-        )
-
-        for risk, probability, impact, mitigation in rows:
-            risk = risk.strip()
-            if risk.lower() not in ["riesgo", "---", "-"]:
+        # Parse table rows: | Riesgo | Probabilidad | Impacto | Mitigacion |
+        for table in read_section_tables(risk_section):
+            for row in table["rows"]:
+                if len(row) < 4 or not row[0]:
+                    continue
+                risk, probability, impact, mitigation = row[:4]
                 risks.append({
                     "risk": risk,
-                    "probability": probability.strip(),
-                    "impact": impact.strip(),
-                    "mitigation": mitigation.strip(),
+                    "probability": probability,
+                    "impact": impact,
+                    "mitigation": mitigation,
                 })
 
     return risks
@@ -0,0 +1,166 @@
+"""
+Prebuilt snapshot of every parsed document.
+scripts/build_snapshot.py runs each parser once and pickles the results
+together with a schema version and the content hash of every source file.
+At startup the snapshot seeds the parse cache, so the first rerun of each
+page finds its documents already parsed (and Insights never imports pandas).
+A document whose hash no longer matches is left out and parsed live.
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.parsers.cache import (
+    clear_parse_cache,
+    export_cached,
+    parser_name,
+    seed_cached,
+)
+from src.parsers.checklist_parser import parse_checklist_file
+from src.parsers.competitor_parser import parse_competitor_file
+from src.parsers.insights_parser import parse_exports, parse_posts_file
+from src.parsers.plan_parser import parse_plan_file
+
+ROOT = Path(__file__).parent.parent.parent
+
+# Built artifact loaded at startup; EVDLN_SNAPSHOT points elsewhere
+SNAPSHOT_FILE = Path(os.environ.get("EVDLN_SNAPSHOT", ROOT / ".cache" / "snapshot.pkl"))
+
+# Bump when the shape of a parser's output changes
+SNAPSHOT_VERSION = 1
+
+# Documents read by the pages, relative to the docs directory
+CHECKLIST_DOC = "2026-01-17-checklist-semanas-1-4.md"
+PLAN_DOC = "2026-01-17-el-vals-de-la-novia-plan.md"
+COMPETITORS_DOC = "2026-01-17-analisis-competidores.md"
+
+# Parsers whose results may be snapshotted, by cache name
+SNAPSHOT_PARSERS = {
+    parser_name(parser.uncached): parser.uncached
+    for parser in (parse_checklist_file, parse_plan_file, parse_competitor_file, parse_posts_file)
+}
+
+_snapshot = {"stats": None}
+_LOCK = threading.Lock()
+
+
+def parsers_digest() -> str:
+    """
+    Hash the parser sources, so a snapshot built by other parser code is
+    rejected even if SNAPSHOT_VERSION was not bumped.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(Path(__file__).parent.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _relative(path: str) -> str:
+    """Store paths relative to the repo so a snapshot built elsewhere still matches."""
+    try:
+        return Path(path).relative_to(ROOT.resolve()).as_posix()
+    except ValueError:
+        return path
+
+
+def build_snapshot(docs_dir: Path, data_dir: Path, output: Path = SNAPSHOT_FILE) -> dict:
+    """
+    Run every parser once and write their results to a snapshot file.
+
+    Args:
+        docs_dir: Directory holding the markdown plans.
+        data_dir: Directory holding the posts Excel exports (all of them are
+            snapshotted).
+        output: Snapshot file to write (replaced atomically).
+
+    Returns:
+        The snapshot payload that was written.
+    """
+    clear_parse_cache()
+    parse_checklist_file(docs_dir / CHECKLIST_DOC)
+    parse_plan_file(docs_dir / PLAN_DOC)
+    parse_competitor_file(docs_dir / COMPETITORS_DOC)
+    parse_exports(data_dir)
+
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "parsers": parsers_digest(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "entries": [
+            {**entry, "path": _relative(entry["path"])}
+            for entry in export_cached()
+            if entry["parser"] in SNAPSHOT_PARSERS
+        ],
+    }
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temp = output.with_suffix(".tmp")
+    temp.write_bytes(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+    os.replace(temp, output)
+    return payload
+
+
+def load_snapshot(path: Path = SNAPSHOT_FILE) -> dict:
+    """
+    Seed the parse cache from a snapshot, once per process.
+
+    Entries whose source file changed since the build are skipped; those
+    documents are parsed live on first use. A missing, outdated or
+    unreadable snapshot is ignored the same way.
+
+    Args:
+        path: Snapshot file written by build_snapshot(). Only load files you
+            built yourself: it is a pickle.
+
+    Returns:
+        dict with loaded and stale entry counts, and the reason the snapshot
+        was skipped (None if it was used).
+    """
+    with _LOCK:
+        if _snapshot["stats"] is not None:
+            return _snapshot["stats"]
+
+        stats = {"loaded": 0, "stale": 0, "reason": None}
+        _snapshot["stats"] = stats
+
+        if not path.exists():
+            stats["reason"] = "missing"
+            return stats
+
+        try:
+            payload = pickle.loads(path.read_bytes())
+        except Exception as e:
+            print(f"Error loading snapshot {path}: {e}")
+            stats["reason"] = "unreadable"
+            return stats
+
+        if payload.get("version") != SNAPSHOT_VERSION or payload.get("parsers") != parsers_digest():
+            print(f"Snapshot {path} was built by other parser code, parsing live")
+            stats["reason"] = "outdated"
+            return stats
+
+        for entry in payload["entries"]:
+            parser = SNAPSHOT_PARSERS.get(entry["parser"])
+            source = ROOT / entry["path"]
+            if parser and seed_cached(parser, source, entry["digest"], entry["value"]):
+                stats["loaded"] += 1
+            else:
+                stats["stale"] += 1
+
+        return stats
+
+
+def get_snapshot_stats() -> Optional[dict]:
+    """
+    Get the result of load_snapshot() for this process.
+
+    Returns:
+        The stats dict, or None if no snapshot load was attempted.
+    """
+    return _snapshot["stats"]
@@ -0,0 +1,155 @@
+"""
+Background watcher that keeps the parse cache fresh while the app runs.
+When a document changes on disk only that document is re-parsed, off the
+script thread, so reruns find the new structure already cached.
+Uses watchdog (inotify on Linux) when installed and polls mtimes otherwise.
+"""
+
+import importlib.util
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from src.parsers.cache import refresh_cached
+
+# Set EVDLN_WATCH=0 to disable the watcher (e.g. on hosts with no inotify quota)
+WATCH_ENABLED = os.environ.get("EVDLN_WATCH", "1") not in ("", "0")
+WATCH_SUFFIXES = (".md",)
+POLL_INTERVAL = 0.5
+
+# resolved directory -> backend name ("watchdog" or "polling")
+_WATCHERS: dict[str, str] = {}
+_LOCK = threading.Lock()
+
+
+def _is_watched(path: str) -> bool:
+    return path.endswith(WATCH_SUFFIXES) and not Path(path).name.startswith(".")
+
+
+def refresh_document(path: str) -> None:
+    """
+    Re-parse a changed document for every parser that cached it.
+
+    Args:
+        path: Path of the changed file.
+    """
+    if not _is_watched(path):
+        return
+    try:
+        refresh_cached(Path(path))
+    except Exception as e:
+        # A half-written file must not kill the watcher thread
+        print(f"Error re-parsing {path}: {e}")
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+def _start_watchdog(watch_dir: Path) -> None:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    class DocumentHandler(FileSystemEventHandler):
+        def on_modified(self, event):
+            if not event.is_directory:
+                refresh_document(event.src_path)
+
+        on_created = on_modified
+
+        def on_moved(self, event):
+            # Editors that save through a temp file end with a rename
+            if not event.is_directory:
+                refresh_document(event.dest_path)
+
+    observer = Observer()
+    observer.daemon = True
+    observer.schedule(DocumentHandler(), str(watch_dir), recursive=False)
+    observer.start()
+
+
+def _snapshot(watch_dir: Path) -> dict[str, tuple[int, int]]:
+    snapshot = {}
+    for path in watch_dir.iterdir():
+        if _is_watched(path.name):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def _poll(watch_dir: Path) -> None:
+    known = _snapshot(watch_dir)
+    while True:
+        time.sleep(POLL_INTERVAL)
+        try:
+            current = _snapshot(watch_dir)
+        except OSError:
+            continue
+        for path, version in current.items():
+            if known.get(path) != version:
+                refresh_document(path)
+        known = current
+
+
+def _start_polling(watch_dir: Path) -> None:
+    thread = threading.Thread(
+        target=_poll, args=(watch_dir,), name="evdln-doc-poller", daemon=True
+    )
+    thread.start()
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+def start_watcher(watch_dir: Path) -> Optional[str]:
+    """
+    Start watching a documents directory, once per process.
+
+    Safe to call on every rerun: later calls for the same directory return
+    the backend already running.
+
+    Args:
+        watch_dir: Directory holding the markdown documents.
+
+    Returns:
+        "watchdog" or "polling", or None if disabled or the directory is missing.
+    """
+    if not WATCH_ENABLED or not watch_dir.is_dir():
+        return None
+
+    key = str(watch_dir.resolve())
+    with _LOCK:
+        if key in _WATCHERS:
+            return _WATCHERS[key]
+
+        backend = "polling"
+        if importlib.util.find_spec("watchdog") is not None:
+            try:
+                _start_watchdog(watch_dir)
+                backend = "watchdog"
+            except Exception as e:
+                # e.g. the inotify watch limit is exhausted
+                print(f"Error starting file watcher, polling instead: {e}")
+
+        if backend == "polling":
+            _start_polling(watch_dir)
+
+        _WATCHERS[key] = backend
+        return backend
+
+
+def get_watchers() -> dict[str, str]:
+    """
+    Get the directories being watched.
+
+    Returns:
+        dict of resolved directory -> backend name.
+    """
+    with _LOCK:
+        return dict(_WATCHERS)
@@ -0,0 +1,21 @@
+"""
+Font settings shared by the theme and scripts/build_fonts.py.
+Constants only: importing this module never reads or writes files.
+"""
+
+import os
+from pathlib import Path
+
+# "google" loads the fonts from Google Fonts, "local" serves the subsetted
+# files in static/fonts (built by scripts/build_fonts.py) for offline use
+FONT_MODE = os.environ.get("EVDLN_FONTS", "google")
+USE_LOCAL_FONTS = FONT_MODE == "local"
+
+# Served by Streamlit at app/static/ when server.enableStaticServing is on
+STATIC_DIR = Path(__file__).parent.parent.parent / "static"
+FONTS_DIR = STATIC_DIR / "fonts"
+
+LOCAL_FONTS = [
+    {"family": "Playfair Display", "file": "PlayfairDisplay-latin.woff2", "weight": "400 700"},
+    {"family": "Montserrat", "file": "Montserrat-latin.woff2", "weight": "300 700"},
+]
@@ -3,6 +3,15 @@ Theme configuration for El Vals de la Novia dashboard.
 Wedding-premium aesthetic with mobile-first design.
 """
 
+import hashlib
+import importlib.util
+import os
+import re
+import threading
+import time
+
+from src.styles.fonts import FONTS_DIR, LOCAL_FONTS, STATIC_DIR, USE_LOCAL_FONTS
+
 # =============================================================================
 # COLOR PALETTE - Wedding Themed
 # =============================================================================
@@ -54,6 +63,10 @@ FONTS = {
     "body": "'Montserrat', sans-serif",
 }
 
+# Other processes (a rolling restart, another font mode) may still link their
+# own hashed stylesheet, so old ones are only pruned once unused for this long
+CSS_MAX_AGE_SECONDS = 30 * 24 * 3600
+
 # =============================================================================
 # SPACING & SIZING
 # =============================================================================
@@ -87,6 +100,61 @@ def get_google_fonts_css():
     </style>
     """
 
+def get_local_fonts_css(url_base="fonts/"):
+    """
+    Returns @font-face rules for the bundled fonts.
+
+    Args:
+        url_base: URL of static/fonts relative to where the CSS is loaded from.
+    """
+    faces = "".join(
+        f"""
+        @font-face {{
+            font-family: '{font["family"]}';
+            font-style: normal;
+            font-weight: {font["weight"]};
+            font-display: swap;
+            src: url('{url_base}{font["file"]}') format('woff2');
+        }}"""
+        for font in LOCAL_FONTS
+    )
+    return f"""
+    <style>{faces}
+    </style>
+    """
+
+def check_font_assets():
+    """Returns the bundled font files that are missing from static/fonts."""
+    return [font["file"] for font in LOCAL_FONTS if not (FONTS_DIR / font["file"]).is_file()]
+
+def require_local_fonts():
+    """
+    Startup check for the bundled fonts (only in local font mode).
+
+    Local mode never falls back to Google Fonts: on a host without internet
+    access that would silently leave the page on the default fonts, so
+    missing files stop the app instead. Called by app.py, not at import, so
+    scripts/build_fonts.py can run before the files exist.
+
+    Raises:
+        FileNotFoundError: If local fonts are requested and a file is missing.
+    """
+    if not USE_LOCAL_FONTS:
+        return
+    missing = check_font_assets()
+    if missing:
+        raise FileNotFoundError(
+            f"EVDLN_FONTS=local but fonts are missing in {FONTS_DIR}: {', '.join(missing)}. "
+            "Run scripts/build_fonts.py (--source-dir without internet access) "
+            "or unset EVDLN_FONTS to use Google Fonts."
+        )
+
+def get_fonts_css(url_base="fonts/"):
+    """Returns the font CSS for the configured font mode."""
+    if USE_LOCAL_FONTS:
+        return get_local_fonts_css(url_base)
+    return get_google_fonts_css()
+
 def get_base_css():
     """Returns the base CSS for the entire application."""
     return f"""
@@ -734,19 +802,234 @@ def get_timeline_css():
     </style>
     """
 
-def get_all_css():
-    """Returns all CSS combined."""
+def get_app_css():
+    """Returns the app-level CSS (checkboxes, mobile tabs, expanders, dividers)."""
+    return """
+    <style>
+        /* ===== ADDITIONAL CHECKBOX STYLING ===== */
+        .stCheckbox > label {
+            padding: 14px 12px;
+            font-size: 15px;
+            line-height: 1.5;
+            display: flex;
+            align-items: center;
+            border-bottom: 1px solid #F0E6E8;
+            transition: all 0.2s ease;
+            cursor: pointer;
+            border-radius: 8px;
+            margin: 2px 0;
+        }
+
+        .stCheckbox > label:hover {
+            background-color: #FFFBF7;
+            border-color: #F5E6D3;
+        }
+
+        .stCheckbox > label > div[data-testid="stCheckbox"] {
+            margin-right: 12px;
+        }
+
+        /* Checkbox input styling */
+        .stCheckbox input[type="checkbox"] {
+            width: 24px;
+            height: 24px;
+            border-radius: 6px;
+            border: 2px solid #E9D5FF;
+            cursor: pointer;
+        }
+
+        .stCheckbox input[type="checkbox"]:checked {
+            background: linear-gradient(135deg, #FF6B9D 0%, #C084FC 100%);
+            border-color: transparent;
+        }
+
+        /* Mobile touch targets */
+        @media (max-width: 768px) {
+            .stCheckbox > label {
+                padding: 16px 12px;
+                min-height: 52px;
+            }
+        }
+
+        /* ===== MOBILE TAB ADJUSTMENTS ===== */
+        @media (max-width: 768px) {
+            .stTabs [data-baseweb="tab-list"] {
+                display: flex !important;
+                visibility: visible !important;
+                flex-wrap: nowrap !important;
+                overflow-x: auto !important;
+                -webkit-overflow-scrolling: touch;
+                scrollbar-width: none;
+            }
+
+            .stTabs [data-baseweb="tab-list"]::-webkit-scrollbar {
+                display: none;
+            }
+
+            .stTabs [data-baseweb="tab"] {
+                display: flex !important;
+                visibility: visible !important;
+                flex-shrink: 0 !important;
+                padding: 10px 16px !important;
+                font-size: 13px !important;
+                min-height: 44px !important;
+            }
+        }
+
+        /* ===== EXPANDER STYLING ===== */
+        .streamlit-expanderHeader {
+            font-family: 'Playfair Display', serif;
+            font-size: 1rem;
+            font-weight: 500;
+            color: #3D3D3D;
+            background: #FFFBF7;
+            border-radius: 12px;
+        }
+
+        .streamlit-expanderContent {
+            border: 1px solid #F0E6E8;
+            border-top: none;
+            border-radius: 0 0 12px 12px;
+        }
+
+        /* ===== DIVIDER STYLING ===== */
+        hr {
+            border: none;
+            height: 1px;
+            background: linear-gradient(90deg, transparent, #F0E6E8, transparent);
+            margin: 24px 0;
+        }
+    </style>
+    """
+
+def get_all_css(font_url_base="fonts/"):
+    """
+    Returns all CSS combined.
+
+    Args:
+        font_url_base: URL of static/fonts relative to where the CSS is loaded from.
+    """
     return (
-        get_google_fonts_css() +
+        get_fonts_css(font_url_base) +
         get_base_css() +
         get_navigation_css() +
         get_card_css() +
         get_progress_css() +
         get_hero_css() +
         get_day_section_css() +
-        get_timeline_css()
+        get_timeline_css() +
+        get_app_css()
     )
 
+# =============================================================================
+# COMPILED STYLESHEET
+# =============================================================================
+
+
+def minify_css(css):
+    """Strips <style> tags, comments and whitespace from a CSS string."""
+    css = re.sub(r"</?style>", "", css)
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def publish_css(css, file_name) -> bool:
+    """
+    Writes the stylesheet to the static folder under a content-hashed name.
+
+    Publishing an existing file only refreshes its mtime, which
+    prune_css() uses to tell stylesheets still in use from old ones.
+
+    Returns:
+        True if the file is in place, False if it can't be written.
+    """
+    try:
+        STATIC_DIR.mkdir(exist_ok=True)
+        path = STATIC_DIR / file_name
+        if path.exists():
+            path.touch()
+        else:
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(css, encoding="utf-8")
+            tmp_path.replace(path)
+    except OSError as e:
+        print(f"Error publishing theme CSS: {e}")
+        return False
+    return True
+
+
+def prune_css(keep) -> None:
+    """
+    Deletes hashed stylesheets not published for CSS_MAX_AGE_SECONDS.
+
+    Files with other hashes may still be linked by another process, so
+    recent ones are kept. A file another process removes first is skipped.
+    """
+    cutoff = time.time() - CSS_MAX_AGE_SECONDS
+    for old in STATIC_DIR.glob("theme-*.css"):
+        if old.name == keep:
+            continue
+        try:
+            if old.stat().st_mtime < cutoff:
+                old.unlink()
+        except OSError:
+            continue
+
+
+def css_is_servable(st) -> bool:
+    """
+    Whether the running server can serve the stylesheet as a static asset.
+
+    Streamlit's older (Tornado) static handler sends .css as text/plain
+    with nosniff, which browsers refuse to apply as a stylesheet.
+    """
+    if not st.get_option("server.enableStaticServing"):
+        return False
+    if importlib.util.find_spec("streamlit.web.server.app_static_file_handler") is None:
+        return True
+    from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    return ".css" in SAFE_APP_STATIC_FILE_EXTENSIONS
+
+
+# Built once per process; reruns only pick the tag that references it.
+# The linked file sits next to static/fonts, inline CSS resolves from the page.
+THEME_CSS = minify_css(get_all_css("fonts/"))
+THEME_CSS_INLINE = minify_css(get_all_css("app/static/fonts/"))
+THEME_CSS_HASH = hashlib.blake2b(THEME_CSS.encode("utf-8"), digest_size=8).hexdigest()
+THEME_CSS_FILE = f"theme-{THEME_CSS_HASH}.css"
+THEME_CSS_URL = f"app/static/{THEME_CSS_FILE}"
+
+# Whether this process published THEME_CSS_FILE (None until publish_theme())
+_theme = {"published": None}
+_LOCK = threading.Lock()
+
+
+def publish_theme() -> bool:
+    """
+    Writes the theme stylesheet to static/ and prunes old ones, once per
+    process. Called by app.py at startup rather than on import, so scripts
+    and benchmarks importing the theme never touch the served directory.
+
+    Returns:
+        True if the stylesheet can be linked, False to inline it.
+    """
+    with _LOCK:
+        if _theme["published"] is None:
+            _theme["published"] = publish_css(THEME_CSS, THEME_CSS_FILE)
+            prune_css(THEME_CSS_FILE)
+        return _theme["published"]
+
+
+def get_theme_tag(st):
+    """Returns the <link> (static asset) or inline <style> tag for the theme."""
+    if _theme["published"] and css_is_servable(st):
+        return f'<link rel="stylesheet" href="{THEME_CSS_URL}">'
+    return f"<style>{THEME_CSS_INLINE}</style>"
+
+
 def inject_css(st):
     """Injects all CSS into the Streamlit app."""
-    st.markdown(get_all_css(), unsafe_allow_html=True)
+    st.markdown(get_theme_tag(st), unsafe_allow_html=True)
@@ -0,0 +1,39 @@
+"""
+Buffered HTML output for components.
+Collects a component's HTML fragments and emits them as a single
+st.markdown element instead of one element (and one delta) per row.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator
+
+import streamlit as st
+
+
+@contextmanager
+def html_block(container=None, sep: str = "") -> Iterator[list[str]]:
+    """
+    Collect HTML fragments and flush them as one st.markdown element.
+
+    Nothing is emitted if the block raises, so a failing component never
+    leaves half-open tags on the page.
+
+    Args:
+        container: Where to write (defaults to the current Streamlit container).
+        sep: Joiner between fragments. Use "\n\n" to mix markdown blocks
+            (headings, lists, ---) with single-line HTML blocks.
+
+    Yields:
+        list: Append HTML fragments to it.
+
+    Example:
+        with html_block() as html:
+            html.append("<table>")
+            for row in rows:
+                html.append(f"<tr><td>{row}</td></tr>")
+            html.append("</table>")
+    """
+    parts: list[str] = []
+    yield parts
+    if parts:
+        (container or st).markdown(sep.join(parts), unsafe_allow_html=True)
@@ -0,0 +1,95 @@
+"""
+Memory report: what each session holds versus what the process shares.
+Parsed documents, the saved state and the progress counters live once per
+process; a session should only add its own small state on top.
+"""
+
+import sys
+from collections.abc import Mapping
+from typing import Any, Optional
+
+from src.parsers.cache import export_cached
+from src.utils.progress import get_shared_counters
+from src.utils.state import get_shared_state
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """
+    Approximate the memory held by an object and everything it contains.
+
+    Objects whose id is already in seen are not counted again, so passing
+    the ids of shared structures leaves them out of a session's total.
+
+    Args:
+        obj: The object to measure.
+        seen: ids of objects already counted (updated in place).
+
+    Returns:
+        int: Size in bytes.
+    """
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+
+        if isinstance(item, Mapping):
+            if hasattr(item, "maps"):
+                # ChainMap: count its layers, not a merged copy
+                stack.extend(item.maps)
+            else:
+                stack.extend(item.keys())
+                stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+    return size
+
+
+def get_shared_objects() -> dict[str, Any]:
+    """Get the process-wide structures every session reads."""
+    return {
+        "parse_cache": [entry["value"] for entry in export_cached()],
+        "saved_state": get_shared_state(),
+        "progress": get_shared_counters(),
+    }
+
+
+def get_memory_report(session_state: Mapping) -> dict:
+    """
+    Measure one session's state against the shared structures.
+
+    Args:
+        session_state: The session's state (st.session_state, or its
+            to_dict()).
+
+    Returns:
+        dict with:
+            session: key -> bytes held by the session only
+            session_bytes: total of session
+            shared: structure name -> bytes, held once per process
+            shared_bytes: total of shared
+    """
+    shared_seen = set()
+    shared = {
+        name: deep_sizeof(obj, shared_seen)
+        for name, obj in get_shared_objects().items()
+    }
+
+    session = {}
+    for key, value in session_state.items():
+        # Each key starts from the shared ids only, so keys are measured
+        # independently of each other
+        session[str(key)] = deep_sizeof(value, set(shared_seen))
+
+    return {
+        "session": dict(sorted(session.items(), key=lambda item: -item[1])),
+        "session_bytes": sum(session.values()),
+        "shared": shared,
+        "shared_bytes": sum(shared.values()),
+    }
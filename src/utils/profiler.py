@@ -0,0 +1,187 @@
+"""
+Opt-in render profiler.
+Set EVDLN_PROFILE=1 to time every page, component and parse entry point,
+count st.markdown/st.html calls and the HTML bytes they emit, per rerun,
+and measure the session's memory against the process-wide caches.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional
+
+import streamlit as st
+
+PROFILE_ENABLED = os.environ.get("EVDLN_PROFILE", "") not in ("", "0")
+
+# One JSON line per finished rerun, for offline comparison
+PROFILE_DIR = Path(__file__).parent.parent.parent / ".cache" / "profile"
+PROFILE_LOG = PROFILE_DIR / "reruns.jsonl"
+
+# Elements whose first argument is emitted HTML/markdown
+HTML_ELEMENTS = ("markdown", "html")
+
+# Each Streamlit session runs its script in its own thread
+_local = threading.local()
+_hooks_installed = False
+
+
+def _current_run() -> Optional[dict]:
+    return getattr(_local, "run", None)
+
+
+# =============================================================================
+# INSTRUMENTATION
+# =============================================================================
+
+def profiled(func: Callable) -> Callable:
+    """
+    Decorate a render or parse function so the profiler records it.
+
+    Times are inclusive: a page's time includes the components it renders.
+    When profiling is off the function is returned unchanged.
+    """
+    if not PROFILE_ENABLED:
+        return func
+
+    name = f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        run = _current_run()
+        if run is None:
+            return func(*args, **kwargs)
+
+        bytes_before = run["html_bytes"]
+        elements_before = run["html_elements"]
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            entry = run["functions"].setdefault(
+                name, {"calls": 0, "seconds": 0.0, "html_bytes": 0, "html_elements": 0}
+            )
+            entry["calls"] += 1
+            entry["seconds"] += time.perf_counter() - start
+            entry["html_bytes"] += run["html_bytes"] - bytes_before
+            entry["html_elements"] += run["html_elements"] - elements_before
+
+    return wrapper
+
+
+def _count_html(element: Callable) -> Callable:
+    @functools.wraps(element)
+    def wrapper(body, *args, **kwargs):
+        run = _current_run()
+        if run is not None:
+            run["html_bytes"] += len(str(body).encode("utf-8"))
+            run["html_elements"] += 1
+        return element(body, *args, **kwargs)
+
+    return wrapper
+
+
+def install_html_hooks() -> None:
+    """Wrap st.markdown and st.html once so emitted bytes are counted."""
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    for name in HTML_ELEMENTS:
+        setattr(st, name, _count_html(getattr(st, name)))
+    _hooks_installed = True
+
+
+# =============================================================================
+# RERUN LIFECYCLE
+# =============================================================================
+
+def start_rerun() -> None:
+    """Start recording a rerun (no-op unless profiling is enabled)."""
+    if not PROFILE_ENABLED:
+        return
+    install_html_hooks()
+    _local.run = {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "start": time.perf_counter(),
+        "html_bytes": 0,
+        "html_elements": 0,
+        "functions": {},
+    }
+
+
+def finish_rerun() -> Optional[dict]:
+    """
+    Stop recording the current rerun and append it to the JSON log.
+
+    Returns:
+        The rerun report, or None if profiling is off or no rerun was started.
+    """
+    run = _current_run()
+    if run is None:
+        return None
+    _local.run = None
+
+    report = {
+        "started_at": run["started_at"],
+        "total_seconds": time.perf_counter() - run["start"],
+        "html_bytes": run["html_bytes"],
+        "html_elements": run["html_elements"],
+        "functions": dict(sorted(
+            run["functions"].items(), key=lambda item: item[1]["seconds"], reverse=True
+        )),
+    }
+
+    # Imported here: the memory report reads the parsers, which use profiled()
+    from src.utils.memory import get_memory_report
+    report["memory"] = get_memory_report(st.session_state)
+
+    try:
+        PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(PROFILE_LOG, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report) + "\n")
+    except OSError as e:
+        print(f"Error writing profile log: {e}")
+
+    return report
+
+
+def render_profiler_panel(report: Optional[dict]) -> None:
+    """
+    Render the debug panel for a finished rerun.
+
+    Args:
+        report: Result of finish_rerun(). Nothing is shown if None.
+    """
+    if not report:
+        return
+
+    with st.expander(" Perfil de render"):
+        st.caption(
+            f"{report['total_seconds'] * 1000:.1f} ms · "
+            f"{report['html_elements']} elementos · "
+            f"{report['html_bytes'] / 1024:.1f} KB de HTML · "
+            f"sesión {report['memory']['session_bytes'] / 1024:.1f} KB, "
+            f"compartido {report['memory']['shared_bytes'] / 1024:.1f} KB"
+        )
+        st.dataframe(
+            [
+                {
+                    "funcion": name,
+                    "llamadas": entry["calls"],
+                    "ms": round(entry["seconds"] * 1000, 2),
+                    "elementos": entry["html_elements"],
+                    "bytes": entry["html_bytes"],
+                }
+                for name, entry in report["functions"].items()
+            ],
+        )
+        st.download_button(
+            "Descargar JSON",
+            data=json.dumps(report, indent=2),
+            file_name=f"profile-{report['started_at']}.json",
+            mime="application/json",
+        )
@@ -0,0 +1,212 @@
+"""
+Incremental checklist progress counters.
+Completed counts per week and overall are built once per process for the
+shared saved state and moved by +1/-1 as toggles are saved. Each session
+applies its unsaved toggles on top and moves its own view by one on every
+checkbox, so progress bars and rings read stored numbers instead of
+walking every task.
+"""
+
+from typing import Optional
+
+from src.parsers.checklist_parser import normalize_week
+from src.utils.state import (
+    add_state_listener,
+    get_session_changes,
+    get_shared_state,
+    get_state_generation,
+    shared_state_lock,
+)
+
+# Counters for the shared state: rebuilt when the index changes or the state
+# is replaced, moved by one on every saved toggle (guarded by shared_state_lock)
+_shared = {"progress": None, "generation": None}
+
+
+def build_progress(index: dict, state: dict) -> dict:
+    """
+    Count completed tasks per week for a checklist index.
+
+    Args:
+        index: Task index from the parsed checklist.
+        state: Checkbox state dictionary.
+
+    Returns:
+        dict with keys:
+            index: the index the counters were built from
+            done: task id -> completed
+            weeks: normalize_week() key -> completed count
+            completed: overall completed count
+            total: number of tasks
+    """
+    done = {}
+    weeks = {}
+
+    for week, task_ids in index["by_week"].items():
+        completed = 0
+        for task_id in task_ids:
+            is_done = bool(state.get(task_id, index["by_id"][task_id].get("done", False)))
+            done[task_id] = is_done
+            completed += is_done
+        weeks[week] = completed
+
+    return {
+        "index": index,
+        "done": done,
+        "weeks": weeks,
+        "completed": sum(weeks.values()),
+        "total": len(done),
+    }
+
+
+def move_counters(progress: dict, task_id: str, completed: bool) -> None:
+    """
+    Set one task's value in a counters dict that tracks every task.
+
+    Args:
+        progress: Counters from build_progress() (updated in place).
+        task_id: The task that changed.
+        completed: Its new value.
+    """
+    if task_id not in progress["done"]:
+        return
+
+    completed = bool(completed)
+    delta = int(completed) - int(progress["done"][task_id])
+    if not delta:
+        return
+
+    progress["done"][task_id] = completed
+    task = progress["index"]["by_id"][task_id]
+    progress["weeks"][normalize_week(task.get("week", ""))] += delta
+    progress["completed"] += delta
+
+
+def _on_task_saved(task_id: str, completed: bool) -> None:
+    """State listener: keep the shared counters in step with each save."""
+    progress = _shared["progress"]
+    if progress is not None and _shared["generation"] == get_state_generation():
+        move_counters(progress, task_id, completed)
+
+
+add_state_listener(_on_task_saved)
+
+
+def get_shared_progress(index: dict) -> dict:
+    """
+    Get the counters for the shared saved state, once per process.
+
+    They are rebuilt only when the checklist structure changed (a re-parse
+    produces a new index) or the saved state was replaced (reset, reload,
+    compaction); saved toggles move them by one.
+
+    Args:
+        index: Task index from the parsed checklist.
+
+    Returns:
+        The counters from build_progress(). Shared: only the state listener
+        moves them, so read them under shared_state_lock().
+    """
+    with shared_state_lock():
+        state = get_shared_state()
+        generation = get_state_generation()
+        progress = _shared["progress"]
+        if progress is None or progress["index"] is not index or _shared["generation"] != generation:
+            progress = build_progress(index, state)
+            _shared["progress"] = progress
+            _shared["generation"] = generation
+        return progress
+
+
+def get_shared_counters() -> Optional[dict]:
+    """
+    Get the shared counters last built, without rebuilding them.
+
+    Returns:
+        The counters from get_shared_progress(), or None if none were built.
+    """
+    with shared_state_lock():
+        return _shared["progress"]
+
+
+def get_session_progress(index: dict, state: dict) -> dict:
+    """
+    Get this session's progress: the shared counters adjusted for the
+    toggles the session holds on top of the shared state.
+
+    Args:
+        index: Task index from the parsed checklist.
+        state: Checkbox state of the session (see init_session_state()).
+
+    Returns:
+        dict with index, state, weeks, completed and total. Only the
+        per-week counts are copied; apply_toggle() moves them in place.
+    """
+    with shared_state_lock():
+        shared = get_shared_progress(index)
+        weeks = dict(shared["weeks"])
+        completed = shared["completed"]
+
+        for task_id, value in get_session_changes(state).items():
+            if task_id in shared["done"]:
+                delta = int(bool(value)) - int(shared["done"][task_id])
+                if delta:
+                    weeks[normalize_week(index["by_id"][task_id].get("week", ""))] += delta
+                    completed += delta
+
+    return {
+        "index": index,
+        "state": state,
+        "weeks": weeks,
+        "completed": completed,
+        "total": shared["total"],
+    }
+
+
+def apply_toggle(progress: Optional[dict], task_id: str, completed: bool) -> None:
+    """
+    Move the counters by one for a single checkbox toggle.
+
+    Must run before the new value is written to the session state, which
+    is where the previous value is read from.
+
+    Args:
+        progress: Counters from get_session_progress() (ignored if None).
+        task_id: The task that was toggled.
+        completed: The new checkbox value.
+    """
+    if progress is None or task_id not in progress["index"]["by_id"]:
+        return
+
+    task = progress["index"]["by_id"][task_id]
+    previous = bool(progress["state"].get(task_id, task.get("done", False)))
+    delta = int(bool(completed)) - int(previous)
+    if not delta:
+        return
+
+    progress["weeks"][normalize_week(task.get("week", ""))] += delta
+    progress["completed"] += delta
+
+
+def get_week_progress(progress: dict, week_name: str) -> dict:
+    """
+    Read a week's progress from the counters.
+
+    Args:
+        progress: Counters from get_session_progress().
+        week_name: Full week name or "semana <n>".
+
+    Returns:
+        Dict with total, completed, pending, percentage (same shape as
+        calculate_week_progress()).
+    """
+    week = normalize_week(week_name)
+    total = progress["index"]["week_totals"].get(week, 0)
+    completed = progress["weeks"].get(week, 0)
+
+    return {
+        "total": total,
+        "completed": completed,
+        "pending": total - completed,
+        "percentage": round((completed / total * 100) if total > 0 else 0, 1),
+    }
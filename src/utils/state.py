@@ -1,36 +1,136 @@
 """
 State management for El Vals de la Novia dashboard.
-Handles local persistence with JSON files.
+Handles local persistence with a JSON snapshot plus an append-only journal.
 """
 
 import json
+import os
+import sqlite3
+import threading
+import time
+from collections import ChainMap
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Iterator
 
 # Default state file path
 STATE_FILE = Path(__file__).parent.parent.parent / ".checklist_state.json"
 
+# Append-only journal of task toggles replayed on top of STATE_FILE
+JOURNAL_FILE = STATE_FILE.with_suffix(".journal")
+
+# fsync the journal after this many records or seconds, whichever comes first
+JOURNAL_FSYNC_EVERY = 20
+JOURNAL_FSYNC_INTERVAL = 2.0
+
+# Fold the journal into a new snapshot once it holds this many records
+JOURNAL_COMPACT_EVERY = 500
+
+# Persistence backend: "json" (snapshot + journal) or "sqlite" (WAL database)
+STATE_BACKEND = os.environ.get("EVDLN_STATE_BACKEND", "json").lower()
+
+# SQLite database used when STATE_BACKEND == "sqlite"
+STATE_DB_FILE = STATE_FILE.with_suffix(".db")
+
+# Snapshot key holding the journal epoch: every snapshot write starts a new
+# epoch, and only journal records written in the snapshot's epoch are replayed
+EPOCH_KEY = "_journal_epoch"
+
+_journal = {"records": None, "torn": False, "unsynced": 0, "last_fsync": 0.0, "epoch": 0}
+
+# Process-wide view of the JSON state, refreshed when the files change on disk.
+# generation goes up whenever the whole state is replaced (reset, reload,
+# compaction); single writes are announced to the listeners instead.
+_index = {"state": None, "signature": None, "tracked": 0, "completed": 0, "generation": 0}
+_index_lock = threading.RLock()
+
+# Called as listener(task_id, completed) under the lock after each saved write
+_listeners: list[Callable[[str, bool], None]] = []
+
+# Set once the saved state has been checked for legacy task ids
+_migration = {"done": False}
+
 
 def load_state() -> dict:
     """
-    Load the application state from the JSON file.
+    Load the application state.
+
+    Returns:
+        dict: A copy of the saved state, or empty dict if no state exists.
+    """
+    if STATE_BACKEND == "sqlite":
+        return sqlite_load_state()
+
+    return dict(get_state_index())
+
+
+def read_state_file() -> dict:
+    """
+    Read the snapshot from disk and replay the journal on top of it.
 
     Returns:
         dict: The saved state, or empty dict if no state exists.
     """
+    state = {}
     if STATE_FILE.exists():
         try:
             with open(STATE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+                state = json.load(f)
         except (json.JSONDecodeError, IOError):
-            return {}
-    return {}
+            state = {}
+
+    _journal["epoch"] = state.get(EPOCH_KEY, 0)
+    _journal["records"] = replay_journal(state)
+    return state
+
+
+def replay_journal(state: dict) -> int:
+    """
+    Apply the journal records of the snapshot's epoch to the state in place.
+
+    Records from another epoch belong to a journal the snapshot already
+    replaced (e.g. a crash between the snapshot swap and the journal
+    unlink) and are skipped, so a reset can't be undone by stale toggles.
+    Records without an epoch predate it and count as epoch 0. A torn last
+    line (crash mid-append) is ignored.
+
+    Args:
+        state: State dictionary loaded from the snapshot.
+
+    Returns:
+        int: Number of records found in the journal.
+    """
+    _journal["torn"] = False
+    if not JOURNAL_FILE.exists():
+        return 0
+
+    records = 0
+    try:
+        with open(JOURNAL_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                records += 1
+                _journal["torn"] = not line.endswith("\n")
+                try:
+                    task_id, completed, timestamp, *epoch = json.loads(line)
+                except (json.JSONDecodeError, ValueError, TypeError):
+                    continue
+                if (epoch[0] if epoch else 0) != _journal["epoch"]:
+                    continue
+                state[task_id] = completed
+                state["_last_updated"] = timestamp
+    except IOError:
+        pass
+
+    return records
 
 
 def save_state(state: dict) -> bool:
     """
-    Save the application state to the JSON file.
+    Save the application state as a new snapshot and clear the journal.
+
+    The snapshot is written to a temporary file and swapped in atomically,
+    so a crash mid-write leaves the previous snapshot intact.
 
     Args:
         state: The state dictionary to save.
@@ -38,16 +138,247 @@ def save_state(state: dict) -> bool:
     Returns:
         bool: True if save was successful, False otherwise.
     """
-    try:
-        # Add last updated timestamp
-        state["_last_updated"] = datetime.now().isoformat()
-
-        with open(STATE_FILE, "w", encoding="utf-8") as f:
-            json.dump(state, f, indent=2, ensure_ascii=False)
+    if STATE_BACKEND == "sqlite":
+        if not sqlite_save_state(state):
+            return False
+        rebuild_state_index(dict(state), None)
         return True
+
+    # Under the state lock so no toggle is journaled in the old epoch after
+    # the new snapshot is in place
+    with _index_lock:
+        if _journal["records"] is None:
+            # Learn the current epoch before starting the next one
+            read_state_file()
+
+        try:
+            # Add last updated timestamp
+            state["_last_updated"] = datetime.now().isoformat()
+            epoch = _journal["epoch"] + 1
+            state[EPOCH_KEY] = epoch
+
+            tmp_file = STATE_FILE.with_suffix(".json.tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(state, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, STATE_FILE)
+
+            # From here on the old journal is ignored even if the unlink below
+            # never happens: its records carry the previous epoch.
+            _journal["epoch"] = epoch
+            if JOURNAL_FILE.exists():
+                JOURNAL_FILE.unlink()
+            _journal["records"] = 0
+            _journal["torn"] = False
+            _journal["unsynced"] = 0
+
+            rebuild_state_index(dict(state), state_signature())
+            return True
+        except IOError:
+            return False
+
+
+def append_journal(task_id: str, completed: bool) -> bool:
+    """
+    Append a single task toggle to the journal.
+
+    Writes one compact record regardless of how many tasks are tracked.
+    fsync is batched (see JOURNAL_FSYNC_EVERY / JOURNAL_FSYNC_INTERVAL) and
+    the journal is compacted into a snapshot every JOURNAL_COMPACT_EVERY
+    records.
+
+    Args:
+        task_id: The unique identifier of the task.
+        completed: Whether the task is completed.
+
+    Returns:
+        bool: True if the record was written.
+    """
+    if _journal["records"] is None:
+        read_state_file()
+
+    record = json.dumps(
+        [task_id, completed, datetime.now().isoformat(), _journal["epoch"]],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+    try:
+        with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+            # Start on a fresh line if the last append was cut short
+            f.write(("\n" if _journal["torn"] else "") + record + "\n")
+            _journal["torn"] = False
+            f.flush()
+
+            _journal["unsynced"] += 1
+            now = time.monotonic()
+            if (
+                _journal["unsynced"] >= JOURNAL_FSYNC_EVERY
+                or now - _journal["last_fsync"] >= JOURNAL_FSYNC_INTERVAL
+            ):
+                os.fsync(f.fileno())
+                _journal["unsynced"] = 0
+                _journal["last_fsync"] = now
     except IOError:
         return False
 
+    _journal["records"] += 1
+
+    if _journal["records"] >= JOURNAL_COMPACT_EVERY:
+        compact_journal()
+
+    return True
+
+
+def compact_journal() -> bool:
+    """
+    Fold the journal into a fresh snapshot.
+
+    Returns:
+        bool: True if compaction was successful.
+    """
+    return save_state(read_state_file())
+
+
+def state_signature() -> tuple:
+    """
+    Get the (mtime, size) of the snapshot and journal files.
+
+    Returns:
+        tuple: One (mtime_ns, size) pair per file, None for missing files.
+    """
+    signature = []
+    for path in (STATE_FILE, JOURNAL_FILE):
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def get_state_index() -> dict:
+    """
+    Get the in-memory state, re-reading the files only if they changed.
+
+    The returned dict is shared by the whole process and must not be mutated;
+    use load_state() for a private copy.
+
+    Returns:
+        dict: The current state.
+    """
+    with _index_lock:
+        signature = state_signature()
+        if _index["state"] is None or _index["signature"] != signature:
+            rebuild_state_index(read_state_file(), signature)
+        return _index["state"]
+
+
+def rebuild_state_index(state: dict, signature: tuple) -> None:
+    """
+    Replace the in-memory state and recount its totals.
+
+    Args:
+        state: Full state dictionary.
+        signature: state_signature() of the files the state was read from.
+    """
+    values = [v for k, v in state.items() if not k.startswith("_")]
+
+    with _index_lock:
+        _index["state"] = state
+        _index["signature"] = signature
+        _index["tracked"] = len(values)
+        _index["completed"] = sum(1 for v in values if v)
+        _index["generation"] += 1
+
+
+def update_state_index(task_id: str, completed: bool) -> None:
+    """
+    Apply a single write to the in-memory state without re-reading the files.
+
+    Args:
+        task_id: The unique identifier of the task.
+        completed: Whether the task is completed.
+    """
+    with _index_lock:
+        state = _index["state"]
+        if state is None:
+            return
+
+        previous = state.get(task_id)
+        if previous is None:
+            _index["tracked"] += 1
+        _index["completed"] += int(bool(completed)) - int(bool(previous))
+
+        state[task_id] = completed
+        state["_last_updated"] = datetime.now().isoformat()
+        _index["signature"] = state_signature()
+
+        for listener in _listeners:
+            listener(task_id, completed)
+
+
+def add_state_listener(listener: Callable[[str, bool], None]) -> None:
+    """
+    Register a callback for single task writes to the shared state.
+
+    It runs under shared_state_lock(), after the write, so state derived
+    from it can be moved by one instead of rebuilt. Full replacements of
+    the state change get_state_generation() instead.
+
+    Args:
+        listener: Called as listener(task_id, completed).
+    """
+    with _index_lock:
+        if listener not in _listeners:
+            _listeners.append(listener)
+
+
+def shared_state_lock() -> threading.RLock:
+    """
+    Get the lock guarding the shared state.
+
+    Hold it to read the state and build something from it without a write
+    landing halfway through.
+    """
+    return _index_lock
+
+
+def get_shared_state(reload: bool = False) -> dict:
+    """
+    Get the process-wide saved state that every session reads through.
+
+    With the JSON backend this is the in-memory index. With SQLite the
+    table is loaded once and kept current by this process's writes;
+    reload=True re-reads it (e.g. for a new session, to pick up writes
+    from other processes).
+
+    Args:
+        reload: Re-read the SQLite table.
+
+    Returns:
+        dict: The shared state. It must not be mutated; use set_task_state().
+    """
+    if STATE_BACKEND != "sqlite":
+        return get_state_index()
+
+    with _index_lock:
+        if reload or _index["state"] is None:
+            rebuild_state_index(sqlite_load_state(), None)
+        return _index["state"]
+
+
+def get_state_generation() -> int:
+    """
+    Get a counter that changes whenever the shared state is replaced.
+
+    Returns:
+        int: The current generation.
+    """
+    with _index_lock:
+        return _index["generation"]
+
 
 def get_task_state(task_id: str, default: bool = False) -> bool:
     """
@@ -60,8 +391,10 @@ def get_task_state(task_id: str, default: bool = False) -> bool:
     Returns:
         bool: Whether the task is completed.
     """
-    state = load_state()
-    return state.get(task_id, default)
+    if STATE_BACKEND == "sqlite":
+        return sqlite_get_task_state(task_id, default)
+
+    return get_state_index().get(task_id, default)
 
 
 def set_task_state(task_id: str, completed: bool) -> bool:
@@ -75,9 +408,18 @@ def set_task_state(task_id: str, completed: bool) -> bool:
     Returns:
         bool: True if save was successful.
     """
-    state = load_state()
-    state[task_id] = completed
-    return save_state(state)
+    if STATE_BACKEND == "sqlite":
+        if not sqlite_set_task_state(task_id, completed):
+            return False
+        update_state_index(task_id, completed)
+        return True
+
+    with _index_lock:
+        get_state_index()
+        if not append_journal(task_id, completed):
+            return False
+        update_state_index(task_id, completed)
+    return True
 
 
 def get_completed_count(task_ids: list[str]) -> int:
@@ -90,7 +432,10 @@ def get_completed_count(task_ids: list[str]) -> int:
     Returns:
         int: Number of completed tasks.
     """
-    state = load_state()
+    if STATE_BACKEND == "sqlite":
+        return sqlite_get_completed_count(task_ids)
+
+    state = get_state_index()
     return sum(1 for tid in task_ids if state.get(tid, False))
 
 
@@ -111,35 +456,137 @@ def get_stats() -> dict:
     Returns:
         dict: Statistics including total tasks, completed count, etc.
     """
-    state = load_state()
+    if STATE_BACKEND == "sqlite":
+        return sqlite_get_stats()
 
-    # Filter out metadata keys
-    task_keys = [k for k in state.keys() if not k.startswith("_")]
-    completed = sum(1 for k in task_keys if state.get(k, False))
+    with _index_lock:
+        state = get_state_index()
+        tracked = _index["tracked"]
+        completed = _index["completed"]
 
     return {
-        "total_tracked": len(task_keys),
+        "total_tracked": tracked,
         "completed": completed,
-        "pending": len(task_keys) - completed,
-        "completion_rate": (completed / len(task_keys) * 100) if task_keys else 0,
+        "pending": tracked - completed,
+        "completion_rate": (completed / tracked * 100) if tracked else 0,
         "last_updated": state.get("_last_updated"),
     }
 
 
-def init_session_state(st) -> dict:
+def migrate_task_ids(id_map: dict[str, str]) -> int:
+    """
+    Rename saved task ids once per process (e.g. positional task_0, task_1...
+    to content-derived ids), for whichever backend is active.
+
+    Args:
+        id_map: Old id -> new id.
+
+    Returns:
+        int: Number of saved tasks that were renamed.
+    """
+    with _index_lock:
+        if _migration["done"]:
+            return 0
+
+        state = load_state()
+        legacy_ids = [task_id for task_id in state if task_id in id_map]
+
+        if legacy_ids:
+            for task_id in legacy_ids:
+                completed = state.pop(task_id)
+                state.setdefault(id_map[task_id], completed)
+            if not save_state(state):
+                return 0
+
+        _migration["done"] = True
+        return len(legacy_ids)
+
+
+def init_session_state(st) -> ChainMap:
     """
-    Initialize Streamlit session state with saved data.
+    Initialize this session's view of the checkbox state.
+
+    The session only stores its own toggles; reads fall through to the
+    shared process-wide state, so memory per session stays at the size of
+    what the user clicked rather than the whole saved state.
 
     Args:
         st: Streamlit module.
 
     Returns:
-        dict: The current state.
+        ChainMap: Session toggles layered over the shared state. Writes go
+        to the session layer.
     """
-    if "checkbox_state" not in st.session_state:
-        st.session_state.checkbox_state = load_state()
+    overlay = st.session_state.get("checkbox_state")
+    if not isinstance(overlay, ChainMap):
+        overlay = ChainMap({}, get_shared_state(reload=True))
+        st.session_state.checkbox_state = overlay
+    else:
+        # The shared dict is replaced when the files change on disk
+        overlay.maps[1] = get_shared_state()
 
-    return st.session_state.checkbox_state
+    return overlay
+
+
+def get_session_changes(state: dict) -> dict:
+    """
+    Get the toggles a session made on top of the shared state.
+
+    Args:
+        state: Result of init_session_state(), or a plain state dict.
+
+    Returns:
+        dict: The session layer (a plain dict is returned as is).
+    """
+    return state.maps[0] if isinstance(state, ChainMap) else state
+
+
+def set_session_task_state(state: dict, task_id: str, completed: bool) -> bool:
+    """
+    Record a checkbox toggle for a session and save it.
+
+    Once saved, the shared state holds the value and the session layer
+    drops it again; it is only kept if saving failed, so the session still
+    sees its own click. Toggles arrive through fragment reruns, which skip
+    init_session_state(), so the shared layer is re-pointed here too in
+    case a compaction or a change on disk replaced it.
+
+    Args:
+        state: Result of init_session_state(), or a plain state dict.
+        task_id: The unique identifier of the task.
+        completed: Whether the task is completed.
+
+    Returns:
+        bool: True if save was successful.
+    """
+    state[task_id] = completed
+    saved = set_task_state(task_id, completed)
+    if isinstance(state, ChainMap):
+        state.maps[1] = get_shared_state()
+        if saved:
+            state.maps[0].pop(task_id, None)
+    return saved
+
+
+def reset_session_state(st, task_ids) -> bool:
+    """
+    Clear all saved progress along with this session's copy of it.
+
+    Besides the checkbox state, each checkbox widget keeps its own value
+    under its task id; those are dropped too, or the boxes would stay
+    ticked after the reset.
+
+    Args:
+        st: Streamlit module.
+        task_ids: Ids of every checklist task.
+
+    Returns:
+        bool: True if save was successful.
+    """
+    for task_id in task_ids:
+        st.session_state.pop(task_id, None)
+    st.session_state.pop("checkbox_state", None)
+    return save_state({})
 
 
 def sync_state(st) -> None:
@@ -150,4 +597,205 @@ def sync_state(st) -> None:
         st: Streamlit module.
     """
     if "checkbox_state" in st.session_state:
-        save_state(st.session_state.checkbox_state)
+        save_state(dict(st.session_state.checkbox_state))
+
+
+# =============================================================================
+# SQLITE BACKEND
+# =============================================================================
+
+# One connection for the whole process. Streamlit runs every rerun in a new
+# thread, so per-thread connections would be reopened (and the schema pragmas
+# re-run) on each rerun; the lock serializes use of the shared connection.
+_sqlite = {"conn": None, "path": None}
+_sqlite_lock = threading.RLock()
+
+# Maximum number of task IDs per IN (...) query
+SQLITE_BATCH_SIZE = 500
+
+
+@contextmanager
+def sqlite_connection() -> Iterator[sqlite3.Connection]:
+    """
+    Use the process's connection to the state database, opening it if needed.
+
+    The connection is held under a lock for the duration of the with block,
+    so statements (and transactions) from different reruns don't interleave.
+    The database runs in WAL mode so other processes' readers never block
+    the writer. On first creation it is seeded from the existing JSON state.
+
+    Yields:
+        sqlite3.Connection: Open connection in autocommit mode.
+    """
+    with _sqlite_lock:
+        if _sqlite["conn"] is None or _sqlite["path"] != STATE_DB_FILE:
+            _sqlite_open()
+        yield _sqlite["conn"]
+
+
+def _sqlite_open() -> None:
+    """Open the database and create the schema (call under _sqlite_lock)."""
+    is_new = not STATE_DB_FILE.exists()
+
+    conn = sqlite3.connect(
+        STATE_DB_FILE, timeout=10, isolation_level=None, check_same_thread=False
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS task_state ("
+        "task_id TEXT PRIMARY KEY, "
+        "completed INTEGER NOT NULL, "
+        "updated_at TEXT NOT NULL)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_task_state_updated_at "
+        "ON task_state (updated_at)"
+    )
+    _sqlite["conn"] = conn
+    _sqlite["path"] = STATE_DB_FILE
+
+    if is_new:
+        # Carry over progress saved by the JSON backend (snapshot plus the
+        # journal records of its epoch)
+        legacy_state = read_state_file()
+        if legacy_state:
+            sqlite_save_state(legacy_state)
+
+
+def sqlite_load_state() -> dict:
+    """
+    Load every tracked task from the database.
+
+    Returns:
+        dict: The saved state, or empty dict if no state exists.
+    """
+    with sqlite_connection() as conn:
+        rows = conn.execute(
+            "SELECT task_id, completed, updated_at FROM task_state ORDER BY updated_at"
+        ).fetchall()
+
+    state = {task_id: bool(completed) for task_id, completed, _ in rows}
+    if rows:
+        state["_last_updated"] = rows[-1][2]
+    return state
+
+
+def sqlite_save_state(state: dict) -> bool:
+    """
+    Replace the whole stored state in a single transaction.
+
+    Args:
+        state: The state dictionary to save.
+
+    Returns:
+        bool: True if save was successful, False otherwise.
+    """
+    state["_last_updated"] = datetime.now().isoformat()
+    rows = [
+        (task_id, int(bool(completed)), state["_last_updated"])
+        for task_id, completed in state.items()
+        if not task_id.startswith("_")
+    ]
+
+    with sqlite_connection() as conn:
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM task_state")
+            conn.executemany(
+                "INSERT INTO task_state (task_id, completed, updated_at) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+            return True
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            return False
+
+
+def sqlite_get_task_state(task_id: str, default: bool = False) -> bool:
+    """
+    Get the completion state of a single task row.
+
+    Args:
+        task_id: The unique identifier of the task.
+        default: Default value if task not found.
+
+    Returns:
+        bool: Whether the task is completed.
+    """
+    with sqlite_connection() as conn:
+        row = conn.execute(
+            "SELECT completed FROM task_state WHERE task_id = ?", (task_id,)
+        ).fetchone()
+    return bool(row[0]) if row else default
+
+
+def sqlite_set_task_state(task_id: str, completed: bool) -> bool:
+    """
+    Upsert a single task row.
+
+    Args:
+        task_id: The unique identifier of the task.
+        completed: Whether the task is completed.
+
+    Returns:
+        bool: True if save was successful.
+    """
+    try:
+        with sqlite_connection() as conn:
+            conn.execute(
+                "INSERT INTO task_state (task_id, completed, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (task_id) DO UPDATE SET "
+                "completed = excluded.completed, updated_at = excluded.updated_at",
+                (task_id, int(bool(completed)), datetime.now().isoformat()),
+            )
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def sqlite_get_completed_count(task_ids: list[str]) -> int:
+    """
+    Count completed tasks among the given IDs.
+
+    Args:
+        task_ids: List of task IDs to check.
+
+    Returns:
+        int: Number of completed tasks.
+    """
+    completed = 0
+
+    with sqlite_connection() as conn:
+        for start in range(0, len(task_ids), SQLITE_BATCH_SIZE):
+            batch = task_ids[start:start + SQLITE_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            completed += conn.execute(
+                f"SELECT COUNT(*) FROM task_state WHERE completed = 1 AND task_id IN ({placeholders})",
+                batch,
+            ).fetchone()[0]
+
+    return completed
+
+
+def sqlite_get_stats() -> dict:
+    """
+    Get statistics about the stored state with a single aggregate query.
+
+    Returns:
+        dict: Statistics including total tasks, completed count, etc.
+    """
+    with sqlite_connection() as conn:
+        total, completed, last_updated = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(completed), 0), MAX(updated_at) FROM task_state"
+        ).fetchone()
+
+    return {
+        "total_tracked": total,
+        "completed": completed,
+        "pending": total - completed,
+        "completion_rate": (completed / total * 100) if total else 0,
+        "last_updated": last_updated,
+    }